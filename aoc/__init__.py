@@ -0,0 +1,10 @@
+"""Repo-level tooling shared by every aocYYYY folder (runner, benchmarks, ...).
+
+Usage:
+  - python -m aoc run                 # every solver of every year
+  - python -m aoc run 2022            # one year
+  - python -m aoc run 2022 15 2t      # one part of one day
+  - python -m aoc bench 2022 --save   # benchmark, store as the new baseline
+  - python -m aoc bench 2022          # benchmark, fail on regressions
+  - python -m aoc clear-cache         # drop the parsed inputs cached by aoc.cache
+"""
@@ -0,0 +1,92 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from aoc import bench, cache, runner, timing
+from aoc.solvers import MODES, ROOT, discover
+
+
+def add_selection(command: argparse.ArgumentParser, parts_help: str) -> None:
+    command.add_argument("year", nargs="?", type=int, help="default: every year")
+    command.add_argument("day", nargs="?", type=int, help="default: every day")
+    command.add_argument("part", nargs="?", choices=MODES, help=parts_help)
+    command.add_argument("-j", "--jobs", type=int, help="workers (default: cpu count)")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run solvers on a process pool")
+    add_selection(run, "default: 1 and 2")
+    run.add_argument(
+        "-v", "--verbose", action="store_true", help="show the solvers output"
+    )
+    run.add_argument(
+        "--memory", action="store_true", help="trace the peak memory (tracemalloc)"
+    )
+    run.add_argument(
+        "--profile", action="store_true", help="print a cProfile report per part"
+    )
+    run.add_argument(
+        "--export", type=Path, help="write every timing to a .json or .csv file"
+    )
+
+    bench_ = commands.add_parser("bench", help="benchmark solvers against a baseline")
+    add_selection(bench_, "default: 1, 1t, 2 and 2t")
+    bench_.add_argument("-n", "--repeat", type=int, default=5, help="runs per part")
+    bench_.add_argument("--baseline", type=Path, default=bench.DEFAULT_BASELINE)
+    bench_.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown tolerated before failing (default: 0.2)",
+    )
+    bench_.add_argument(
+        "--save", action="store_true", help="store the results as the new baseline"
+    )
+
+    commands.add_parser("clear-cache", help="remove every cached parsed input")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.command == "clear-cache":
+        print(f"{cache.clear(ROOT)} cached parsed inputs removed")
+        return 0
+    solvers = discover(args.year, args.day)
+    if args.command == "run":
+        modes = (args.part,) if args.part else ("1", "2")
+        start = time.perf_counter()
+        results = runner.run(
+            solvers, modes, args.jobs, args.verbose, args.memory, args.profile
+        )
+        print(runner.format_table(results, time.perf_counter() - start))
+        timings = [t for r in results for t in r.timings]
+        if args.profile:
+            for t in timings:
+                if t.profile:
+                    print(f"\n### {t.name}\n{t.profile}")
+        if args.export:
+            timing.export(args.export, timings)
+        return int(any(r.error for r in results))
+    if args.command == "bench":
+        modes = (args.part,) if args.part else ("1", "1t", "2", "2t")
+        stats = bench.bench(solvers, modes, args.repeat, args.jobs)
+        baseline = bench.load_baseline(args.baseline)
+        print(bench.format_table(stats, baseline))
+        if args.save:
+            bench.save_baseline(stats, args.baseline)
+            print(f"baseline saved to {args.baseline}")
+            return 0
+        found = bench.regressions(stats, baseline, args.threshold)
+        for regression in found:
+            print(f"REGRESSION {regression}")
+        return int(bool(found))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,93 @@
+"""Bounded 2D cellular automata stepped with NumPy, one whole grid at a time.
+
+A rule maps (cells, neighbour counts) to the next cells, the counts being
+computed by shifted-array adds rather than by visiting neighbours cell by
+cell in Python:
+
+    >>> blinker = np.zeros((3, 3), dtype=bool)
+    >>> blinker[1, :] = True
+    >>> life = lambda cells, n: (n == 3) | (cells & (n == 2))
+    >>> step(blinker, life).astype(int)
+    array([[0, 1, 0],
+           [0, 1, 0],
+           [0, 1, 0]])
+    >>> cells, generations = run(blinker, life, steps=2)
+    >>> bool((cells == blinker).all()), generations
+    (True, 2)
+
+Cells outside the grid never count as neighbours. Neighbourhoods that are
+not made of fixed offsets (e.g. "first seat visible in each direction")
+can be precomputed once as an index table and counted with gathered_sum().
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+
+# (dy, dx) offsets, in row / column order of the arrays
+MOORE = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+VON_NEUMANN = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+Rule = Callable[[np.ndarray, np.ndarray], np.ndarray]
+Counter = Callable[[np.ndarray], np.ndarray]
+
+
+def neighbour_sum(
+    cells: np.ndarray, offsets: tuple[tuple[int, int], ...] = MOORE
+) -> np.ndarray:
+    """Sum of the values of the neighbours of every cell.
+
+    >>> neighbour_sum(np.ones((2, 3), dtype=bool))
+    array([[3, 5, 3],
+           [3, 5, 3]], dtype=int32)
+    >>> neighbour_sum(np.ones((2, 3), dtype=bool), VON_NEUMANN)
+    array([[2, 3, 2],
+           [2, 3, 2]], dtype=int32)
+    """
+    height, width = cells.shape
+    reach = max(max(abs(dy), abs(dx)) for dy, dx in offsets)
+    padded = np.zeros((height + 2 * reach, width + 2 * reach), dtype=np.int32)
+    padded[reach:-reach, reach:-reach] = cells
+    total = np.zeros((height, width), dtype=np.int32)
+    for dy, dx in offsets:
+        total += padded[
+            reach + dy : reach + dy + height, reach + dx : reach + dx + width
+        ]
+    return total
+
+
+def gathered_sum(cells: np.ndarray, table: np.ndarray) -> np.ndarray:
+    """Sum of the values of arbitrary neighbours of every cell.
+
+    table[k, i] is the flat index of the k-th neighbour of the cell of flat
+    index i, or cells.size when that cell has no k-th neighbour.
+    """
+    flat = np.append(cells.ravel().astype(np.int32), 0)
+    return flat[table].sum(axis=0, dtype=np.int32).reshape(cells.shape)
+
+
+def step(
+    cells: np.ndarray, rule: Rule, neighbours: Counter = neighbour_sum
+) -> np.ndarray:
+    return rule(cells, neighbours(cells))
+
+
+def run(
+    cells: np.ndarray,
+    rule: Rule,
+    neighbours: Counter = neighbour_sum,
+    steps: int | None = None,
+) -> tuple[np.ndarray, int]:
+    """Steps `steps` times, or until a fixpoint when steps is None.
+
+    Returns the last cells and the number of generations computed (for a
+    fixpoint, the last one is the first that did not change anything).
+    """
+    generations = 0
+    while steps is None or generations < steps:
+        new_cells = step(cells, rule, neighbours)
+        generations += 1
+        if steps is None and np.array_equal(new_cells, cells):
+            break
+        cells = new_cells
+    return cells, generations
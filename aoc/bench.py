@@ -0,0 +1,174 @@
+"""Benchmarks of the solve1 / solve2 functions, with a stored baseline.
+
+Every (solver, mode) is run `repeat` times, each time on a freshly imported
+module so that module level caches (lru_cache, globals) don't flatter the
+numbers, then once more under tracemalloc to get its peak allocation.
+Results are compared to a JSON baseline and any part slower / hungrier than
+the baseline by more than `threshold` is reported as a regression.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from aoc.runner import fan_out, quiet
+from aoc.solvers import ROOT, Solver, call, load
+from aoc.timing import timed
+
+BASELINE_VERSION = 1
+DEFAULT_BASELINE = ROOT / "benchmarks.json"
+# below those, differences are noise rather than regressions
+NOISE_FLOOR_SECONDS = 0.002
+NOISE_FLOOR_BYTES = 256 * 1024
+
+
+@dataclass
+class Stats:
+    key: str
+    runs: int = 0
+    min: float = 0.0  # seconds
+    median: float = 0.0
+    p95: float = 0.0
+    peak_alloc: int = 0  # bytes, tracemalloc peak
+    error: str | None = None
+
+
+def key(solver: Solver, mode: str) -> str:
+    return f"{solver.year}/{solver.day:02d}/{mode}"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile, meaningful even on a handful of runs.
+
+    >>> percentile([3.0, 1.0, 2.0, 4.0], 95)
+    4.0
+    >>> percentile([3.0, 1.0, 2.0, 4.0], 50)
+    2.0
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def bench_one(solver: Solver, mode: str, repeat: int) -> Stats:
+    """Benchmarks one part, in the current process."""
+    stats = Stats(key(solver, mode))
+    timings = []
+    with quiet():
+        try:
+            for _ in range(repeat):
+                module = load(solver)
+                with timed(stats.key, memory=False, profile=False) as t:
+                    call(solver, mode, module)
+                timings.append(t.wall)
+            module = load(solver)
+            with timed(stats.key, memory=True, profile=False) as t:
+                call(solver, mode, module)
+            stats.peak_alloc = t.peak_alloc
+        except (Exception, SystemExit) as e:
+            stats.error = f"{type(e).__name__}: {e}"
+            return stats
+    stats.runs = len(timings)
+    stats.min = min(timings)
+    stats.median = statistics.median(timings)
+    stats.p95 = percentile(timings, 95)
+    return stats
+
+
+def bench(
+    solvers: list[Solver],
+    modes: tuple[str, ...] = ("1", "1t", "2", "2t"),
+    repeat: int = 5,
+    workers: int | None = None,
+) -> list[Stats]:
+    tasks = [(s, m, repeat) for s in solvers for m in modes if m in s.calls]
+    return sorted(fan_out(bench_one, tasks, workers), key=lambda s: s.key)
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE) -> dict[str, dict]:
+    """Baseline results by key, empty when there is no usable baseline."""
+    if not path.exists():
+        return {}
+    baseline = json.loads(path.read_text())
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(
+            f"{path} has version {baseline.get('version')}, expected {BASELINE_VERSION}"
+        )
+    return baseline["results"]
+
+
+def save_baseline(stats: list[Stats], path: Path = DEFAULT_BASELINE) -> None:
+    """Merges the new results into the baseline (other parts are kept)."""
+    results = load_baseline(path)
+    results.update({s.key: asdict(s) for s in stats if s.error is None})
+    baseline = {
+        "version": BASELINE_VERSION,
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": dict(sorted(results.items())),
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def regressions(
+    stats: list[Stats], baseline: dict[str, dict], threshold: float = 0.2
+) -> list[str]:
+    """Human readable descriptions of every part regressing past the threshold."""
+    found = []
+    for s in stats:
+        ref = baseline.get(s.key)
+        if ref is None or s.error is not None:
+            continue
+        if (
+            s.median > ref["median"] * (1 + threshold)
+            and s.median - ref["median"] > NOISE_FLOOR_SECONDS
+        ):
+            found.append(
+                f"{s.key}: median {ref['median'] * 1000:.1f}ms -> {s.median * 1000:.1f}ms"
+            )
+        if (
+            s.peak_alloc > ref["peak_alloc"] * (1 + threshold)
+            and s.peak_alloc - ref["peak_alloc"] > NOISE_FLOOR_BYTES
+        ):
+            found.append(
+                f"{s.key}: peak alloc {ref['peak_alloc'] // 1024}KiB -> {s.peak_alloc // 1024}KiB"
+            )
+    return found
+
+
+def format_table(stats: list[Stats], baseline: dict[str, dict]) -> str:
+    lines = [
+        f"{'part':<12} {'min ms':>10} {'median ms':>10} {'p95 ms':>10} {'peak KiB':>10} {'vs base':>8}"
+    ]
+    for s in stats:
+        if s.error is not None:
+            lines.append(f"{s.key:<12} !! {s.error}")
+            continue
+        ref = baseline.get(s.key)
+        delta = (
+            f"{(s.median / ref['median'] - 1) * 100:+.0f}%"
+            if ref and ref["median"]
+            else "new"
+        )
+        lines.append(
+            f"{s.key:<12} {s.min * 1000:>10.2f} {s.median * 1000:>10.2f} "
+            f"{s.p95 * 1000:>10.2f} {s.peak_alloc // 1024:>10} {delta:>8}"
+        )
+    return "\n".join(lines)
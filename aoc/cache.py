@@ -0,0 +1,126 @@
+"""Content-addressed cache of parsed puzzle inputs.
+
+    @cached_parser
+    def parser(data):
+        ...
+
+The parsed structure is pickled in `input_files/.cache/` next to the module
+defining the parser, under a key made of:
+  - the sha256 of the raw input (and of any extra parser argument),
+  - the parser identity: qualified name + sha256 of its module source.
+Editing the input or the day module yields a new key, and the entries of an
+outdated module source are removed when the new one is written.
+
+Hits are kept in memory as pickled bytes too, so that solve1 -> solve2 in
+the same process skip both parsing and disk access, while each caller still
+gets its own copy to mutate. Set AOC_CACHE=0 to bypass the cache.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from pathlib import Path
+
+CACHE_DIRNAME = os.path.join("input_files", ".cache")
+_memory: dict[Path, bytes] = {}
+
+
+def enabled() -> bool:
+    return os.environ.get("AOC_CACHE", "1") != "0"
+
+
+def _canonical(value: object) -> bytes:
+    """Bytes identifying value by its content, for the types puzzle parsers
+    get (text, numbers and containers of those).
+
+    Raises TypeError for anything else: their repr may hold an object id
+    (file handles, StringIO...), which would never hit the cache.
+    """
+    if value is None or isinstance(value, bool | int | float):
+        return repr(value).encode()
+    if isinstance(value, str):
+        return b"s%d:" % len(value.encode()) + value.encode()
+    if isinstance(value, bytes):
+        return b"b%d:" % len(value) + value
+    if isinstance(value, list | tuple):
+        return b"(" + b",".join(_canonical(v) for v in value) + b")"
+    raise TypeError(f"cannot cache a parser argument of type {type(value).__name__}")
+
+
+def _digest(value: object) -> str:
+    if isinstance(value, str):
+        raw = value.encode()
+    elif isinstance(value, bytes):
+        raw = value
+    elif isinstance(value, list | tuple) and all(isinstance(v, str) for v in value):
+        # readlines() inputs
+        raw = "\0".join(value).encode()
+    else:
+        raw = _canonical(value)
+    return hashlib.sha256(raw).hexdigest()
+
+
+def parser_identity(func: Callable) -> tuple[str, str]:
+    """(name, source hash) of a parser: its module source as a whole is hashed,
+    so that editing a helper called by the parser invalidates the cache too."""
+    path = Path(func.__code__.co_filename)
+    name = f"{path.stem}.{func.__qualname__}".replace("<", "").replace(">", "")
+    try:
+        source = path.read_bytes()
+    except OSError:
+        source = func.__code__.co_code
+    return name, hashlib.sha256(source).hexdigest()[:16]
+
+
+def cached_parser(func: Callable) -> Callable:
+    """Decorator persisting the result of a parser of puzzle inputs."""
+    cache_dir = Path(func.__code__.co_filename).resolve().parent / CACHE_DIRNAME
+    name, source_hash = parser_identity(func)
+
+    @functools.wraps(func)
+    def wrap_func(*args: object, **kwargs: object) -> object:
+        if not enabled():
+            return func(*args, **kwargs)
+        try:
+            input_hash = _digest((args, sorted(kwargs.items())) if kwargs else args)
+        except TypeError:
+            # no stable key for these arguments: parse without caching
+            return func(*args, **kwargs)
+        path = cache_dir / f"{name}.{source_hash}.{input_hash[:24]}.pickle"
+
+        if path in _memory:
+            return pickle.loads(_memory[path])
+        try:
+            raw = path.read_bytes()
+            _memory[path] = raw
+            return pickle.loads(raw)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        result = func(*args, **kwargs)
+        raw = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        _memory[path] = raw
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in cache_dir.glob(f"{name}.*.pickle"):
+                if not stale.name.startswith(f"{name}.{source_hash}."):
+                    stale.unlink(missing_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(raw)
+            tmp.replace(path)  # atomic: parallel workers may race on the same key
+        except OSError:
+            pass
+        return result
+
+    return wrap_func
+
+
+def clear(root: Path) -> int:
+    """Removes every cached parse below root, returns the number of files removed."""
+    removed = 0
+    for path in root.glob(f"*/{CACHE_DIRNAME}/*.pickle"):
+        path.unlink()
+        removed += 1
+    return removed
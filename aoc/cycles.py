@@ -0,0 +1,146 @@
+"""Cycle detection for simulations that end up looping, and fast-forwarding.
+
+A simulation is a step function state -> next state. As soon as a state
+comes back, the states x0, x1, x2... are periodic: `start` steps lead into a
+loop of `length` states (mu and lambda in the literature).
+
+    >>> step = lambda x: (x * x + 1) % 255
+    >>> cycle = find(step, 3)
+    >>> cycle
+    Cycle(start=2, length=6)
+    >>> brent(step, 3) == floyd(step, 3) == cycle
+    True
+    >>> nth(step, 3, 10**12, cycle)
+    5
+
+brent() and floyd() use O(1) memory but run the simulation several times
+from x0, so step must be a pure function of the state. find() runs it once
+and remembers every state key it saw, so step may also update outer state
+(e.g. record the tower height after each rock) and fast_forward() can then
+extrapolate those records to any step.
+
+`key` extracts from a state what determines the next ones (a jet index and
+the top rows of a tower, rather than the whole tower); by default the state
+is its own key.
+"""
+
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+State = TypeVar("State")
+
+
+def _identity(state: State) -> State:
+    return state
+
+
+@dataclass(frozen=True)
+class Cycle:
+    start: int  # steps before entering the cycle
+    length: int
+
+    def index(self, n: int) -> int:
+        """Step before start + length reaching the same state as step n.
+
+        >>> Cycle(start=2, length=6).index(11)
+        5
+        """
+        if n < self.start + self.length:
+            return n
+        return self.start + (n - self.start) % self.length
+
+    def fast_forward(self, n: int, values: Sequence[int]) -> int:
+        """Value at step n of a quantity that grows by the same amount at each
+        turn of the cycle (height, score...), values[i] being its value at
+        step i for at least every i <= start + length.
+
+        >>> Cycle(start=1, length=2).fast_forward(10, [0, 5, 7, 10])
+        27
+        """
+        if n < len(values):
+            return values[n]
+        turns, rest = divmod(n - self.start, self.length)
+        gain = values[self.start + self.length] - values[self.start]
+        return values[self.start + rest] + turns * gain
+
+
+def find(
+    step: Callable[[State], State],
+    x0: State,
+    key: Callable[[State], Hashable] = _identity,
+) -> Cycle:
+    """Hash table detection: runs step once per state until a key repeats."""
+    seen = {key(x0): 0}
+    x, n = x0, 0
+    while True:
+        x = step(x)
+        n += 1
+        k = key(x)
+        if k in seen:
+            return Cycle(seen[k], n - seen[k])
+        seen[k] = n
+
+
+def floyd(
+    step: Callable[[State], State],
+    x0: State,
+    key: Callable[[State], Hashable] = _identity,
+) -> Cycle:
+    """Tortoise and hare detection, in O(1) memory."""
+    tortoise, hare = step(x0), step(step(x0))
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(step(hare))
+
+    start, tortoise = 0, x0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+
+    length, hare = 1, step(tortoise)
+    while key(tortoise) != key(hare):
+        hare = step(hare)
+        length += 1
+    return Cycle(start, length)
+
+
+def brent(
+    step: Callable[[State], State],
+    x0: State,
+    key: Callable[[State], Hashable] = _identity,
+) -> Cycle:
+    """Brent's detection, in O(1) memory and fewer steps than floyd()."""
+    power = length = 1
+    tortoise, hare = x0, step(x0)
+    while key(tortoise) != key(hare):
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+
+    tortoise = hare = x0
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def nth(
+    step: Callable[[State], State],
+    x0: State,
+    n: int,
+    cycle: Cycle | None = None,
+    key: Callable[[State], Hashable] = _identity,
+) -> State:
+    """State after n steps, going around the cycle (found with brent() when
+    not given) at most once."""
+    cycle = brent(step, x0, key) if cycle is None else cycle
+    x = x0
+    for _ in range(cycle.index(n)):
+        x = step(x)
+    return x
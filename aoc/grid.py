@@ -0,0 +1,193 @@
+"""Dense 2D grid backed by a flat bytearray.
+
+Maps stored as dict[(x, y)] -> str cost a tuple and a dict entry per cell,
+and every neighbour lookup hashes fresh tuples. A Grid stores one byte per
+cell, row after row, surrounded by a 1 cell border holding `Grid.OUTSIDE`:
+cells are addressed by a flat index `i`, neighbours are `i + offset` with
+offsets computed once per grid, and no bounds check is ever needed as long
+as OUTSIDE is never used as a cell value.
+
+    >>> g = Grid.from_text("#.\\n.#")
+    >>> g.width, g.height
+    (2, 2)
+    >>> g[1, 1], g[0, 1]
+    ('#', '.')
+    >>> sorted(g.to_set("#"))
+    [(0, 0), (1, 1)]
+    >>> [g.xy(j) for j in g.neighbors8(g.index(0, 0)) if g.data[j] == ord("#")]
+    [(1, 1)]
+    >>> bytes(g.row(1)), bytes(g.column(1))
+    (b'.#', b'.#')
+"""
+
+from collections.abc import Iterable, Iterator
+
+Point = tuple[int, int]
+
+
+class Grid:
+    OUTSIDE = 0xFF
+    # coordinates of the top left cell in the dict / set the grid was built from
+    origin: Point = (0, 0)
+
+    def __init__(self, width: int, height: int, fill: str | int = ".") -> None:
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.data = bytearray([self.OUTSIDE]) * (self.stride * (height + 2))
+        fill = _byte(fill)
+        for y in range(height):
+            start = self.index(0, y)
+            self.data[start : start + width] = bytes([fill]) * width
+
+        s = self.stride
+        # up, right, down, left (y grows downwards, as in the puzzle texts)
+        self.offsets4 = (-s, 1, s, -1)
+        self.offsets8 = (-s - 1, -s, -s + 1, 1, s + 1, s, s - 1, -1)
+
+    # --- conversions -------------------------------------------------------
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Grid":
+        """Parses a map made of one char per cell (the usual puzzle input)."""
+        lines = [line.rstrip("\n") for line in lines]
+        lines = [line for line in lines if line]
+        grid = cls(max(len(line) for line in lines), len(lines))
+        for y, line in enumerate(lines):
+            start = grid.index(0, y)
+            grid.data[start : start + len(line)] = line.encode()
+        return grid
+
+    @classmethod
+    def from_text(cls, text: str) -> "Grid":
+        return cls.from_lines(text.splitlines())
+
+    @classmethod
+    def from_dict(
+        cls, cells: dict[Point, str | int], default: str | int = "."
+    ) -> "Grid":
+        """Builds the grid of the bounding box of a dict[(x, y)] -> value.
+
+        Coordinates are shifted so that the top left corner is (0, 0): the
+        shift is kept in `origin` to convert back with to_dict().
+        """
+        xmin, xmax, ymin, ymax = _bounds(cells)
+        grid = cls(xmax - xmin + 1, ymax - ymin + 1, default)
+        grid.origin = (xmin, ymin)
+        for (x, y), value in cells.items():
+            grid.data[grid.index(x - xmin, y - ymin)] = _byte(value)
+        return grid
+
+    @classmethod
+    def from_set(
+        cls, points: Iterable[Point], on: str | int = "#", off: str | int = "."
+    ) -> "Grid":
+        return cls.from_dict(dict.fromkeys(points, on), off)
+
+    def to_dict(self, as_int: bool = False) -> dict[Point, str | int]:
+        ox, oy = self.origin
+        return {
+            (x + ox, y + oy): self.data[i] if as_int else chr(self.data[i])
+            for i, (x, y) in self.items()
+        }
+
+    def to_set(self, value: str | int = "#") -> set[Point]:
+        ox, oy = self.origin
+        value = _byte(value)
+        return {(x + ox, y + oy) for i, (x, y) in self.items() if self.data[i] == value}
+
+    def copy(self) -> "Grid":
+        grid = Grid.__new__(Grid)
+        grid.__dict__.update(self.__dict__)
+        grid.data = bytearray(self.data)
+        return grid
+
+    def as_array(self):
+        """Zero-copy (height, width) uint8 NumPy view of the cells."""
+        import numpy as np
+
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(-1, self.stride)[
+            1:-1, 1:-1
+        ]
+
+    def __str__(self) -> str:
+        return "\n".join(bytes(self.row(y)).decode() for y in range(self.height))
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Grid) and self.data == other.data
+
+    # --- addressing --------------------------------------------------------
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def xy(self, i: int) -> Point:
+        y, x = divmod(i, self.stride)
+        return x - 1, y - 1
+
+    def __contains__(self, point: Point) -> bool:
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, point: Point) -> str:
+        """Char at (x, y), use `grid.data[i]` for the raw byte."""
+        if point not in self:
+            raise IndexError(point)
+        return chr(self.data[self.index(*point)])
+
+    def __setitem__(self, point: Point, value: str | int) -> None:
+        if point not in self:
+            raise IndexError(point)
+        self.data[self.index(*point)] = _byte(value)
+
+    # --- iteration ---------------------------------------------------------
+
+    def indexes(self) -> Iterator[int]:
+        """Flat index of every cell inside the grid, row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def items(self) -> Iterator[tuple[int, Point]]:
+        for y in range(self.height):
+            start = self.index(0, y)
+            for x in range(self.width):
+                yield start + x, (x, y)
+
+    def find(self, value: str | int) -> Iterator[int]:
+        """Flat index of every cell holding value."""
+        value = _byte(value)
+        i = self.data.find(value)
+        while i != -1:
+            yield i
+            i = self.data.find(value, i + 1)
+
+    def neighbors4(self, i: int) -> list[int]:
+        """Flat indexes of the up to 4 orthogonal neighbours inside the grid."""
+        data, outside = self.data, self.OUTSIDE
+        return [j for j in (i + o for o in self.offsets4) if data[j] != outside]
+
+    def neighbors8(self, i: int) -> list[int]:
+        """Flat indexes of the up to 8 neighbours (diagonals included) inside the grid."""
+        data, outside = self.data, self.OUTSIDE
+        return [j for j in (i + o for o in self.offsets8) if data[j] != outside]
+
+    def row(self, y: int) -> memoryview:
+        start = self.index(0, y)
+        return memoryview(self.data)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        start = self.index(x, 0)
+        return memoryview(self.data)[
+            start : start + self.height * self.stride : self.stride
+        ]
+
+
+def _byte(value: str | int) -> int:
+    return ord(value) if isinstance(value, str) else value
+
+
+def _bounds(points: Iterable[Point]) -> tuple[int, int, int, int]:
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    return min(xs), max(xs), min(ys), max(ys)
@@ -0,0 +1,44 @@
+"""Process pools for days splitting their own work (blueprints, items...).
+
+    >>> pmap(abs, [-1, 2, -3])
+    [1, 2, 3]
+
+Workers are forked, so they inherit the day module even when it was not
+imported by name (python -m aoc loads days from their path, under names
+that a spawned worker could not import back).
+
+Under `python -m aoc run -j N`, N parts already run at once: each of them
+only gets its share of the CPUs, set in its environment by the runner.
+"""
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+# number of workers a day may start, when set
+WORKERS_ENV = "AOC_POOL_WORKERS"
+
+
+def workers() -> int:
+    return int(os.environ.get(WORKERS_ENV) or os.cpu_count() or 1)
+
+
+def share_cpus(parts: int) -> None:
+    """Called in a runner worker: leaves it 1 / parts of the CPUs."""
+    os.environ[WORKERS_ENV] = str(max(1, (os.cpu_count() or 1) // parts))
+
+
+def pmap(fn: Callable, *iterables: Iterable, chunks_per_worker: int = 4) -> list:
+    """list(map(fn, *iterables)), spread over forked worker processes."""
+    columns = [list(it) for it in iterables]
+    size = min(len(c) for c in columns)
+    count = min(workers(), size)
+    if count <= 1:
+        return list(map(fn, *columns))
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else None)
+    chunksize = max(1, size // (chunks_per_worker * count))
+    with ProcessPoolExecutor(max_workers=count, mp_context=context) as pool:
+        return list(pool.map(fn, *columns, chunksize=chunksize))
@@ -0,0 +1,134 @@
+"""Runs many solver parts across a process pool and reports their cost."""
+
+import contextlib
+import os
+import resource
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from aoc import parallel, timing
+from aoc.solvers import Solver, call, load
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallows what solvers print (prints, timer_func, loggers)."""
+    with (
+        open(os.devnull, "w") as sink,
+        contextlib.redirect_stdout(sink),
+        contextlib.redirect_stderr(sink),
+    ):
+        yield
+
+
+@dataclass
+class Result:
+    year: int
+    day: int
+    mode: str
+    answer: str = ""
+    wall: float = 0.0  # seconds
+    cpu: float = 0.0  # seconds
+    peak_rss: int = 0  # KiB, for the whole worker process
+    peak_alloc: int | None = None  # bytes, tracemalloc peak (opt-in)
+    error: str | None = None
+    # everything the aoc.timing registry recorded in the worker: the part itself
+    # first, then the measures taken by the solver (timer_func, ...)
+    timings: list[timing.Timing] = field(default_factory=list)
+
+
+def run_one(
+    solver: Solver,
+    mode: str,
+    echo: bool = False,
+    memory: bool = False,
+    profile: bool = False,
+) -> Result:
+    """Loads the day module and runs one part of it, in the current process.
+
+    The solver output is swallowed unless echo is set.
+    """
+    result = Result(solver.year, solver.day, mode)
+    timing.clear()
+    with contextlib.nullcontext() if echo else quiet():
+        try:
+            module = load(solver)
+            name = f"{solver.year}/{solver.day:02d}/{mode}"
+            with timing.timed(name, memory, profile) as t:
+                answer = call(solver, mode, module)
+            result.answer = str(answer)
+        except (Exception, SystemExit) as e:
+            result.error = f"{type(e).__name__}: {e}"
+    if result.error is None:
+        result.wall, result.cpu, result.peak_alloc = t.wall, t.cpu, t.peak_alloc
+        # the part is recorded last, as the outermost measure
+        result.timings = [t] + timing.records()[:-1]
+    result.peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return result
+
+
+def run(
+    solvers: list[Solver],
+    modes: tuple[str, ...] = ("1", "2"),
+    workers: int | None = None,
+    echo: bool = False,
+    memory: bool = False,
+    profile: bool = False,
+) -> list[Result]:
+    """Fans every (solver, mode) out on a process pool.
+
+    Each part gets a fresh worker process: no state leaks between days sharing
+    a module name (aoc_utilities), and the peak RSS of a worker is the one of
+    the part it ran.
+    """
+    tasks = [
+        (s, m, echo, memory, profile) for s in solvers for m in modes if m in s.calls
+    ]
+    results = fan_out(run_one, tasks, workers)
+    return sorted(results, key=lambda r: (r.year, r.day, r.mode))
+
+
+def fan_out(fn: Callable, tasks: list[tuple], workers: int | None = None) -> list:
+    """Calls fn(*task) for every task, each in a fresh worker process.
+
+    Tasks running side by side share the CPUs for their own pools (see
+    aoc.parallel).
+    """
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        max_tasks_per_child=1,
+        initializer=parallel.share_cpus,
+        initargs=(min(workers, len(tasks)),),
+    ) as pool:
+        futures = [pool.submit(fn, *task) for task in tasks]
+        return [future.result() for future in as_completed(futures)]
+
+
+def _short(answer: str, width: int = 24) -> str:
+    answer = " / ".join(answer.splitlines())
+    return answer if len(answer) <= width else answer[: width - 1] + "…"
+
+
+def format_table(results: list[Result], elapsed: float | None = None) -> str:
+    alloc = any(r.peak_alloc is not None for r in results)
+    lines = [
+        f"{'year':>4} {'day':>3} {'part':>4}  {'answer':<24} {'wall ms':>10} {'cpu ms':>10} {'peak MiB':>9}"
+        + (f" {'alloc MiB':>9}" if alloc else "")
+    ]
+    for r in results:
+        answer = _short(r.answer) if r.error is None else _short(f"!! {r.error}")
+        lines.append(
+            f"{r.year:>4} {r.day:>3} {r.mode:>4}  {answer:<24} "
+            f"{r.wall * 1000:>10.1f} {r.cpu * 1000:>10.1f} {r.peak_rss / 1024:>9.1f}"
+            + (f" {(r.peak_alloc or 0) / 2**20:>9.1f}" if alloc else "")
+        )
+    errors = sum(r.error is not None for r in results)
+    total = (
+        f"{len(results)} parts, {errors} errors, cpu {sum(r.cpu for r in results):.2f}s"
+    )
+    if elapsed is not None:
+        total += f", wall-clock {elapsed:.2f}s"
+    lines.append(total)
+    return "\n".join(lines)
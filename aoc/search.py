@@ -0,0 +1,156 @@
+"""Shortest paths on implicit graphs: BFS, Dijkstra and A*.
+
+Graphs are never built: a search only needs a function yielding the
+neighbours of a state, and only expands the states it reaches.
+
+    >>> grid = ["S..#", ".#..", "...E"]
+    >>> def moves(i):
+    ...     y, x = divmod(i, 4)
+    ...     for dy, dx in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+    ...         if 0 <= y + dy < 3 and 0 <= x + dx < 4 and grid[y + dy][x + dx] != "#":
+    ...             yield (y + dy) * 4 + x + dx
+    >>> found = bfs([0], moves, lambda i: grid[i // 4][i % 4] == "E", paths=True)
+    >>> found.goal, found.cost, found.path()
+    (11, 5, [0, 4, 8, 9, 10, 11])
+
+States can be anything hashable, but ints (positions as flat indexes,
+bitmasks, digits of a packed int, ...) make the hot loops much cheaper than
+tuples.
+
+  - multi-source: pass every start, each one is at distance 0.
+  - reverse search: search from the goals with a function yielding the
+    predecessors of a state, e.g. to get the distance from every state to a
+    single goal in one search.
+  - early exit: with `is_goal`, the search stops on the first goal reached.
+  - A*: give dijkstra() an admissible and consistent `heuristic`.
+
+Each search reports the number of states expanded and the peak size of its
+frontier in `stats`.
+"""
+
+import heapq
+import itertools
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+State = TypeVar("State", bound=Hashable)
+
+
+@dataclass
+class Stats:
+    expanded: int = 0
+    peak_frontier: int = 0
+
+
+@dataclass
+class Search(Generic[State]):
+    """Outcome of a search: distances to every state reached, from the
+    closest start (complete only when the search did not stop on a goal)."""
+
+    distances: dict[State, int]
+    parents: dict[State, State | None]  # empty unless asked with paths=True
+    goal: State | None = None
+    stats: Stats = field(default_factory=Stats)
+
+    @property
+    def cost(self) -> int | None:
+        return None if self.goal is None else self.distances[self.goal]
+
+    def path(self, state: State | None = None) -> list[State]:
+        """States from a start to state (default: the goal found)."""
+        state = self.goal if state is None else state
+        path = []
+        while state is not None:
+            path.append(state)
+            state = self.parents[state]
+        return path[::-1]
+
+
+def bfs(
+    starts: Iterable[State],
+    neighbours: Callable[[State], Iterable[State]],
+    is_goal: Callable[[State], bool] | None = None,
+    paths: bool = False,
+) -> Search[State]:
+    """Breadth first search, for graphs where every move costs 1."""
+    distances = {}
+    parents = {}
+    for start in starts:
+        distances[start] = 0
+        if paths:
+            parents[start] = None
+    search = Search(distances, parents)
+    for start in distances:
+        if is_goal is not None and is_goal(start):
+            search.goal = start
+            return search
+
+    stats = search.stats
+    queue = deque(distances)
+    while queue:
+        stats.peak_frontier = max(stats.peak_frontier, len(queue))
+        state = queue.popleft()
+        stats.expanded += 1
+        distance = distances[state] + 1
+        for n in neighbours(state):
+            if n in distances:
+                continue
+            distances[n] = distance
+            if paths:
+                parents[n] = state
+            # with unit costs, the first time a goal is seen is the closest
+            if is_goal is not None and is_goal(n):
+                search.goal = n
+                return search
+            queue.append(n)
+    return search
+
+
+def dijkstra(
+    starts: Iterable[State],
+    neighbours: Callable[[State], Iterable[tuple[State, int]]],
+    is_goal: Callable[[State], bool] | None = None,
+    heuristic: Callable[[State], int] | None = None,
+    paths: bool = False,
+) -> Search[State]:
+    """Dijkstra on (neighbour, cost) moves, A* when given a heuristic.
+
+    The heuristic must never overestimate the cost to reach a goal, and
+    must be consistent (h(a) <= cost(a, b) + h(b)) so that a state expanded
+    once never needs to be expanded again.
+    """
+    distances = {}
+    parents = {}
+    for start in starts:
+        distances[start] = 0
+        if paths:
+            parents[start] = None
+    search = Search(distances, parents)
+    stats = search.stats
+
+    h = heuristic or (lambda _: 0)
+    tie = itertools.count()  # states are never compared, they may not be orderable
+    frontier = [(h(s), next(tie), 0, s) for s in distances]
+    heapq.heapify(frontier)
+    expanded = set()
+    while frontier:
+        stats.peak_frontier = max(stats.peak_frontier, len(frontier))
+        _, _, distance, state = heapq.heappop(frontier)
+        if state in expanded:
+            continue
+        if is_goal is not None and is_goal(state):
+            search.goal = state
+            return search
+        expanded.add(state)
+        stats.expanded += 1
+        for n, cost in neighbours(state):
+            d = distance + cost
+            if n in distances and distances[n] <= d:
+                continue
+            distances[n] = d
+            if paths:
+                parents[n] = state
+            heapq.heappush(frontier, (d + h(n), next(tie), d, n))
+    return search
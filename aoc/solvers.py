@@ -0,0 +1,132 @@
+"""Discovery and loading of the dayXX solvers of every aocYYYY folder.
+
+Each day script is driven by its own `if __name__ == "__main__"` block,
+where every mode (1 / 1t / 2 / 2t) calls solve1 / solve2 with the right input
+and the right extra parameters (`row` for 2022 day15, `max_connections` for
+2025 day08, ...). Instead of duplicating that knowledge, we read those calls
+from the source and evaluate them in the namespace of the imported module.
+"""
+
+import ast
+import importlib.util
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent.parent
+YEAR_DIR_RE = re.compile(r"^aoc(\d{4})$")
+DAY_FILE_RE = re.compile(r"^day(\d+)\.py$")
+MODES = ("1", "1t", "2", "2t")
+
+
+@dataclass
+class Solver:
+    year: int
+    day: int
+    path: Path
+    # mode -> source code of the solveN(...) call made by the __main__ block
+    calls: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day{self.day:02d}"
+
+
+def years() -> list[int]:
+    """All the years having an aocYYYY folder, sorted."""
+    return sorted(
+        int(m.group(1))
+        for p in ROOT.iterdir()
+        if p.is_dir() and (m := YEAR_DIR_RE.match(p.name))
+    )
+
+
+def _is_main_guard(node: ast.AST) -> bool:
+    return (
+        isinstance(node, ast.If)
+        and isinstance(node.test, ast.Compare)
+        and isinstance(node.test.left, ast.Name)
+        and node.test.left.id == "__name__"
+    )
+
+
+def _argv_mode(test: ast.AST) -> str | None:
+    """Returns "1t" for a test like `len(sys.argv) > 1 and sys.argv[1] == "1t"`"""
+    for node in ast.walk(test):
+        if (
+            isinstance(node, ast.Compare)
+            and isinstance(node.left, ast.Subscript)
+            and ast.unparse(node.left) == "sys.argv[1]"
+            and isinstance(node.comparators[0], ast.Constant)
+        ):
+            return str(node.comparators[0].value)
+    return None
+
+
+def main_calls(source: str) -> dict[str, str]:
+    """Maps each mode of the __main__ block to the solveN(...) call it makes.
+
+    >>> main_calls('''
+    ... if __name__ == "__main__":
+    ...     if len(sys.argv) > 1 and sys.argv[1] == "1":
+    ...         res = solve1(Input(DAY).read(), 2000000)
+    ...         print(res)
+    ... ''')
+    {'1': 'solve1(Input(DAY).read(), 2000000)'}
+    """
+    calls = {}
+    for guard in filter(_is_main_guard, ast.parse(source).body):
+        for node in ast.walk(guard):
+            if not isinstance(node, ast.If) or (mode := _argv_mode(node.test)) is None:
+                continue
+            for sub in ast.walk(ast.Module(body=node.body, type_ignores=[])):
+                if (
+                    isinstance(sub, ast.Call)
+                    and isinstance(sub.func, ast.Name)
+                    and sub.func.id in ("solve1", "solve2")
+                ):
+                    calls.setdefault(mode, ast.unparse(sub))
+                    break
+    return calls
+
+
+def discover(year: int | None = None, day: int | None = None) -> list[Solver]:
+    """Solvers having at least one mode wired in their __main__ block."""
+    solvers = []
+    for y in [year] if year else years():
+        for path in sorted((ROOT / f"aoc{y}").glob("day*.py")):
+            m = DAY_FILE_RE.match(path.name)
+            if not m or int(m.group(1)) == 0 or (day and int(m.group(1)) != day):
+                continue
+            calls = main_calls(path.read_text())
+            if calls:
+                solvers.append(Solver(y, int(m.group(1)), path, calls))
+    return sorted(solvers, key=lambda s: (s.year, s.day))
+
+
+def load(solver: Solver) -> ModuleType:
+    """Imports a day module the way `python dayXX.py` would see the world:
+    cwd and sys.path set to its year folder (for Input() and aoc_utilities).
+    """
+    year_dir = str(solver.path.parent)
+    os.chdir(year_dir)
+    if sys.path[0] != year_dir:
+        sys.path.insert(0, year_dir)
+    # every year ships its own aoc_utilities: drop the one of another year
+    utils = sys.modules.get("aoc_utilities")
+    if utils is not None and os.path.dirname(utils.__file__) != year_dir:
+        del sys.modules["aoc_utilities"]
+    name = f"aoc{solver.year}_day{solver.day:02d}"
+    spec = importlib.util.spec_from_file_location(name, solver.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def call(solver: Solver, mode: str, module: ModuleType) -> object:
+    """Runs the solveN(...) call of the given mode in the module namespace."""
+    return eval(solver.calls[mode], vars(module))
@@ -0,0 +1,148 @@
+"""Unbounded cellular automata on a sparse set of live cells, in any dimension.
+
+Each generation only live cells are visited: every one of them adds 1 to
+the count of each of its neighbours, and the next live cells are read from
+those counts. Cells are packed into ints so that the counting runs on int
+additions rather than on tuples.
+
+    >>> glider = {(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)}
+    >>> sorted(run(glider, 4, moore(2)))
+    [(1, 3), (2, 1), (2, 3), (3, 2), (3, 3)]
+
+Offsets can be any neighbourhood, e.g. the hexagonal one:
+
+    >>> len(run({(0, 0), (1, 0)}, 1, HEX, born={2}, survive={1, 2}))
+    4
+
+`mirrored` axes are axes along which the live cells are known to stay
+symmetric around 0 (e.g. a 2D seed embedded at z = 0 in 3D): only cells on
+the positive side are computed, and mirrored back in the result.
+
+    >>> seed = {(1, 0, 0), (2, 1, 0), (0, 2, 0), (1, 2, 0), (2, 2, 0)}
+    >>> run(seed, 3, moore(3), mirrored=(2,)) == run(seed, 3, moore(3))
+    True
+"""
+
+import functools
+from collections import Counter
+from collections.abc import Collection, Iterable
+from itertools import product
+
+Point = tuple[int, ...]
+
+# axial coordinates (q, r) of the 6 neighbours of a hexagon
+HEX = ((1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1))
+
+
+@functools.cache
+def moore(dimensions: int) -> tuple[Point, ...]:
+    """The 3**dimensions - 1 offsets to the cells touching a cell."""
+    zero = (0,) * dimensions
+    return tuple(o for o in product((-1, 0, 1), repeat=dimensions) if o != zero)
+
+
+def von_neumann(dimensions: int) -> tuple[Point, ...]:
+    """The 2 * dimensions offsets to the cells sharing a face with a cell."""
+    return tuple(
+        tuple(sign if i == axis else 0 for i in range(dimensions))
+        for axis in range(dimensions)
+        for sign in (-1, 1)
+    )
+
+
+class _Packing:
+    """Bijection between the points reachable within `steps` generations and
+    ints: coordinate i is digit i, in base spans[i], of the packed int."""
+
+    def __init__(
+        self,
+        live: Collection[Point],
+        steps: int,
+        offsets: Iterable[Point],
+        mirrored: Collection[int],
+    ) -> None:
+        self.dimensions = len(next(iter(live)))
+        self.lows, self.spans = [], []
+        for i in range(self.dimensions):
+            reach = max(abs(o[i]) for o in offsets)
+            low = min(p[i] for p in live) - reach * (steps + 1)
+            high = max(p[i] for p in live) + reach * (steps + 1)
+            if i in mirrored:
+                # negative cells are never stored: the lowest ones showing up
+                # while counting are neighbours of the mirror images
+                low = -2 * reach
+            self.lows.append(low)
+            self.spans.append(high - low + 1)
+        self.weights = [1]
+        for span in self.spans[:-1]:
+            self.weights.append(self.weights[-1] * span)
+
+    def pack(self, point: Point) -> int:
+        return sum(
+            (c - lo) * w
+            for c, lo, w in zip(point, self.lows, self.weights, strict=True)
+        )
+
+    def unpack(self, value: int) -> Point:
+        point = []
+        for lo, span in zip(self.lows, self.spans, strict=True):
+            value, digit = divmod(value, span)
+            point.append(digit + lo)
+        return tuple(point)
+
+    def coordinate(self, value: int, axis: int) -> int:
+        return value // self.weights[axis] % self.spans[axis] + self.lows[axis]
+
+
+def run(
+    live: Iterable[Point],
+    steps: int,
+    offsets: Iterable[Point],
+    born: Collection[int] = frozenset({3}),
+    survive: Collection[int] = frozenset({2, 3}),
+    mirrored: Collection[int] = (),
+) -> set[Point]:
+    """Live cells after `steps` generations.
+
+    A dead cell with a number of live neighbours in `born` gets alive, a live
+    one stays alive when that number is in `survive` (0 must not be in it:
+    cells without live neighbours are never looked at).
+    """
+    offsets = tuple(offsets)
+    live = set(live)
+    if not live:
+        return live
+    if mirrored:
+        live = {p for p in live if all(p[axis] >= 0 for axis in mirrored)}
+    packing = _Packing(live, steps, offsets, mirrored)
+    deltas = [
+        packing.pack(o) - packing.pack((0,) * packing.dimensions) for o in offsets
+    ]
+    # cells right next to a mirror have mirror images whose neighbours are
+    # on the positive side
+    mirrors = []
+    for axis in mirrored:
+        reach = max(abs(o[axis]) for o in offsets)
+        mirrors.append((axis, reach, packing.weights[axis]))
+
+    cells = {packing.pack(p) for p in live}
+    for _ in range(steps):
+        sources = list(cells)
+        for axis, reach, weight in mirrors:
+            for value in list(sources):
+                c = packing.coordinate(value, axis)
+                if 0 < c <= reach:
+                    sources.append(value - 2 * c * weight)
+        counts = Counter(s + d for s in sources for d in deltas)
+        cells = {
+            value
+            for value, n in counts.items()
+            if n in born or (n in survive and value in cells)
+        }
+        for axis, _, _ in mirrors:
+            cells = {value for value in cells if packing.coordinate(value, axis) >= 0}
+
+    points = {packing.unpack(value) for value in cells}
+    for axis in mirrored:
+        points |= {p[:axis] + (-p[axis],) + p[axis + 1 :] for p in points}
+    return points
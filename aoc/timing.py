@@ -0,0 +1,138 @@
+"""Process-wide registry of timings, fed by `timed` (decorator or context manager).
+
+    @timed()
+    def solve1(data):
+        ...
+
+    with timed("parsing") as t:
+        grid = parser(data)
+    print(t.wall)
+
+Every measure records perf_counter_ns and process CPU time. tracemalloc peak
+memory and a cProfile report are opt-in (arguments, or AOC_MEMORY=1 /
+AOC_PROFILE=1 in the environment) as they slow the measured code down.
+Only the outermost active measure can trace memory / profile: nested ones
+get None for those.
+"""
+
+import cProfile
+import csv
+import functools
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+
+_records: list["Timing"] = []
+_profiling = False
+
+
+@dataclass
+class Timing:
+    name: str
+    wall_ns: int = 0
+    cpu_ns: int = 0
+    peak_alloc: int | None = None  # bytes
+    profile: str | None = None  # pstats report, sorted by cumulative time
+
+    @property
+    def wall(self) -> float:
+        return self.wall_ns / 1e9
+
+    @property
+    def cpu(self) -> float:
+        return self.cpu_ns / 1e9
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "0") not in ("", "0")
+
+
+class timed:  # noqa: N801 (used as a decorator, like contextlib.suppress)
+    """Measures a block of code, or every call of the decorated function."""
+
+    def __init__(
+        self,
+        name: str | None = None,
+        memory: bool | None = None,
+        profile: bool | None = None,
+    ) -> None:
+        self.name = name
+        self.memory = _env_flag("AOC_MEMORY") if memory is None else memory
+        self.profile = _env_flag("AOC_PROFILE") if profile is None else profile
+
+    def __enter__(self) -> Timing:
+        global _profiling
+        self.record = Timing(self.name or "block")
+        self._tracing = self.memory and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+        self._profiler = None
+        if self.profile and not _profiling:
+            _profiling = True
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._cpu = time.process_time_ns()
+        self._wall = time.perf_counter_ns()
+        return self.record
+
+    def __exit__(self, *exc: object) -> None:
+        global _profiling
+        self.record.wall_ns = time.perf_counter_ns() - self._wall
+        self.record.cpu_ns = time.process_time_ns() - self._cpu
+        if self._profiler is not None:
+            self._profiler.disable()
+            _profiling = False
+            report = io.StringIO()
+            pstats.Stats(self._profiler, stream=report).sort_stats(
+                "cumulative"
+            ).print_stats(20)
+            self.record.profile = report.getvalue()
+        if self._tracing:
+            self.record.peak_alloc = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        _records.append(self.record)
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrap_func(*args: object, **kwargs: object) -> object:
+            with timed(self.name or func.__qualname__, self.memory, self.profile):
+                return func(*args, **kwargs)
+
+        return wrap_func
+
+
+def records() -> list[Timing]:
+    return list(_records)
+
+
+def clear() -> None:
+    _records.clear()
+
+
+def export_json(path: Path, timings: list[Timing] | None = None) -> None:
+    timings = records() if timings is None else timings
+    path.write_text(json.dumps([asdict(t) for t in timings], indent=2) + "\n")
+
+
+def export_csv(path: Path, timings: list[Timing] | None = None) -> None:
+    timings = records() if timings is None else timings
+    columns = [f.name for f in fields(Timing) if f.name != "profile"]
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for t in timings:
+            writer.writerow(getattr(t, c) for c in columns)
+
+
+def export(path: Path, timings: list[Timing] | None = None) -> None:
+    """JSON or CSV depending on the file suffix."""
+    if path.suffix == ".csv":
+        export_csv(path, timings)
+    else:
+        export_json(path, timings)
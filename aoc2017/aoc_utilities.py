@@ -1,4 +1,12 @@
+import io
+import os
 import re
+import sys
+
+# the repo-level `aoc` package (python -m aoc) holds the tooling shared by every year
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import cycles  # noqa: E402, F401
 
 
 def parse_words(text):
@@ -9,7 +17,8 @@ def parse_words(text):
 def Input(day):
     "Open this day's input file."
     filename = './input_files/input{}.txt'.format(day)
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def neighbors_4(pos):
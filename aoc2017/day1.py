@@ -1,5 +1,7 @@
 # Python 3.x
 
+import sys
+
 ##################### PART 1 #########################
 
 
@@ -13,12 +15,8 @@ def captcha1(strnb):
             res += int(strnb[i])
     return res
 
-assert captcha1("1122") == 3
-assert captcha1("1111") == 4
-assert captcha1("1234") == 0
-assert captcha1("91212129") == 9
-
-print(captcha1(inputstr))
+def solve1(input):
+    return captcha1(input)
 
 
 ##################### PART 2 #########################
@@ -26,16 +24,35 @@ print(captcha1(inputstr))
 
 def captcha2(strnb):
     res = 0
-    print(len(strnb))
     for i in range(0, len(strnb)):
         if strnb[i] == strnb[int(i - len(strnb) / 2)]:
             res += int(strnb[i])
     return res
 
-assert captcha2("1212") == 6
-assert captcha2("1221") == 0
-assert captcha2("123425") == 4
-assert captcha2("123123") == 12
-assert captcha2("12131415") == 4
-
-print(captcha2(inputstr))
+def solve2(input):
+    return captcha2(input)
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(inputstr)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert solve1("1122") == 3
+        assert solve1("1111") == 4
+        assert solve1("1234") == 0
+        assert solve1("91212129") == 9
+        print("tests passed")
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(inputstr)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        assert solve2("1212") == 6
+        assert solve2("1221") == 0
+        assert solve2("123425") == 4
+        assert solve2("123123") == 12
+        assert solve2("12131415") == 4
+        print("tests passed")
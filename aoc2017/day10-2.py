@@ -1,35 +1,48 @@
+import sys
+
 instr = """83,0,193,1,254,237,187,40,88,27,2,255,149,29,42,100"""
 
-lengths = [ord(x) for x in instr] + [17, 31, 73, 47, 23]
 
-lsize = 256
+def solve2(instr):
+    lengths = [ord(x) for x in instr] + [17, 31, 73, 47, 23]
+
+    lsize = 256
+
+    l = list(range(lsize))
+
+    cur_skip = 0
+    cur_pos = 0
 
-l = list(range(lsize))
+    for i in range(64):
+        for length in lengths:
+            cur_subl = []
 
-cur_skip = 0
-cur_pos = 0
+            for i in range(length):
+                cur_subl.append(l[(i+cur_pos) % len(l)])
 
-for i in range(64):
-    for length in lengths:
-        cur_subl = []
+            for i in range(length):
+                l[(i+cur_pos)%len(l)] = cur_subl[len(cur_subl) - i -1]
 
-        for i in range(length):
-            cur_subl.append(l[(i+cur_pos) % len(l)])
+            cur_pos = (cur_pos + cur_skip + length) % len(l)
+            cur_skip += 1
 
-        for i in range(length):
-            l[(i+cur_pos)%len(l)] = cur_subl[len(cur_subl) - i -1]
+    final = ""
 
-        cur_pos = (cur_pos + cur_skip + length) % len(l)
-        cur_skip += 1
+    for i in range(16):
+        sub = l[i*16:(i+1)*16]
 
-final = ""
+        h = sub[0]
+        for c in sub[1:]:
+            h = h ^ c
+        final += "{:02x}".format(h)
 
-for i in range(16):
-    sub = l[i*16:(i+1)*16]
+    return final
 
-    h = sub[0]
-    for c in sub[1:]:
-        h = h ^ c
-    final += "{:02x}".format(h)
 
-print(final)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(instr)
+        print(res)
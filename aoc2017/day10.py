@@ -1,3 +1,6 @@
+import sys
+
+
 def Input(day):
     "Open this day's input file."
     filename = './input_files/input{}.txt'.format(day)
@@ -14,12 +17,12 @@ def shift_list(l, cur, skip_size, length):
         # no wrap
         new_list = l[:cur] + list(reversed(l[cur:cur + length])) + l[cur + length:]
     else:
-        # wrap
+        # wrap: reverse the positions cur, cur + 1, ... modulo the list size
         print("\nwrap")
-        print(list(reversed(l[cur:length + 1])))
-        print(l[((cur + length) % len(l)):cur])
-        print(list(reversed(l[:length - ((cur + length) % len(l))])))
-        new_list = list(reversed(l[cur:length + 1])) + l[((cur + length) % len(l)):cur] + list(reversed(l[:length - ((cur + length) % len(l))]))
+        positions = [(cur + i) % len(l) for i in range(length)]
+        new_list = list(l)
+        for p, value in zip(positions, reversed([l[p] for p in positions])):
+            new_list[p] = value
 
     print(new_list)
     new_cur = (cur + skip_size + length) % len(l)
@@ -28,10 +31,12 @@ def shift_list(l, cur, skip_size, length):
     print(new_skip_size)
     return new_list, new_cur, new_skip_size
 
-assert shift_list([0, 1, 2, 3, 4], 0, 0, 3) == ([2, 1, 0, 3, 4], 3, 1)
-assert shift_list([2, 1, 0, 3, 4], 3, 1, 4) == ([4, 3, 0, 1, 2], 3, 2)
-assert shift_list([4, 3, 0, 1, 2], 3, 2, 1) == ([4, 3, 0, 1, 2], 1, 3)
-assert shift_list([4, 3, 0, 1, 2], 1, 3, 5) == ([3, 4, 2, 1, 0], 4, 4)
-
 
-print(solve_part_2(Input(9).readline()))
+# this first attempt never produced an answer, see day10-3.py for the working version
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert shift_list([0, 1, 2, 3, 4], 0, 0, 3) == ([2, 1, 0, 3, 4], 3, 1)
+        assert shift_list([2, 1, 0, 3, 4], 3, 1, 4) == ([4, 3, 0, 1, 2], 3, 2)
+        assert shift_list([4, 3, 0, 1, 2], 3, 2, 1) == ([4, 3, 0, 1, 2], 1, 3)
+        assert shift_list([4, 3, 0, 1, 2], 1, 3, 5) == ([3, 4, 2, 1, 0], 4, 4)
+        print("tests passed")
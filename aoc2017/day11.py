@@ -1,5 +1,6 @@
 from math import sqrt, ceil
 import re
+import sys
 
 
 def Input(day):
@@ -51,10 +52,18 @@ def solve1(directions):
         max_d = max(max_d, get_distance_from_loc(loc))
     return get_distance_from_loc(loc), max_d
 
-assert solve1(["ne", "ne", "ne"])[0] == 3
-assert solve1(["ne", "ne", "sw", "sw"])[0] == 0
-assert solve1(["ne", "ne", "s", "s"])[0] == 2
-assert solve1(["se", "sw", "se", "sw", "sw"])[0] == 3
 
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(parse_words(Input(11).readline()))
+        print("the result for part 1 and 2 is {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert solve1(["ne", "ne", "ne"])[0] == 3
+        assert solve1(["ne", "ne", "sw", "sw"])[0] == 0
+        assert solve1(["ne", "ne", "s", "s"])[0] == 2
+        assert solve1(["se", "sw", "se", "sw", "sw"])[0] == 3
+        print("tests passed")
 
-print("the result for part 1 and 2 is {}".format(solve1(parse_words(Input(11).readline()))))
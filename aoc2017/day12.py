@@ -1,4 +1,5 @@
 import re
+import sys
 
 
 def Input(day):
@@ -47,10 +48,6 @@ def solve1(lines):
         nodes_to_explore -= group0
     return len(group0)
 
-assert solve1(teststr.splitlines()) == 6
-
-print("The result for part 1 is : {}".format(solve1(Input(12).readlines())))
-
 
 # part 2
 
@@ -88,6 +85,22 @@ def solve2(lines):
 
     return group_nb
 
-assert solve2(teststr.splitlines()) == 2
 
-print("The result for part 2 is : {}".format(solve2(Input(12).readlines())))
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(12).readlines())
+        print("The result for part 1 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(teststr.splitlines())
+        assert res == 6
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(12).readlines())
+        print("The result for part 2 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(teststr.splitlines())
+        assert res == 2
+        print(res)
@@ -1,4 +1,5 @@
 import re
+import sys
 
 
 def Input(day):
@@ -38,11 +39,6 @@ def solve1(lines):
     return severity
 
 
-assert solve1(teststr.splitlines()) == 24
-
-# print("The result for part 1 is : {}".format(solve1(Input(13).readlines())))
-
-
 # part 2
 
 
@@ -61,8 +57,21 @@ def solve2(lines):
     return delay
 
 
-# firewall = parse_firewall(Input(13).readlines())
-assert solve2(teststr.splitlines()) == 10
-
-
-# print("The result for part 2 is : {}".format(solve2(Input(13).readlines())))
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(13).readlines())
+        print("The result for part 1 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(teststr.splitlines())
+        assert res == 24
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(13).readlines())
+        print("The result for part 2 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(teststr.splitlines())
+        assert res == 10
+        print(res)
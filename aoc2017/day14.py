@@ -1,5 +1,7 @@
 # Python 3.x
 
+import sys
+
 
 # helpers from day 10
 
@@ -56,6 +58,7 @@ def hash(input):
 # day 14
 
 teststr = "flqrgnkx"
+inputstr = "ljoxqyyw"
 
 
 # Part 1
@@ -123,14 +126,14 @@ def solve2(input):
 
     colored_dict = {}
     positions_to_color = set(list(bit_dict.keys()))
-    print("positions_to_color : {}".format(positions_to_color))
-    print("init complete, starting coloration")
+    # print("positions_to_color : {}".format(positions_to_color))
+    # print("init complete, starting coloration")
 
     color = 0
     while len(positions_to_color) > 0:
-        print("updating color to : {}".format(color))
+        # print("updating color to : {}".format(color))
         color += 1
-        print("startin coloration for color {}".format(color))
+        # print("startin coloration for color {}".format(color))
         points_to_color_in_that_color = set()
         points_to_color_in_that_color.add(positions_to_color.pop())
 
@@ -138,27 +141,43 @@ def solve2(input):
             point_to_color = points_to_color_in_that_color.pop()
 
             # color the point
-            print("coloring point {}".format(point_to_color))
+            # print("coloring point {}".format(point_to_color))
             colored_dict[point_to_color] = color
             if point_to_color in positions_to_color:
                 positions_to_color.remove(point_to_color)
 
             # look for neighbors to color
             for neighbor in neighbors_4(point_to_color):
-                print("neighbor is {} has value {}".format(neighbor, bit_dict.get(neighbor, 0)))
+                # print("neighbor is {} has value {}".format(neighbor, bit_dict.get(neighbor, 0)))
                 if int(bit_dict.get(neighbor, 0)) == 1:
                     if neighbor not in colored_dict:
-                        print("neighbor is {} colorable".format(neighbor))
+                        # print("neighbor is {} colorable".format(neighbor))
                         points_to_color_in_that_color.add(neighbor)
     return color, colored_dict
 
 
-res, colored_dict = solve2('ljoxqyyw')
-
-# for i in range(0, 128):
-#     line = []
-#     for j in range(0, 128):
-#         line.append(colored_dict.get((i,j), 0))
-#     print(line)
-
-print(res)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(inputstr)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(teststr)
+        assert res == 8108
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res, colored_dict = solve2(inputstr)
+
+        # for i in range(0, 128):
+        #     line = []
+        #     for j in range(0, 128):
+        #         line.append(colored_dict.get((i,j), 0))
+        #     print(line)
+
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res, colored_dict = solve2(teststr)
+        assert res == 1242
+        print(res)
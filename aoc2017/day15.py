@@ -1,4 +1,5 @@
 import re
+import sys
 
 
 def Input(day):
@@ -39,11 +40,11 @@ def generator(initial_value, factor, previous_value=None):
 
 
 
-def solve1(initA, initB):
+def solve1(initA, initB, iterations=40000000):
     count = 0
     valueA = None
     valueB = None
-    for _ in range(40000000):
+    for _ in range(iterations):
         valueA = generator(initA, 16807, valueA)
         bvalueA = bin(valueA)[2:].zfill(32)
         valueB = generator(initB, 48271, valueB)
@@ -88,6 +89,21 @@ def solve2(initA, initB, iterations):
 # test = solve2(parse_numbers(teststr)[0], parse_numbers(teststr)[1], 5)
 # print("The result for part 2 is : {}".format(test))
 
-
-res = solve2(parse_numbers(inputstr)[0], parse_numbers(inputstr)[1], 5000000)
-print("The result for part 2 is : {}".format(res))
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(parse_numbers(inputstr)[0], parse_numbers(inputstr)[1])
+        print("The result for part 1 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(parse_numbers(teststr)[0], parse_numbers(teststr)[1], 5)
+        assert res == 1
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(parse_numbers(inputstr)[0], parse_numbers(inputstr)[1], 5000000)
+        print("The result for part 2 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(parse_numbers(teststr)[0], parse_numbers(teststr)[1], 1056)
+        assert res == 1
+        print(res)
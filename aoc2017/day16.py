@@ -1,6 +1,9 @@
 # Python 3.x
 
 import re
+import sys
+
+from aoc_utilities import cycles
 
 program_list = "abcdefghijklmnop"
 
@@ -21,25 +24,16 @@ def spin(progs, X):
     return progs[len(progs) - X:] + progs[:len(progs) - X]
 
 
-assert(spin([x for x in "abcde"], 3) == [x for x in "cdeab"])
-
-
 def exchange(progs, A, B):
     # Python evaluates the right hand side of an assignment first so you can swap variables like this (no need for temp var)
     progs[A], progs[B] = progs[B], progs[A]
     return progs
 
 
-assert(exchange([x for x in "eabcd"], 3, 4) == [x for x in "eabdc"])
-
-
 def partner(progs, A, B):
     return exchange(progs, progs.index(A), progs.index(B))
 
 
-assert(partner([x for x in "eabdc"], 'e', 'b') == [x for x in "baedc"])
-
-
 def solve1(alpha, operations):
     progs = [x for x in alpha]
 
@@ -60,22 +54,28 @@ def solve1(alpha, operations):
 
 
 def solve2(operations):
-    progs = [x for x in "abcdefghijklmnop"]
-    alpha = 'abcdefghijklmnop'
-    alpha = solve1(alpha, operations)
-
-    # let's find a cycle
-    i = 1
-    while alpha != 'abcdefghijklmnop':
-        alpha = solve1(alpha, operations)
-        i += 1
-
-    j = 1000000000 % i
-
-    for k in range(j):
-        alpha = solve1(alpha, operations)
-
-    return alpha
-
-res = solve2(parse_words(Input(16).readline()))
-print(res)
+    # the dance comes back to a previous order after a few rounds: only the
+    # rounds up to that loop are danced
+    def dance(alpha):
+        return solve1(alpha, operations)
+
+    return cycles.nth(dance, program_list, 1000000000)
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(program_list, parse_words(Input(16).readline()))
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert(spin([x for x in "abcde"], 3) == [x for x in "cdeab"])
+        assert(exchange([x for x in "eabcd"], 3, 4) == [x for x in "eabdc"])
+        assert(partner([x for x in "eabdc"], 'e', 'b') == [x for x in "baedc"])
+        res = solve1("abcde", ["s1", "x3/4", "pe/b"])
+        assert res == "baedc"
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(parse_words(Input(16).readline()))
+        print(res)
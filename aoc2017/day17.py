@@ -1,14 +1,14 @@
 # Python 3.x
 
+import sys
+
 from aoc_utilities import *
-DAY = 1
+DAY = 17
 
 # Part 1
 
-teststr = """0: 3
-1: 2
-4: 4
-6: 4"""
+teststr = 3
+inputstr = 382
 
 
 def spinlock(l, cur, offset, value_to_insert):
@@ -18,11 +18,6 @@ def spinlock(l, cur, offset, value_to_insert):
     return l, position_to_insert
 
 
-assert spinlock([0], 0, 3, 1) == ([0, 1], 1)
-assert spinlock([0, 1], 1, 3, 2) == ([0, 2, 1], 1)
-assert spinlock([0, 2, 1], 1, 3, 3) == ([0, 2, 3, 1], 2)
-
-
 def solve1(offset):
     insertions = [0]
     cur = 0
@@ -55,12 +50,39 @@ def solve1(offset):
 
 
 # it's not necessary to keep the list in memory !!
-def next0(step):
+def next0(step, total_insertions=50000000):
     pos = 0
     final = 0
-    for i in range(1, 50000000 + 1):
+    for i in range(1, total_insertions + 1):
         pos = (pos + step) % i + 1
         if pos == 1:
             final = i
     return(final)
-print('Value after 0 in completed buffer is', next0(382))
+
+
+def solve2(offset, total_insertions=50000000):
+    return next0(offset, total_insertions)
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(inputstr)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert spinlock([0], 0, 3, 1) == ([0, 1], 1)
+        assert spinlock([0, 1], 1, 3, 2) == ([0, 2, 1], 1)
+        assert spinlock([0, 2, 1], 1, 3, 3) == ([0, 2, 3, 1], 2)
+        res = solve1(teststr)
+        assert res == 638
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(inputstr)
+        print('Value after 0 in completed buffer is', res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(teststr, 9)
+        assert res == 9
+        print(res)
+
@@ -1,4 +1,5 @@
 # Python 3.x
+import sys
 from collections import defaultdict
 from aoc_utilities import Input
 
@@ -65,7 +66,14 @@ def solve_p2(instr):
     return p1.sent
 
 
+def solve2(instr):
+    return solve_p2(instr)
 
 
-res = solve_p2(Input(DAY).readlines())
-print(res)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(DAY).readlines())
+        print(res)
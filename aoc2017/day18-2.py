@@ -5,12 +5,10 @@ DAY = 18
 
 import collections
 import multiprocessing.pool
+import sys
 
 
-PROGRAM = Input(DAY).readlines()
-
-
-def run(ident, inqueue, outqueue):
+def run(program, ident, inqueue, outqueue):
     regs = collections.defaultdict(int)
     regs['p'] = ident
 
@@ -24,8 +22,8 @@ def run(ident, inqueue, outqueue):
     count = 0
     played = None
 
-    while 0 <= pc < len(PROGRAM) - 1:
-        cmd = PROGRAM[pc].split()
+    while 0 <= pc < len(program) - 1:
+        cmd = program[pc].split()
         if cmd[0] == 'snd':
             played = val(cmd[1])
             if outqueue:
@@ -53,15 +51,29 @@ def run(ident, inqueue, outqueue):
     return count
 
 
-print('PART 1:', run(0, None, None))
+def solve1(program):
+    return run(program, 0, None, None)
+
+
+def solve2(program):
+    with multiprocessing.pool.ThreadPool(processes=2) as pool:
+        q1 = multiprocessing.Queue()
+        q2 = multiprocessing.Queue()
 
-pool = multiprocessing.pool.ThreadPool(processes=2)
+        res1 = pool.apply_async(run, (program, 0, q1, q2))
+        res2 = pool.apply_async(run, (program, 1, q2, q1))
 
-q1 = multiprocessing.Queue()
-q2 = multiprocessing.Queue()
+        res1.get()
+        return res2.get()
 
-res1 = pool.apply_async(run, (0, q1, q2))
-res2 = pool.apply_async(run, (1, q2, q1))
 
-res1.get()
-print('PART 2:', res2.get())
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(DAY).readlines())
+        print('PART 1:', res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(DAY).readlines())
+        print('PART 2:', res)
@@ -1,4 +1,5 @@
 # Python 3.x
+import sys
 from collections import defaultdict
 from aoc_utilities import Input
 
@@ -27,7 +28,7 @@ def get(registers, value):
     try:
         return int(value)
     except ValueError:
-        print("exception for : {}, will return {}".format(value, registers[value]))
+        # print("exception for : {}, will return {}".format(value, registers[value]))
         return registers[value]
 
 
@@ -35,8 +36,8 @@ def solve1(instructions):
     registers = defaultdict(int)
     i = 0
     while i >= 0 and i < len(instructions):
-        print(i)
-        print(instructions[i])
+        # print(i)
+        # print(instructions[i])
         inst = instructions[i].split()
         op = inst[0]
         if op == 'snd':
@@ -70,16 +71,17 @@ def solve1(instructions):
             return None
 
 
-# assert(solve1(teststr.splitlines()) == XXXXX)
+# part 2 lives in day18-1.py (and day18-2.py)
 
 
-res = solve1(Input(DAY).readlines())
-print(res)
-
-
-
-# def solve2(input):
-#     pass
-#
-# res = solve2(parse_words(Input(DAY).readline()))
-# print(res)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(DAY).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(teststr.splitlines())
+        assert res == 4
+        print(res)
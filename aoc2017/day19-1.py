@@ -1,5 +1,7 @@
 # Python 3.x
 
+import sys
+
 from aoc_utilities import *
 DAY = 19
 
@@ -49,9 +51,16 @@ def orig(lines):
     print(len(path))
     return None
 
-# res = solve1(teststr.splitlines())
-solve1(Input(DAY).readlines())
-orig(Input(DAY).readlines())
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    # both parts are printed at once
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        solve1(Input(DAY).readlines())
+        orig(Input(DAY).readlines())
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        solve1(teststr.splitlines())
 
 
 
@@ -1,5 +1,7 @@
 # Python 3.x
 
+import sys
+
 from aoc_utilities import Input
 DAY = 19
 
@@ -23,8 +25,6 @@ def get_maze(input):
     return maze
 
 
-print(get_maze(teststr.split('\n')))
-
 def solve1(input):
     pass
 
@@ -35,6 +35,11 @@ def solve1(input):
 # res = solve1(parse_words(Input(DAY).readline()))
 # print(res)
 
+# the working version is in day19-1.py
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        print(get_maze(teststr.split('\n')))
+
 
 
 # def solve2(input):
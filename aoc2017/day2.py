@@ -1,5 +1,6 @@
 # Python 3.x
 import re
+import sys
 
 
 ##################### PART 1 #########################
@@ -46,8 +47,8 @@ def checksum1(s):
     return chksum
 
 
-assert checksum1(teststr) == 18
-
+def solve1(input):
+    return checksum1(input)
 
 
 ##################### PART 2 #########################
@@ -92,6 +93,25 @@ def test_first_elem(l):
     return test_first_elem(l[1:])
 
 
-assert checksum2(teststr2) == 9
-
-print('The checksum is {}'.format(checksum2(inputstr2)))
+def solve2(input):
+    return checksum2(input)
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(realstr)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(teststr)
+        assert res == 18
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(inputstr2)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(teststr2)
+        assert res == 9
+        print(res)
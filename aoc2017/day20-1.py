@@ -1,7 +1,6 @@
+import sys
 from collections import defaultdict
 
-f = open("input_files/input20.txt", "r")
-
 
 class Particle(object):
     def __init__(self, p, v, a):
@@ -18,37 +17,63 @@ class Particle(object):
         return sum([abs(x) for x in self.p])
 
 
-parts = {}
-i = 0
-for line in f:
-    ts = line.strip().split(", ")
-    ps = [int(x) for x in ts[0].split("=")[1][1:-1].split(",")]
-    vs = [int(x) for x in ts[1].split("=")[1][1:-1].split(",")]
-    acs = [int(x) for x in ts[2].split("=")[1][1:-1].split(",")]
-    parts[i] = Particle(ps, vs, acs)
-    i += 1
-
-part2 = True
-while True:
-    min_d = None
-    min_part = None
-    for i, part in parts.items():
-        part.step()
-        if min_d is None or part.dist() < min_d:
-            min_part = i
-            min_d = part.dist()
-
-    if part2:
-        pos_dict = defaultdict(list)
+def parse(lines):
+    parts = {}
+    i = 0
+    for line in lines:
+        ts = line.strip().split(", ")
+        ps = [int(x) for x in ts[0].split("=")[1][1:-1].split(",")]
+        vs = [int(x) for x in ts[1].split("=")[1][1:-1].split(",")]
+        acs = [int(x) for x in ts[2].split("=")[1][1:-1].split(",")]
+        parts[i] = Particle(ps, vs, acs)
+        i += 1
+    return parts
+
+
+# this used to loop forever, printing the result of each step until it looked stable:
+# `steps` bounds the simulation instead
+def simulate(lines, part2, steps=1000):
+    parts = parse(lines)
+    for _ in range(steps):
+        min_d = None
+        min_part = None
         for i, part in parts.items():
-            k = tuple(part.p)
-            pos_dict[k].append(i)
+            part.step()
+            if min_d is None or part.dist() < min_d:
+                min_part = i
+                min_d = part.dist()
+
+        if part2:
+            pos_dict = defaultdict(list)
+            for i, part in parts.items():
+                k = tuple(part.p)
+                pos_dict[k].append(i)
+
+            for k, v in pos_dict.items():
+                if len(v) > 1:
+                    for i in v:
+                        del parts[i]
+
+    return len(parts) if part2 else min_part
+
+
+def solve1(lines):
+    return simulate(lines, False)
+
+
+def solve2(lines):
+    return simulate(lines, True)
 
-        for k, v in pos_dict.items():
-            if len(v) > 1:
-                for i in v:
-                    del parts[i]
 
-        print(len(parts))
-    else:
-        print(min_part)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        with open("input_files/input20.txt", "r") as f:
+            res = solve1(f.readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        with open("input_files/input20.txt", "r") as f:
+            res = solve2(f.readlines())
+        print(res)
@@ -1,6 +1,7 @@
 # Python 3.x
 
 import re
+import sys
 from aoc_utilities import *
 DAY = 20
 
@@ -21,24 +22,24 @@ def solve1(lines):
             if metric < min:
                 idmin = i
                 min = metric
-                print(min)
-                print("new leader @ metric {} for line #{} : {}".format(metric, i, line))
+                # print(min)
+                # print("new leader @ metric {} for line #{} : {}".format(metric, i, line))
 
-            elif metric == min:
-                print("equality @ metric {} for line #{} : {}".format(metric, i, line))
+            # elif metric == min:
+            #     print("equality @ metric {} for line #{} : {}".format(metric, i, line))
     return idmin
 
 
 # assert(solve1(teststr.splitlines()) == 1)
 
 
-res = solve1((Input(DAY).readlines()))
-print(res)
+# part 2 lives in day20-1.py
 
 
-
-# def solve2(input):
-#     pass
-#
-# res = solve2(parse_words(Input(DAY).readline()))
-# print(res)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1((Input(DAY).readlines()))
+        print(res)
@@ -1,4 +1,6 @@
-pattern = '.#./..#/###'.split('/')
+import sys
+
+START = '.#./..#/###'.split('/')
 
 def grouper(l, n):
     parts = len(l) // n
@@ -24,7 +26,7 @@ def combos(l, flip=True):
         yield from combos(fv, False)
         yield from combos(fh, False)
 
-def enhance(p):
+def enhance(p, rules):
     size = 2 if len(p) % 2 == 0 else 3
     grouped = list(grouper(p, size))
     new_size = int(len(grouped)**0.5)*(size+1)
@@ -39,21 +41,37 @@ def enhance(p):
     enhanced = [''.join(r) for r in enhanced]
     return enhanced
 
-rules = {}
-with open('input_files/input21.txt') as f:
-    for line in f:
+def parse_rules(lines):
+    rules = {}
+    for line in lines:
         rule_in, rule_out = [r.split('/') for r in line.strip().split(' => ')]
         for comb in combos(rule_in):
             rules[tuple(comb)] = rule_out
+    return rules
 
-for _ in range(5):
-    pattern = enhance(pattern)
+def count_on(lines, iterations):
+    rules = parse_rules(lines)
+    pattern = START
+    for _ in range(iterations):
+        pattern = enhance(pattern, rules)
+    return sum(r.count('#') for r in pattern)
 
-print("solution for part 1 is : {}".format(sum(r.count('#') for r in pattern)))
+def solve1(lines):
+    return count_on(lines, 5)
 
+def solve2(lines):
+    return count_on(lines, 18)
 
-pattern = '.#./..#/###'.split('/')
-for _ in range(18):
-    pattern = enhance(pattern)
 
-print("solution for part 2 is : {}".format(sum(r.count('#') for r in pattern)))
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        with open('input_files/input21.txt') as f:
+            res = solve1(f.readlines())
+        print("solution for part 1 is : {}".format(res))
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        with open('input_files/input21.txt') as f:
+            res = solve2(f.readlines())
+        print("solution for part 2 is : {}".format(res))
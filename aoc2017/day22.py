@@ -1,5 +1,7 @@
 # Python 3.x
 
+import sys
+
 from aoc_utilities import *
 from collections import defaultdict
 DAY = 22
@@ -24,9 +26,6 @@ def parse(lines):
     return infected
 
 
-print(parse(teststr.splitlines()))
-
-
 def solve1(lines, bursts):
     infected = parse(lines)
     infections = 0
@@ -49,12 +48,6 @@ def solve1(lines, bursts):
     # print("there have been {} infections !".format(infections))
     return infections
 
-# assert(solve1(teststr.splitlines(), 70) == 41)
-# assert(solve1(teststr.splitlines(), 10000) == 5587)
-#
-#
-# res = solve1((Input(DAY).readlines()), 10000)
-# print(res)
 
 
 def solve2(lines, bursts):
@@ -102,5 +95,23 @@ def solve2(lines, bursts):
     # print("there have been {} infections !".format(infections))
     return infections
 
-res = solve2((Input(DAY).readlines()), 10000000)
-print(res)
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1((Input(DAY).readlines()), 10000)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert(solve1(teststr.splitlines(), 70) == 41)
+        res = solve1(teststr.splitlines(), 10000)
+        assert res == 5587
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2((Input(DAY).readlines()), 10000000)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(teststr.splitlines(), 100)
+        assert res == 26
+        print(res)
@@ -1,5 +1,6 @@
 # Python 3.x
 
+import sys
 from collections import defaultdict
 
 from aoc_utilities import *
@@ -50,8 +51,6 @@ def solve1(instructions):
     return mulcount
 
 
-# res = solve1(Input(DAY).readlines())
-# print(res)
 
 
 def solve2(instructions):
@@ -87,5 +86,14 @@ def solve2(instructions):
     return registers['h']
 
 
-res = solve2(Input(DAY).readlines())
-print(res)
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(DAY).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        # never completed: the program has to be reverse engineered
+        res = solve2(Input(DAY).readlines())
+        print(res)
@@ -2,6 +2,7 @@
 
 import re
 import math
+import sys
 
 from itertools import count
 
@@ -40,13 +41,8 @@ def find_square_index(square):
         return n
 
 
-assert spiral_mem(1) == 0
-assert spiral_mem(12) == 3
-assert spiral_mem(23) == 2
-assert spiral_mem(1024) == 31
-
-
-# print(spiral_mem(input1))
+def solve1(input):
+    return spiral_mem(input)
 
 
 ##################### PART 2 #########################
@@ -105,4 +101,24 @@ def part2(n):
         if x > n:
             return x
 
-print(part2(input1))
+
+def solve2(input):
+    return part2(input)
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(input1)
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert solve1(1) == 0
+        assert solve1(12) == 3
+        assert solve1(23) == 2
+        assert solve1(1024) == 31
+        print("tests passed")
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(input1)
+        print(res)
@@ -1,6 +1,7 @@
 # Python 3.x
 
 import re
+import sys
 
 # PART 1
 
@@ -16,11 +17,6 @@ def is_passphrase(words):
     return len(words) == len(set(words))
 
 
-assert is_passphrase("aa bb cc dd ee".split()) is True
-assert is_passphrase("aa bb cc dd aa".split()) is False
-assert is_passphrase("aa bb cc dd aaa".split()) is True
-
-
 def parse_words(text):
     "All the words in text"
     return re.findall(r'\w+', text)
@@ -30,7 +26,10 @@ def count_valid_passphrases(text):
     passphrases = [parse_words(line) for line in text]
     return sum(map(is_passphrase, passphrases))
 
-# print(count_valid_passphrases(Input(4)))
+
+def solve1(lines):
+    return count_valid_passphrases(lines)
+
 
 # PART 2
 
@@ -39,15 +38,34 @@ def sort_letter(word):
     return ''.join(sorted(word))
 
 
-assert is_passphrase(list(map(sort_letter, "abcde fghij".split()))) is True
-assert is_passphrase(list(map(sort_letter, "abcde xyz ecdab".split()))) is False
-assert is_passphrase(list(map(sort_letter, "a ab abc abd abf abj".split()))) is True
-assert is_passphrase(list(map(sort_letter, "iiii oiii ooii oooi oooo".split()))) is True
-assert is_passphrase(list(map(sort_letter, "oiii ioii iioi iiio".split()))) is False
-
-
 def count_valid_passphrases2(text):
     passphrases = [list(map(sort_letter, parse_words(line))) for line in text]
     return sum(map(is_passphrase, passphrases))
 
-print(count_valid_passphrases2(Input(4)))
+
+def solve2(lines):
+    return count_valid_passphrases2(lines)
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(4).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert solve1(["aa bb cc dd ee"]) == 1
+        assert solve1(["aa bb cc dd aa"]) == 0
+        assert solve1(["aa bb cc dd aaa"]) == 1
+        print("tests passed")
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(4).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        assert solve2(["abcde fghij"]) == 1
+        assert solve2(["abcde xyz ecdab"]) == 0
+        assert solve2(["a ab abc abd abf abj"]) == 1
+        assert solve2(["iiii oiii ooii oooi oooo"]) == 1
+        assert solve2(["oiii ioii iioi iiio"]) == 0
+        print("tests passed")
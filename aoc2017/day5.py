@@ -1,6 +1,7 @@
 # Python 3.x
 
 import re
+import sys
 
 # PART 1
 
@@ -38,10 +39,8 @@ def count_steps(l):
     return counter
 
 
-assert parse_input(teststr) == [0, 3, 0, 1, -3]
-assert count_steps(parse_input(teststr)) == 5
-
-# count_steps([int(x) for x in Input(5)])
+def solve1(lines):
+    return count_steps([int(x) for x in lines])
 
 
 # part 2
@@ -62,9 +61,31 @@ def count_steps2(l):
         counter += 1
 
     # print('index is {}, counter is {}, list is {}'.format(index, counter, str(l)))
-    print('Inscruction list exited after {} steps.'.format(counter))
+    # print('Inscruction list exited after {} steps.'.format(counter))
     return counter
 
-assert count_steps2(parse_input(teststr)) == 10
 
-count_steps2([int(x) for x in Input(5)])
+def solve2(lines):
+    return count_steps2([int(x) for x in lines])
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(5))
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        assert parse_input(teststr) == [0, 3, 0, 1, -3]
+        res = solve1(teststr.splitlines())
+        assert res == 5
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(5))
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(teststr.splitlines())
+        assert res == 10
+        print(res)
+
@@ -2,6 +2,9 @@
 
 import re
 import operator
+import sys
+
+from aoc_utilities import cycles
 
 def Input(day):
     "Open this day's input file."
@@ -17,39 +20,47 @@ def parse_input(text):
 
 # PART 1
 
-def cycles(allocation):
-    hist = set()
-    counter = 0
-
-    while tuple(allocation) not in hist:
-        counter += 1
-        hist.add(tuple(allocation))
-        # value and index of max :
-        index, value = max(enumerate(allocation), key=operator.itemgetter(1))
-        allocation[index] = 0
-        for i in range(index + 1, index + value + 1):
-            allocation[i % len(allocation)] += 1
-
-    return counter, allocation
+def redistribute(banks):
+    """returns the banks after one redistribution cycle (banks are a tuple
+    so that cycle detection can compare them)"""
+    allocation = list(banks)
+    # value and index of max :
+    index, value = max(enumerate(allocation), key=operator.itemgetter(1))
+    allocation[index] = 0
+    for i in range(index + 1, index + value + 1):
+        allocation[i % len(allocation)] += 1
+    return tuple(allocation)
 
 
-assert cycles([0, 2, 7, 0])[0] == 5
-
-print(cycles([int(x) for x in parse_input(Input(6).read())]))
-# count_steps([int(x) for x in Input(5)])
+def solve1(text):
+    # the first repeated configuration is the first state of the loop seen
+    # a second time: after going through the lead-in and the loop once
+    loop = cycles.brent(redistribute, tuple(int(x) for x in parse_input(text)))
+    return loop.start + loop.length
 
 
 # part 2
-# adapted return of function from part1
-# from
-#       return counter
-# to
-#       return counter, allocation
-# to avoid rewriting new function
-
 
-def part2(allocation):
-    recurring_state = cycles(allocation)[1]
-    return cycles(recurring_state)[0]
 
-print(part2([int(x) for x in parse_input(Input(6).read())]))
+def solve2(text):
+    return cycles.brent(redistribute, tuple(int(x) for x in parse_input(text))).length
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(6).read())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1("0 2 7 0")
+        assert res == 5
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(6).read())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2("0 2 7 0")
+        assert res == 4
+        print(res)
@@ -1,6 +1,7 @@
 # Python 3.x
 
 import re
+import sys
 
 def Input(day):
     "Open this day's input file."
@@ -52,11 +53,8 @@ def find_root(lines):
     return (nodes - children).pop()
 
 
-assert find_root(test_input.split('\n')) == "tknk"
-
-
-print(find_root(Input(7).readlines()))
-# ykpsek
+def solve1(lines):
+    return find_root(lines)
 
 # part 2
 
@@ -101,5 +99,23 @@ def part2(lines, node):
     children, parent, weight = build_objects(lines)
     return child_values(node, children, parent, weight)
 
-# part2(Input(7).readlines(), find_root(lines))
-print(part2(Input(7).readlines(), "uduyfo"))
+
+def solve2(lines):
+    # the unbalanced node and the weights of its children are printed on the way
+    return part2(lines, "uduyfo")
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(7).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(test_input.split('\n'))
+        assert res == "tknk"
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(7).readlines())
+        print(res)
@@ -1,6 +1,7 @@
 # Python 3.x
 
 import re
+import sys
 from collections import defaultdict
 
 
@@ -37,13 +38,34 @@ def reg_max(lines):
     return max(registers.values()), maxv
 
 
-assert reg_max(test_input.split('\n'))[0] == 1
-assert reg_max(test_input.split('\n'))[1] == 10
-
-print(reg_max(Input(8).readlines()))
-
+def solve1(lines):
+    return reg_max(lines)[0]
 
 
 # part 2
 #
 # amended reg_max with lines containing maxv
+
+
+def solve2(lines):
+    return reg_max(lines)[1]
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(8).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '1t':
+        res = solve1(test_input.split('\n'))
+        assert res == 1
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(8).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2t':
+        res = solve2(test_input.split('\n'))
+        assert res == 10
+        print(res)
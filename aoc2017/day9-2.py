@@ -1,3 +1,7 @@
+import re
+import sys
+
+
 def Input(day):
     "Open this day's input file."
     filename = './input_files/input{}.txt'.format(day)
@@ -20,18 +24,18 @@ def process_input(input_str: str, only_yield_garbage=False):
         if ignore_next:  # This char has to be ignored
             ignore_next = False  # Disable ignoring
             continue  # Discard this char
-        if char is '!':  # This char says that the next one has to be discarded
+        if char == '!':  # This char says that the next one has to be discarded
             ignore_next = True  # Enable ignoring
             continue  # Discard this char
         # --------------------
 
         # Handle garbage:
         # Everything after '<' is garbage:
-        if not discard_garbage and char is '<':
+        if not discard_garbage and char == '<':
             discard_garbage = True
             continue
         # Everything after '>' is not garbage anymore:
-        if discard_garbage and char is '>':
+        if discard_garbage and char == '>':
             discard_garbage = False
             continue
 
@@ -55,7 +59,6 @@ def solve_part_1(puzzle_input):
             group_depth -= 1  # Left one group => went one up
     return score
 
-print(solve_part_1(Input(9).readlines()[0]))
 
 def solve_part_2(puzzle_input):
     garbage_count = 0  # Counts the amount of garbage chars
@@ -63,4 +66,22 @@ def solve_part_2(puzzle_input):
         garbage_count += 1
     return garbage_count
 
-print(solve_part_2(Input(9).readlines()[0]))
+
+def solve1(lines):
+    return solve_part_1(lines[0])
+
+
+def solve2(lines):
+    return solve_part_2(lines[0])
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1(Input(9).readlines())
+        print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2(Input(9).readlines())
+        print(res)
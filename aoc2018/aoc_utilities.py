@@ -1,3 +1,4 @@
+import io
 import re
 
 
@@ -9,7 +10,8 @@ def parse_words(text):
 def Input(day):
     "Open this day's input file."
     filename = './input_files/input{}.txt'.format(day)
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def neighbors_4(pos):
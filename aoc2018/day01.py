@@ -1,5 +1,8 @@
 # Python 3.x
 from aoc_utilities import Input
+import itertools
+import sys
+from collections import defaultdict
 
 # day must be 2 digit
 DAY = '01'
@@ -17,26 +20,53 @@ def solve1(input):
 
     return freq
 
-# res = solve1((Input(DAY).readlines()))
-# print(res)
 
 """
 PART 2
 """
-import itertools
 
 
 def solve2(input):
-    freq = 0
+    deltas = [int(delta) for delta in input]
+    freqs = list(itertools.accumulate(deltas))  # reached during the first pass
     freq_set = set([])
-
-    for delta in itertools.cycle(input):
-        freq += int(delta)
+    for freq in freqs:
         if freq in freq_set:
             return freq
-        else:
-            freq_set.add(freq)
+        freq_set.add(freq)
 
+    total = freqs[-1]
+    if total == 0:
+        # the second pass goes through the same frequencies again
+        return freqs[0]
+
+    # instead of cycling through the input until a frequency repeats: pass k
+    # reaches freqs[i] + k * total, which is freqs[j] when
+    # freqs[j] - freqs[i] = k * total. Only frequencies congruent modulo total
+    # can meet, and the first repeat is the one with the smallest k, then the
+    # smallest i.
+    groups = defaultdict(list)
+    for i, freq in enumerate(freqs):
+        groups[freq % total].append((freq, i))
+    first = None
+    for group in groups.values():
+        group.sort(reverse=total < 0)
+        for (freq_i, i), (freq_j, _) in zip(group, group[1:]):
+            k = (freq_j - freq_i) // total
+            if first is None or (k, i) < first[:2]:
+                first = (k, i, freq_j)
+    # no repeat at all when every frequency is alone modulo total
+    return None if first is None else first[2]
+
+
+"""
+Use script args to execute the right function.
+"""
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '1':
+        res = solve1((Input(DAY).readlines()))
+        print(res)
 
-res = solve2((Input(DAY).readlines()))
-print(res)
+    if len(sys.argv) > 1 and sys.argv[1] == '2':
+        res = solve2((Input(DAY).readlines()))
+        print(res)
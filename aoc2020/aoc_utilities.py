@@ -1,5 +1,14 @@
+import io
+import os
 import re
-from itertools import product 
+import sys
+from itertools import product
+
+# the repo-level `aoc` package (python -m aoc) holds the tooling shared by every year
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc.cache import cached_parser  # noqa: E402, F401
+from aoc.grid import Grid  # noqa: E402, F401
 
 
 def parse_words(text):
@@ -10,13 +19,15 @@ def parse_words(text):
 def Input(day):
     "Open this day's input file."
     filename = './input_files/input{}.txt'.format(day)
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def test_input(day):
     "Open this day's test input file"
     filename = './input_files/input{}.test.txt'.format(day)
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def get_neighbors(point):
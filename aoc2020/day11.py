@@ -3,180 +3,72 @@
 
 import os
 import sys
-from aoc_utilities import Input, test_input, neighbors_8
-# import re
-# import itertools
+from aoc_utilities import Input, test_input, Grid
+# aoc_utilities puts the repo root on sys.path
+from aoc.automaton import gathered_sum, neighbour_sum, run, MOORE
+import numpy as np
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
+FLOOR, EMPTY, OCCUPIED = ord("."), ord("L"), ord("#")
+
 
 def parser(data):
-    grid = []
-    for line in data:
-        grid.append([x for x in line])
-    return grid
+    """seats as a (height, width) array of the input bytes"""
+    return Grid.from_lines(data).as_array().copy()
 
 
-def gprint(grid):
-    for line in grid:
-        print(''.join(line))
+def gprint(seats):
+    for line in seats:
+        print(bytes(line).decode())
     return None
 
 
-def adjacent_seats_values(grid, pos):
-    values = []
-    for s in neighbors_8(pos):
-        if 0 <= s[0] < len(grid[0]) and 0 <= s[1] < len(grid):
-            # s is a valid position in the grid
-            values.append(grid[s[1]][s[0]])
-    return values
-
-
-def round(grid):
-    new_grid = []
-    for y, line in enumerate(grid):
-        new_line = []
-        for x, value in enumerate(line):
-            adj_seats_vals = adjacent_seats_values(grid, (x, y))
-            if value == 'L':
-                if "#" not in adj_seats_vals:
-                    new_line.append("#")
-                else:
-                    new_line.append("L")
-            elif value == "#":
-                if adj_seats_vals.count("#") >= 4:
-                    new_line.append("L")
-                else:
-                    new_line.append("#")
-            elif value == ".":
-                new_line.append(".")
-        new_grid.append(new_line)
-    return new_grid
+def seat_rule(tolerance):
+    """empty seats with no occupied neighbour get occupied, occupied seats
+    with at least `tolerance` occupied neighbours get empty"""
+
+    def rule(seats, occupied_neighbours):
+        seats = seats.copy()
+        seats[(seats == EMPTY) & (occupied_neighbours == 0)] = OCCUPIED
+        # neighbours were counted on the previous seats: occupied ones only
+        # became occupied this round if they had no neighbour at all
+        seats[(seats == OCCUPIED) & (occupied_neighbours >= tolerance)] = EMPTY
+        return seats
+
+    return rule
 
 
 def solve1(data):
     """Solves part 1."""
-    grid = parser(data)
-    while grid != round(grid):
-        grid = round(grid)
-    return [val for line in grid for val in line].count("#")
-
-
-def is_in_grid(s, grid):
-    return 0 <= s[0] < len(grid[0]) and 0 <= s[1] < len(grid)
-
-
-def gval(s, grid):
-    return grid[s[1]][s[0]]
-
-
-def adjacent_seats_values2(grid, pos):
-    """"returns the values of the first seat pos can see in each of eight directions"""
-    values = []
-
-    # up
-    s = pos
-    while is_in_grid((s[0], s[1] + 1), grid) and grid[s[1] + 1][s[0]] == ".":
-        s = (s[0], s[1] + 1)
-    adj = (s[0], s[1] + 1)
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # down
-    s = pos
-    while is_in_grid((s[0], s[1] - 1), grid) and grid[s[1] - 1][s[0]] == ".":
-        s = (s[0], s[1] - 1)
-    adj = (s[0], s[1] - 1)
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # left
-    s = pos
-    while is_in_grid((s[0] - 1, s[1]), grid) and grid[s[1]][s[0] - 1] == ".":
-        s = (s[0] - 1, s[1])
-    adj = (s[0] - 1, s[1])
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # right
-    s = pos
-    while is_in_grid((s[0] + 1, s[1]), grid) and grid[s[1]][s[0] + 1] == ".":
-        s = (s[0] + 1, s[1])
-    adj = (s[0] + 1, s[1])
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # up-left
-    s = pos
-    while is_in_grid(
-        (s[0] - 1, s[1] + 1), grid) and grid[s[1] + 1][s[0] - 1] == ".":
-        s = (s[0] - 1, s[1] + 1)
-    adj = (s[0] - 1, s[1] + 1)
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # up-right
-    s = pos
-    while is_in_grid(
-        (s[0] + 1, s[1] + 1), grid) and grid[s[1] + 1][s[0] + 1] == ".":
-        s = (s[0] + 1, s[1] + 1)
-    adj = (s[0] + 1, s[1] + 1)
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # down-left
-    s = pos
-    while is_in_grid(
-        (s[0] - 1, s[1] - 1), grid) and grid[s[1] - 1][s[0] - 1] == ".":
-        s = (s[0] - 1, s[1] - 1)
-    adj = (s[0] - 1, s[1] - 1)
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    # up-right
-    s = pos
-    while is_in_grid(
-        (s[0] + 1, s[1] - 1), grid) and grid[s[1] - 1][s[0] + 1] == ".":
-        s = (s[0] + 1, s[1] - 1)
-    adj = (s[0] + 1, s[1] - 1)
-    if is_in_grid(adj, grid):
-        values.append(gval(adj, grid))
-
-    return values
-
-
-def round2(grid):
-    new_grid = []
-    for y, line in enumerate(grid):
-        new_line = []
-        for x, value in enumerate(line):
-            adj_seats_vals = adjacent_seats_values2(grid, (x, y))
-            if value == 'L':
-                if "#" not in adj_seats_vals:
-                    new_line.append("#")
-                else:
-                    new_line.append("L")
-            elif value == "#":
-                if adj_seats_vals.count("#") >= 5:
-                    new_line.append("L")
-                else:
-                    new_line.append("#")
-            elif value == ".":
-                new_line.append(".")
-        new_grid.append(new_line)
-    return new_grid
+    seats = parser(data)
+    seats, _ = run(seats, seat_rule(4), lambda s: neighbour_sum(s == OCCUPIED))
+    return int((seats == OCCUPIED).sum())
+
+
+def visible_seats(seats):
+    """(8, height * width) table of the flat index of the first seat visible
+    in each direction, seats.size when there is none (see gathered_sum)"""
+    height, width = seats.shape
+    table = np.full((len(MOORE), height * width), seats.size, dtype=np.intp)
+    for k, (dy, dx) in enumerate(MOORE):
+        for y, x in zip(*np.nonzero(seats != FLOOR)):
+            ny, nx = y + dy, x + dx
+            while 0 <= ny < height and 0 <= nx < width and seats[ny, nx] == FLOOR:
+                ny, nx = ny + dy, nx + dx
+            if 0 <= ny < height and 0 <= nx < width:
+                table[k, y * width + x] = ny * width + nx
+    return table
 
 
 def solve2(data):
     """Solves part2."""
-    grid = parser(data)
-    while 1:
-        new_grid = round2(grid)
-        if new_grid == grid:
-            break
-        grid = new_grid
-    return [val for line in new_grid for val in line].count("#")
+    seats = parser(data)
+    # floor never changes: who sees whom is computed once for all rounds
+    table = visible_seats(seats)
+    seats, _ = run(seats, seat_rule(5), lambda s: gathered_sum(s == OCCUPIED, table))
+    return int((seats == OCCUPIED).sum())
 
 
 """
@@ -5,21 +5,13 @@ import os
 import sys
 
 from aoc_utilities import Input, test_input
-from itertools import product
-from operator import itemgetter
+# aoc_utilities puts the repo root on sys.path
+from aoc.sparse import moore, run
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
 
-def neighbors_26(point):
-    """returns a set of (x,y,z) positions for the 26 positions around point """
-    x = [point[0] - 1, point[0], point[0] + 1]
-    y = [point[1] - 1, point[1], point[1] + 1]
-    z = [point[2] - 1, point[2], point[2] + 1]
-    return set(product(x, y, z)) - set([point])
-
-
 def parser(data):
     """returns a list of list of coordinates (tuples) of acitvated cubes"""
     activated_cubes = []
@@ -40,33 +32,6 @@ def get_bounds(grid):
                                                                  max(zlist)))
 
 
-def cycle(grid):
-    """returns the grid resulting of a cycle on the input grid"""
-
-    bounds = get_bounds(grid)
-    new_grid = []
-
-    for x in range(bounds[0][0] - 1, bounds[0][1] + 2):
-        for y in range(bounds[1][0] - 1, bounds[1][1] + 2):
-            for z in range(bounds[2][0] - 1, bounds[2][1] + 2):
-                neighbors = neighbors_26((x, y, z))
-                active_neighbors = []
-                for n in neighbors:
-                    if n in grid:
-                        active_neighbors.append(n)
-                if (x, y, z) in grid and 2 <= len(active_neighbors) <= 3:
-                    #                    print(
-                    #                        f'({x}, {y}, {z}) remains active thanks to {active_neighbors}'
-                    #                    )
-                    new_grid.append((x, y, z))
-                if (x, y, z) not in grid and len(active_neighbors) == 3:
-                    #                    print(
-                    #                        f'({x}, {y}, {z}) becomes active thanks to {active_neighbors}'
-                    #                    )
-                    new_grid.append((x, y, z))
-    return new_grid
-
-
 def gprint(grid, z):
     """pretty print of the grid"""
     bounds = get_bounds(grid)
@@ -85,9 +50,8 @@ def gprint(grid, z):
 def solve1(data):
     """Solves part 1."""
     nb_cycle = 6
-    grid = parser(data)
-    for _ in range(nb_cycle):
-        grid = cycle(grid)
+    # the seed lies in z = 0, so the pocket dimension stays symmetric around it
+    grid = run(parser(data), nb_cycle, moore(3), mirrored=(2,))
 
     # print(grid)
     # bounds = get_bounds(grid)
@@ -105,15 +69,6 @@ def solve1(data):
 #
 
 
-def neighbors_80(point):
-    """returns a set of (x,y,z) positions for the 26 positions around point """
-    x = [point[0] - 1, point[0], point[0] + 1]
-    y = [point[1] - 1, point[1], point[1] + 1]
-    z = [point[2] - 1, point[2], point[2] + 1]
-    w = [point[3] - 1, point[3], point[3] + 1]
-    return set(product(x, y, z, w)) - set([point])
-
-
 def parser2(data):
     """returns a list of list of coordinates (tuples) of acitvated cubes"""
     active_cubes = set()
@@ -124,47 +79,10 @@ def parser2(data):
     return active_cubes
 
 
-def get_bounds2(grid):
-    """returns min and max index used in each dimention"""
-    ndims = len(next(iter(grid)))
-    bounds = []
-
-    for i in range(ndims):
-        lo = min(map(itemgetter(i), grid))
-        hi = max(map(itemgetter(i), grid))
-        bounds.append((lo, hi))
-    return bounds
-
-
-def cycle2(grid):
-    """returns the grid resulting of a cycle on the input grid"""
-
-    bounds = get_bounds2(grid)
-    new_grid = set()
-
-    for x in range(bounds[0][0] - 1, bounds[0][1] + 2):
-        for y in range(bounds[1][0] - 1, bounds[1][1] + 2):
-            for z in range(bounds[2][0] - 1, bounds[2][1] + 2):
-                for w in range(bounds[3][0] - 1, bounds[3][1] + 2):
-                    cube = (x, y, z, w)
-                    neighbors = neighbors_80(cube)
-                    active_neighbors = []
-                    for n in neighbors:
-                        if n in grid:
-                            active_neighbors.append(n)
-                    if cube in grid and 2 <= len(active_neighbors) <= 3:
-                        new_grid.add(cube)
-                    if cube not in grid and len(active_neighbors) == 3:
-                        new_grid.add(cube)
-    return new_grid
-
-
 def solve2(data):
     """Solves part2."""
     nb_cycle = 6
-    grid = parser2(data)
-    for _ in range(nb_cycle):
-        grid = cycle2(grid)
+    grid = run(parser2(data), nb_cycle, moore(4), mirrored=(2, 3))
     return len(grid)
 
 
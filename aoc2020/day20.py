@@ -9,7 +9,7 @@ import re
 
 from collections import defaultdict
 
-from aoc_utilities import Input, test_input
+from aoc_utilities import Input, test_input, cached_parser
 
 from functools import reduce
 import operator
@@ -18,6 +18,7 @@ import operator
 DAY = os.path.basename(__file__)[3:5]
 
 
+@cached_parser
 def parser(data):
     tiles = {}
     raw_tiles = data.strip().split("\n\n")
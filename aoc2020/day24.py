@@ -4,6 +4,8 @@
 import os
 import sys
 from aoc_utilities import Input, test_input
+# aoc_utilities puts the repo root on sys.path
+from aoc.sparse import run
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
@@ -34,15 +36,15 @@ def line_parser(line):
 
 
 def build_grid(data):
-    """return a list of black tiles positions (as complex numbers)"""
+    """return the set of black tiles positions (as complex numbers)"""
     data = data.splitlines()
-    blacks = []
+    blacks = set()
     for line in data:
         line = line_parser(line)
         tile = complex(0, 0)
         for direction in line:
             tile += dz[direction]
-        blacks.remove(tile) if tile in blacks else blacks.append(tile)
+        blacks ^= {tile}
     return blacks
 
 
@@ -51,43 +53,18 @@ def solve1(data):
     return len(build_grid(data))
 
 
-def neighbors(tile):
-    """return a list of the positions of the 6 hexagons (as complexe numbers)
-    adjacent to the cell in input"""
-    neighbor = []
-    for vector in dz.values():
-        neighbor.append(tile + vector)
-    return neighbor
-
-
-def evolve(grid):
-    """takes the list of black tiles position on one day
-    returns the list of black tiles position the day after"""
-    new_grid = set()
-    for black in grid:
-        count = 0
-        for n in neighbors(black):
-            if n in grid:
-                count += 1
-            else:
-                # n is a white tile that has at least 1 black neighbor, let's count them all :
-                count2 = 0
-                for n2 in neighbors(n):
-                    if n2 in grid:
-                        count2 += 1
-                if count2 == 2:
-                    new_grid.add(n)
-        if count in (1, 2):
-            new_grid.add(black)
-    return new_grid
-
-
 def solve2(data):
     """Solves part2."""
     grid = build_grid(data)
-
-    for _ in range(100):
-        grid = evolve(grid)
+    # black tiles with 0 or more than 2 black neighbours flip to white,
+    # white tiles with exactly 2 black neighbours flip to black
+    grid = run(
+        {(int(z.real), int(z.imag)) for z in grid},
+        100,
+        [(int(z.real), int(z.imag)) for z in dz.values()],
+        born={2},
+        survive={1, 2},
+    )
 
     return len(grid)
 
@@ -4,11 +4,12 @@
 import os
 import sys
 import re
-from aoc_utilities import Input, test_input
+from aoc_utilities import Input, test_input, cached_parser
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
+@cached_parser
 def parser1(data):
     """
     takes in input
@@ -52,6 +53,7 @@ def solve1(data):
     return sum([1 for x in vents if vents[x]>=2])
 
 
+@cached_parser
 def parser2(data):
     """
     takes in input
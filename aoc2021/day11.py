@@ -3,59 +3,47 @@
 
 import os
 import sys
-from aoc_utilities import Input, test_input, neighbors_all
+from aoc_utilities import Input, test_input, Grid
+# aoc_utilities puts the repo root on sys.path
+from aoc.automaton import neighbour_sum
+import numpy as np
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
 
 def parser(data):
-    energy_levels = {}
-    for row, line in enumerate(data.splitlines()):
-        for column, energy_level in enumerate(line):
-            energy_levels[(row, column)] = int(energy_level)
-    return energy_levels
+    """energy levels as a (rows, columns) array"""
+    return Grid.from_text(data).as_array() - ord("0")
 
 
 def evolve(levels):
-    flashes = 0
-
     # part 1
-    for k in levels.keys():
-        levels[k] += 1
-
-    # part 2
-    flashing_points = set([k for k,v in levels.items() if v > 9 ] )
-    while len(flashing_points) > 0:
-        p = flashing_points.pop()
-        for n in neighbors_all(p):
-            if n in levels.keys():
-                levels[n] += 1
+    levels += 1
 
-                # add to flashing_points *just* when the energy level go over the threshold
-                if levels[n] == 10:
-                    flashing_points.add(n)
+    # part 2: a flash raises the neighbours, which can flash in turn
+    flashed = np.zeros(levels.shape, dtype=bool)
+    flashing = levels > 9
+    while flashing.any():
+        flashed |= flashing
+        levels += neighbour_sum(flashing)
+        flashing = (levels > 9) & ~flashed
 
     # part 3
-    for k, v in levels.items():
-        if v > 9:
-            flashes += 1
-            levels[k] = 0
+    levels[flashed] = 0
 
-    return levels, flashes
+    return levels, int(flashed.sum())
 
 
 def lprint(levels):
-    max_row = max([int(i) for (i,j) in levels.keys()])
-    max_col = max([int(j) for (i,j) in levels.keys()])
-    for r in range(max_row + 1):
-        print(''.join([str(levels[(r,c)]) for c in range(max_col + 1)]))
+    for row in levels:
+        print(''.join(str(v) for v in row))
     return
 
 
 def solve1(data):
     """Solves part 1."""
-    levels = parser(data)
+    levels = parser(data).astype(np.int32)
     flashes = 0
 
     for _ in range(100):
@@ -65,20 +53,17 @@ def solve1(data):
     return flashes
 
 
-
-
 def solve2(data):
     """Solves part2."""
-    levels = parser(data)
+    levels = parser(data).astype(np.int32)
     step = 0
     flashes = 0
-    levels, additional_flashes = evolve(levels)
 
-    while flashes != 100:
+    while flashes != levels.size:
         levels, flashes = evolve(levels)
         step += 1
 
-    return step + 1
+    return step
 
 
 """
@@ -1,6 +1,18 @@
+import io
+import os
 import re
+import sys
 from itertools import product
-import operator, time
+import functools
+import operator
+
+# the repo-level `aoc` package (python -m aoc) holds the tooling shared by every year
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import cycles, parallel, search  # noqa: E402, F401
+from aoc.cache import cached_parser  # noqa: E402, F401
+from aoc.grid import Grid  # noqa: E402, F401
+from aoc.timing import timed  # noqa: E402
 
 OPS = {
     "+": operator.add,
@@ -20,13 +32,15 @@ def parse_words(text):
 def Input(day):
     "Open this day's input file."
     filename = "./input_files/input{}.txt".format(day)
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def test_input(day):
     "Open this day's test input file"
     filename = "./input_files/input{}.test.txt".format(day)
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def neighbors_all(point):
@@ -90,11 +104,12 @@ def timer_func(func):
     # This function shows the execution time of
     # the function object passed
     # (to be used as a wraper)
+    # the measure is also recorded in the aoc.timing registry (cpu time, memory, ...)
+    @functools.wraps(func)
     def wrap_func(*args, **kwargs):
-        t1 = time.time()
-        result = func(*args, **kwargs)
-        t2 = time.time()
-        print(f"Function {func.__name__!r} executed in {(t2 - t1):.4f}s")
+        with timed(func.__name__) as t:
+            result = func(*args, **kwargs)
+        print(f"Function {func.__name__!r} executed in {t.wall:.4f}s")
         return result
 
     return wrap_func
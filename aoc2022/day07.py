@@ -3,106 +3,81 @@
 
 import os
 import sys
-import networkx as nx
+from array import array
 from aoc_utilities import Input, test_input
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
 
+def directory_sizes(lines):
+    """Total size of every directory, in one pass over the terminal lines.
+
+    Only the directories from / to the current one are kept, as a stack of
+    running totals: when a directory is left its total is final, and added
+    to its parent's. Sizes come out as an array, children before their
+    parent and / last.
+    """
+    sizes = array("q")
+    totals = [0]  # / at the bottom
+
+    def leave():
+        size = totals.pop()
+        sizes.append(size)
+        if totals:
+            totals[-1] += size
+
+    for line in lines:
+        if line.startswith("$ cd "):
+            name = line[5:].strip()
+            if name == "/":
+                while len(totals) > 1:
+                    leave()
+            elif name == "..":
+                leave()
+            else:
+                totals.append(0)
+        elif line[:1].isdigit():
+            # file line, "$ ls" and "dir" lines tell nothing more
+            totals[-1] += int(line.split()[0])
+    while totals:
+        leave()
+    return sizes
+
+
+def small_directories_total(sizes):
+    return sum(size for size in sizes if size < 100000)
+
+
+def smallest_to_free(sizes):
+    used_space = sizes[-1]
+    min_size_to_free = used_space - 70000000 + 30000000
+    return min(size for size in sizes if size > min_size_to_free)
+
+
 def solve1(data):
     """Solves part 1."""
-    data = data.splitlines()
-    G = nx.DiGraph()
-
-    # initialization
-    i = 1
-    G.add_node("/", size=0, type="dir")
-    current_node = "/"
-
-    while i < len(data):
-        line = data[i].split(" ")
-        if line[0] == "$":
-            i += 1
-            if line[1] == "cd":
-                if line[2] == "..":
-                    current_node = list(G.predecessors(current_node))[0]
-                else:
-                    current_node = current_node + line[2] + "/"
-        else:
-            if line[0] == "dir":
-                new_node = current_node + line[1] + "/"
-                G.add_node(new_node, size=0, type="dir")
-                G.add_edge(current_node, new_node)
-                i += 1
-            else:
-                # it's a "file line" !
-                new_node = current_node + line[1]
-                G.add_node(new_node, size=line[0], type="file")
-                G.add_edge(current_node, new_node)
-                for ancestor in nx.ancestors(G, new_node):
-                    G.nodes[ancestor]["size"] += int(line[0])
-                i += 1
-    return sum(
-        [
-            G.nodes[n]["size"]
-            for n in G
-            if (G.nodes[n]["type"] == "dir" and G.nodes[n]["size"] < 100000)
-        ]
-    )
+    return small_directories_total(directory_sizes(data.splitlines()))
 
 
 def solve2(data):
     """Solves part2."""
-    data = data.splitlines()
-    G = nx.DiGraph()
-
-    # initialization
-    i = 1
-    G.add_node("/", size=0, type="dir")
-    current_node = "/"
-
-    while i < len(data):
-        line = data[i].split(" ")
-        if line[0] == "$":
-            i += 1
-            if line[1] == "cd":
-                if line[2] == "..":
-                    current_node = list(G.predecessors(current_node))[0]
-                else:
-                    current_node = current_node + line[2] + "/"
-        else:
-            if line[0] == "dir":
-                new_node = current_node + line[1] + "/"
-                G.add_node(new_node, size=0, type="dir")
-                G.add_edge(current_node, new_node)
-                i += 1
-            else:
-                # it's a "file line" !
-                new_node = current_node + line[1]
-                G.add_node(new_node, size=line[0], type="file")
-                G.add_edge(current_node, new_node)
-                for ancestor in nx.ancestors(G, new_node):
-                    G.nodes[ancestor]["size"] += int(line[0])
-                i += 1
-
-    used_space = G.nodes["/"]["size"]
-    min_size_to_free = used_space - 70000000 + 30000000
-
-    # return [G.nodes[n]["size"] for n in G if G.nodes[n]["size"] > min_size_to_free]
-    return min(
-        [
-            G.nodes[n]["size"]
-            for n in G
-            if (G.nodes[n]["type"] == "dir" and G.nodes[n]["size"] > min_size_to_free)
-        ]
-    )
+    return smallest_to_free(directory_sizes(data.splitlines()))
 
 
 """
 Use script args to execute the right function.
+Any log can also be piped in, it is never loaded in memory as a whole:
+  - python dayXX.py 1 - < terminal.log
 """
 if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[2] == "-":
+        sizes = directory_sizes(sys.stdin)
+        if sys.argv[1] == "1":
+            print(small_directories_total(sizes))
+        else:
+            print(smallest_to_free(sizes))
+        sys.exit()
     if len(sys.argv) > 1 and sys.argv[1] == "1":
         res = solve1((Input(DAY).read()))
         print(res)
@@ -3,8 +3,6 @@
 
 import os
 import sys
-import math
-import operator
 import logging
 from aoc_utilities import Input, test_input
 
@@ -19,49 +17,61 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def parser(data):
-    instructions = []
-    for line in data.splitlines():
-        direction, steps = line.split(" ")
-        instructions.append((direction, int(steps)))
-    return instructions
+MOVES = {"R": (1, 0), "L": (-1, 0), "U": (0, 1), "D": (0, -1)}
 
 
-def vsum(a, b):
-    """
-    vector sum, both vectors must be the same size
+def pack(x, y):
+    """single int for a position (|y| < 2**31)"""
+    return (x << 32) + y
+
+
+def unpack(p):
+    y = p & 0xFFFFFFFF
+    if y >= 1 << 31:
+        y -= 1 << 32
+    return (p - y) >> 32, y
+
+
+def tail_visits(lines, knots):
+    """Packed positions visited by the tail of a rope of `knots` knots.
+
+    Knots are kept in 2 lists of coordinates updated in place. A knot only
+    moves when it is 2 tiles away from the one before, by the sign of the
+    gap on each axis; as soon as a knot does not move, none of the following
+    ones does either.
     """
-    return tuple(map(operator.add, a, b))
+    xs = [0] * knots
+    ys = [0] * knots
+    visited = {pack(0, 0)}
+    for line in lines:
+        direction, steps = line.split()
+        dx, dy = MOVES[direction]
+        for _ in range(int(steps)):
+            xs[0] += dx
+            ys[0] += dy
+            for i in range(1, knots):
+                gx = xs[i - 1] - xs[i]
+                gy = ys[i - 1] - ys[i]
+                if -1 <= gx <= 1 and -1 <= gy <= 1:
+                    break
+                xs[i] += (gx > 0) - (gx < 0)
+                ys[i] += (gy > 0) - (gy < 0)
+            else:
+                # the tail moved
+                visited.add(pack(xs[-1], ys[-1]))
+    return visited
+
+
+def count_tail_positions(data, knots):
+    visited = tail_visits(data.splitlines(), knots)
+    if logger.isEnabledFor(logging.INFO):
+        tprint({unpack(p) for p in visited}, logging.INFO)
+    return len(visited)
 
 
 def solve1(data):
     """Solves part 1."""
-    instructions = parser(data)
-    hp = (0, 0)  # head position
-    tp = (0, 0)  # tail position
-    dir_vect = {
-        "R": (1, 0),
-        "L": (-1, 0),
-        "U": (0, 1),
-        "D": (0, -1),
-    }
-    tail_positions = set([])
-
-    for ins in instructions:
-        for s in range(ins[1]):
-            hp = vsum(hp, dir_vect[ins[0]])
-            logger.info(f"distance is now {math.dist(hp, tp)}")
-            if math.dist(hp, tp) > 1.5 and (hp[0] == tp[0] or hp[1] == tp[1]):
-                tp = vsum(tp, dir_vect[ins[0]])
-            elif math.dist(hp, tp) > 1.5 and (hp[0] != tp[0] and hp[1] != tp[1]):
-                move = (
-                    int(math.copysign(1, hp[0] - tp[0])),
-                    int(math.copysign(1, hp[1] - tp[1])),
-                )
-                tp = vsum(tp, move)
-            tail_positions.add(tp)
-            logger.info(f"head is at {hp}, while tail is at {tp}")
-    return len(tail_positions)
+    return count_tail_positions(data, 2)
 
 
 def tprint(positions, logLevel=30):
@@ -112,46 +122,7 @@ def rope_print(rope, logLevel=10):
 
 def solve2(data):
     """Solves part2."""
-    instructions = parser(data)
-    dir_vect = {
-        "R": (1, 0),
-        "L": (-1, 0),
-        "U": (0, 1),
-        "D": (0, -1),
-    }
-    rope = [(0, 0) for _ in range(10)]
-    tail_positions = set([])
-
-    for ins in instructions:
-        for s in range(ins[1]):
-            logger.debug(f"\nrunning step {s+1} from instruction {ins[0]} {ins[1]}")
-            rope[0] = (
-                rope[0][0] + dir_vect[ins[0]][0],
-                rope[0][1] + dir_vect[ins[0]][1],
-            )
-            for i in range(1, len(rope)):
-                # reuse var names from solve1 so I can copy paste bc I'm lazy
-                hp = rope[i - 1]
-                tp = rope[i]
-
-                if math.dist(hp, tp) > 1.5:
-                    move = (
-                        int(math.copysign(1, hp[0] - tp[0])) if hp[0] != tp[0] else 0,
-                        int(math.copysign(1, hp[1] - tp[1])) if hp[1] != tp[1] else 0,
-                    )
-                    rope[i] = (
-                        rope[i][0] + move[0],
-                        rope[i][1] + move[1],
-                    )
-                tail_positions.add(rope[9])
-                if logger.getEffectiveLevel() < 15:
-                    rope_print(rope, 10)
-        if logger.getEffectiveLevel() < 25:
-            rope_print(rope, 20)
-
-    tprint(tail_positions, 20)
-    return len(tail_positions)
-    # 2595 is too high :/
+    return count_tail_positions(data, 10)
 
 
 """
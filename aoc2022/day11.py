@@ -5,9 +5,10 @@ import os
 import sys
 import logging
 import re
-import operator
 import math
-from aoc_utilities import Input, test_input
+from collections import namedtuple
+from itertools import repeat
+from aoc_utilities import Input, cycles, parallel, test_input
 
 """
 Logger config
@@ -28,128 +29,108 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv}
+# operations: new = old + operand, old * operand, or old * old
+ADD, MUL, SQUARE = range(3)
+
+# one entry per monkey in each list
+Monkeys = namedtuple("Monkeys", "ops operands divisors if_true if_false")
 
 
 def parser(data):
-    res = []
-    monkeys = data.split("\n\n")
-    for monkey_data in monkeys:
-        monkey = {}
+    """returns the compiled Monkeys, and the items as (monkey, worry) pairs"""
+    monkeys = Monkeys([], [], [], [], [])
+    items = []
+    for i, monkey_data in enumerate(data.split("\n\n")):
         monkey_data = monkey_data.splitlines()
-        monkey["starting_items"] = [int(x) for x in re.findall(r"\d+", monkey_data[1])]
-        operation = monkey_data[2].split(" ")[-2]
-        operand = monkey_data[2].split(" ")[-1]
-        if operation == "*" and operand == "old":
-            monkey["operation"] = {
-                "operator": operator.pow,
-                "operand": 2,
-            }
+        items.extend((i, int(x)) for x in re.findall(r"\d+", monkey_data[1]))
+        operation, operand = monkey_data[2].split(" ")[-2:]
+        if operand == "old":
+            monkeys.ops.append(SQUARE)
+            monkeys.operands.append(0)
         else:
-            monkey["operation"] = {
-                "operator": OPS[operation],
-                "operand": int(operand),
-            }
-        monkey["test_division"] = int(monkey_data[3].split(" ")[-1])
-        monkey["true_recipient"] = int(monkey_data[4].split(" ")[-1])
-        monkey["false_recipient"] = int(monkey_data[5].split(" ")[-1])
-        res.append(monkey)
-    return res
+            monkeys.ops.append(ADD if operation == "+" else MUL)
+            monkeys.operands.append(int(operand))
+        monkeys.divisors.append(int(monkey_data[3].split(" ")[-1]))
+        monkeys.if_true.append(int(monkey_data[4].split(" ")[-1]))
+        monkeys.if_false.append(int(monkey_data[5].split(" ")[-1]))
+    return monkeys, items
+
+
+def inspections(monkeys, item, rounds, relief, modulus):
+    """Number of times each monkey inspects a single item in `rounds` rounds.
+
+    Items never interact, so each can be followed alone. Within a round, an
+    item keeps going while it is thrown to monkeys that play later. The
+    state of an item between rounds is (monkey, worry): as soon as a state
+    comes back, the counts are extrapolated to the last round.
+    """
+    ops, operands, divisors, if_true, if_false = monkeys
+    monkey, worry = item
+    counts = [0] * len(ops)
+    history = [counts.copy()]  # counts before each round
+    seen = {item: 0}
+    for r in range(1, rounds + 1):
+        while True:
+            counts[monkey] += 1
+            op = ops[monkey]
+            if op == ADD:
+                worry += operands[monkey]
+            elif op == MUL:
+                worry *= operands[monkey]
+            else:
+                worry *= worry
+            worry //= relief
+            if modulus:
+                worry %= modulus
+            if worry % divisors[monkey] == 0:
+                target = if_true[monkey]
+            else:
+                target = if_false[monkey]
+            # monkeys play in order: a lower one gets it in the next round
+            if target < monkey:
+                monkey = target
+                break
+            monkey = target
+        history.append(counts.copy())
+
+        state = (monkey, worry)
+        if state in seen:
+            cycle = cycles.Cycle(seen[state], r - seen[state])
+            return [
+                cycle.fast_forward(rounds, [h[m] for h in history])
+                for m in range(len(ops))
+            ]
+        seen[state] = r
+    return counts
+
+
+def monkey_business(data, rounds, relief):
+    monkeys, items = parser(data)
+    # worry only matters through its divisibility by each divisor, that
+    # stays the same modulo their lcm, unless it is divided by the relief
+    modulus = math.lcm(*monkeys.divisors) if relief == 1 else None
+
+    counts = parallel.pmap(
+        inspections,
+        repeat(monkeys, len(items)),
+        items,
+        repeat(rounds, len(items)),
+        repeat(relief, len(items)),
+        repeat(modulus, len(items)),
+    )
+    monkey_inspections = [sum(c) for c in zip(*counts, strict=True)]
+    logger.info(f"inspections per monkey: {monkey_inspections}")
+    return math.prod(sorted(monkey_inspections, reverse=True)[:2])
 
 
 def solve1(data):
     """Solves part 1."""
-    monkeys = parser(data)
-    monkey_inspections = [0] * len(monkeys)
-
-    for _ in range(20):
-        for i, monkey in enumerate(monkeys):
-            logger.debug(f"Monkey {i}:")
-            starting_items = monkey["starting_items"]
-            for item in starting_items:
-                monkey_inspections[i] += 1
-                logger.debug(f"  Monkey inspects an item with a worry level of {item}.")
-                item = monkey["operation"]["operator"](
-                    item, monkey["operation"]["operand"]
-                )
-                logger.debug(f"    Worry level increases to {item}.")
-                item = item // 3
-                logger.debug(f"    Worry level is divided by 3 to {item}.")
-                if item % monkey["test_division"] == 0:
-                    logger.debug(
-                        f"    Current worry level ({item}) is divisible by {monkey['test_division']}."
-                    )
-                    recipient = monkey["true_recipient"]
-                    logger.debug(
-                        f"    Item with worry level {item} is thrown to monkey {recipient}."
-                    )
-                else:
-                    logger.debug(
-                        f"    Current worry level ({item}) is NOT divisible by {monkey['test_division']}."
-                    )
-                    recipient = monkey["false_recipient"]
-                    logger.debug(
-                        f"    Item with worry level {item} is thrown to monkey {recipient}."
-                    )
-                monkeys[recipient]["starting_items"].append(item)
-            monkey["starting_items"] = []
-    for i, m in enumerate(monkeys):
-        logger.info(f"Monkey {i}: " + str(m["starting_items"]))
-    print(monkey_inspections)
-    return math.prod(sorted(monkey_inspections, reverse=True)[:2])
+    return monkey_business(data, 20, relief=3)
 
 
 def solve2(data):
     """Solves part2."""
-    monkeys = parser(data)
-    monkey_inspections = [0] * len(monkeys)
-
-    # worry level ("item" in part 1) will increase to level that can't be handled by the program
-    # the only important thing we do with item is to check if it's divisible by monkey["test_division"]
-    # instead of keeping track of this number, we are only going to keep track of the reminder of its value divided by
-    # the value of the product of all monkey["test_division"]. Thus :
-    #   - the number will stay low enough to be tracked,
-    #   - and its divisibility by each monkey["test_division"] will remain the same
-
-    common_multiple = math.prod([monkey["test_division"] for monkey in monkeys])
-
-    for _ in range(10000):
-        for i, monkey in enumerate(monkeys):
-            logger.debug(f"Monkey {i}:")
-            starting_items = monkey["starting_items"]
-            for item in starting_items:
-                monkey_inspections[i] += 1
-                logger.debug(f"  Monkey inspects an item with a worry level of {item}.")
-                item = (
-                    monkey["operation"]["operator"](
-                        item, monkey["operation"]["operand"]
-                    )
-                    % common_multiple
-                )
-                logger.debug(f"    Worry level reminder is now {item}.")
-
-                if item % monkey["test_division"] == 0:
-                    logger.debug(
-                        f"    Current worry level ({item}) is divisible by {monkey['test_division']}."
-                    )
-                    recipient = monkey["true_recipient"]
-                    logger.debug(
-                        f"    Item with worry level {item} is thrown to monkey {recipient}."
-                    )
-                else:
-                    logger.debug(
-                        f"    Current worry level ({item}) is NOT divisible by {monkey['test_division']}."
-                    )
-                    recipient = monkey["false_recipient"]
-                    logger.debug(
-                        f"    Item with worry level {item} is thrown to monkey {recipient}."
-                    )
-                monkeys[recipient]["starting_items"].append(item)
-            monkey["starting_items"] = []
-    for i, m in enumerate(monkeys):
-        logger.info(f"Monkey {i}: " + str(m["starting_items"]))
-    print(monkey_inspections)
-    return math.prod(sorted(monkey_inspections, reverse=True)[:2])
+    return monkey_business(data, 10000, relief=1)
 
 
 """
@@ -4,8 +4,7 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input, neighbors_4
-import networkx as nx
+from aoc_utilities import Input, test_input, Grid, search
 
 """
 Logger config
@@ -27,89 +26,41 @@ DAY = os.path.basename(__file__)[3:5]
 
 
 def get_map(data):
-    m = {}
-    for j, line in enumerate(data.splitlines()):
-        for i, c in enumerate([c for c in line]):
-            m[(i, j)] = c
-            if c == "S":
-                start = (i, j)
-            if c == "E":
-                end = (i, j)
-    return m, start, end
-
-
-def get_elevation(m, n):
-    if m[n] == "S":
-        return ord("a")
-    elif m[n] == "E":
-        return ord("z")
-    else:
-        return ord(m[n])
-
-
-def dist(n1, n2):
-    """
-    return distance bet
-    """
+    """returns the grid, the elevation of each of its cells, and the flat
+    indexes of the start and end positions"""
+    grid = Grid.from_text(data)
+    start = next(grid.find("S"))
+    end = next(grid.find("E"))
+    elevations = bytearray(grid.data)
+    elevations[start] = ord("a")
+    elevations[end] = ord("z")
+    return grid, elevations, start, end
 
 
 def solve1(data):
     """Solves part 1."""
-    m, start, end = get_map(data)
-    logger.info(f"m is {m}")
-    logger.info(f"end is {end}")
-    xmax = max([i for (i, j) in m.keys()])
-    ymax = max([j for (i, j) in m.keys()])
-
-    # build graph
-    G = nx.DiGraph()
-
-    for n in m.keys():
-        for v in neighbors_4(n):
-            if v[0] >= 0 and v[0] <= xmax and v[1] >= 0 and v[1] <= ymax:
-                if get_elevation(m, v) - get_elevation(m, n) <= 1:
-                    G.add_edge(n, v)
-                    logger.info(
-                        f"adding edge from {m[n]} (elevation = {get_elevation(m, n)}) to {m[v]} (elevation = {get_elevation(m, v)})"
-                    )
-    logger.info(f"graph is {G.edges()}")
-
-    shortest_path = nx.astar_path(G, start, end)
-    logger.info(shortest_path)
-    return len(shortest_path) - 1
+    grid, elevations, start, end = get_map(data)
+
+    def climbs(n):
+        return (v for v in grid.neighbors4(n) if elevations[v] - elevations[n] <= 1)
+
+    found = search.bfs([start], climbs, lambda n: n == end)
+    logger.info(f"search stats: {found.stats}")
+    return found.cost
 
 
 def solve2(data):
     """Solves part2."""
-    m, start, end = get_map(data)
-    logger.info(f"m is {m}")
-    logger.info(f"end is {end}")
-    xmax = max([i for (i, j) in m.keys()])
-    ymax = max([j for (i, j) in m.keys()])
-
-    # build graph
-    G = nx.DiGraph()
-
-    # initialise with a value I'm sure will be bigger than any shortest path
-    all_a_shortest_path = G.nodes()
-
-    for n in m.keys():
-        for v in neighbors_4(n):
-            if 0 <= v[0] <= xmax and 0 <= v[1] <= ymax:
-                if get_elevation(m, v) - get_elevation(m, n) <= 1:
-                    G.add_edge(n, v)
-                    logger.info(
-                        f"adding edge from {m[n]} (elevation = {get_elevation(m, n)}) to {m[v]} (elevation = {get_elevation(m, v)})"
-                    )
-    for start in [k for k, v in m.items() if v == "a"]:
-        try:  # necessary bc in the input there are some "pockets" of "a" inaccessible from other parts of the graph...
-            shortest_path = nx.astar_path(G, start, end)
-            if len(shortest_path) < len(all_a_shortest_path):
-                all_a_shortest_path = shortest_path
-        except:
-            pass
-
-    return len(all_a_shortest_path) - 1
+    grid, elevations, start, end = get_map(data)
+
+    # reverse search: walking down from the end, the first "a" reached is the
+    # one with the shortest path (some "a" are in pockets that can't reach it)
+    def descents(v):
+        return (n for n in grid.neighbors4(v) if elevations[v] - elevations[n] <= 1)
+
+    found = search.bfs([end], descents, lambda n: elevations[n] == ord("a"))
+    logger.info(f"search stats: {found.stats}")
+    return found.cost
 
 
 """
@@ -5,7 +5,6 @@ import os
 import sys
 import logging
 from aoc_utilities import Input, test_input
-from functools import cmp_to_key
 
 """
 Logger config
@@ -26,56 +25,118 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def compare(p1, p2):
-    p1_is_int = type(p1) is int
-    p2_is_int = type(p2) is int
-
-    if p1_is_int and p2_is_int:
-        return p1 - p2
-    elif p1_is_int and not p2_is_int:
-        return compare([p1], p2)
-    elif not p1_is_int and p2_is_int:
-        return compare(p1, [p2])
-    else:
-        # both are lists
-        logger.info(f"p1 is {p1}, p2 is {p2}")
-        for x, y in zip(p1, p2):
-            res = compare(x, y)
-            if res != 0:
-                return res
-
-        # zip generates a list of the size of the smallest arg
-        # if nothing has been returned yet, we need to compare the size of the lists :
-        return len(p1) - len(p2)
+# packets are streams of tokens: ints are themselves, brackets are negative
+OPEN = -1
+CLOSE = -2
+DIVIDERS = ("[[2]]", "[[6]]")
+
+
+def tokenize(line):
+    """Tokens of a packet (commas are dropped)
+
+    >>> tokenize("[1,[],[10]]")
+    [-1, 1, -1, -2, -1, 10, -2, -2]
+    """
+    tokens = []
+    number = None
+    for c in line:
+        if c.isdigit():
+            number = (number or 0) * 10 + ord(c) - 48
+            continue
+        if number is not None:
+            tokens.append(number)
+            number = None
+        if c == "[":
+            tokens.append(OPEN)
+        elif c == "]":
+            tokens.append(CLOSE)
+    if number is not None:
+        tokens.append(number)
+    return tokens
+
+
+def packets(data):
+    """Streams the packets of the input, in order, as token lists."""
+    for line in data.splitlines():
+        if line:
+            yield tokenize(line)
+
+
+def compare(a, b):
+    """Negative when packet a comes before packet b, 0 when they are equal.
+
+    Walks both token lists at once. An int compared to a list is not
+    wrapped into a new list: the brackets it would get are counted instead,
+    the opening one being matched right away and the closing ones (`due_*`)
+    read just after the int.
+    """
+    i = j = 0
+    due_a = due_b = 0  # closing brackets to read before a[i] / b[j]
+    wrap_a = wrap_b = 0  # closing brackets to read after the int a[i] / b[j]
+    while True:
+        if i == len(a) and not due_a:
+            return 0 if j == len(b) and not due_b else -1
+        if j == len(b) and not due_b:
+            return 1
+        x = CLOSE if due_a else a[i]
+        y = CLOSE if due_b else b[j]
+
+        if x >= 0 and y >= 0:
+            if x != y:
+                return x - y
+            i, j = i + 1, j + 1
+            due_a, wrap_a = wrap_a, 0
+            due_b, wrap_b = wrap_b, 0
+        elif x == y:
+            if due_a:
+                due_a -= 1
+            else:
+                i += 1
+            if due_b:
+                due_b -= 1
+            else:
+                j += 1
+        elif x == CLOSE:
+            return -1
+        elif y == CLOSE:
+            return 1
+        elif x == OPEN:
+            # y is an int: compare [...] to [y]
+            wrap_b += 1
+            i += 1
+        else:
+            wrap_a += 1
+            j += 1
+
+
+def ranks(packets, dividers):
+    """1-based positions of the dividers once packets and dividers are sorted
+    together, by counting what comes before each divider: O(n) comparisons
+    and no sort."""
+    dividers = [tokenize(d) for d in dividers]
+    before = [1 + sum(compare(e, d) < 0 for e in dividers) for d in dividers]
+    for p in packets:
+        for k, d in enumerate(dividers):
+            if compare(p, d) < 0:
+                before[k] += 1
+    return before
 
 
 def solve1(data):
     """Solves part 1."""
     s = 0  # sum of indices
-
-    for i, pairs in enumerate(data.split("\n\n"), 1):
-        # tough luck: input lines are valid python list, let's just eval() them
-        p1, p2 = map(eval, pairs.splitlines())
+    stream = packets(data)
+    for i, (p1, p2) in enumerate(zip(stream, stream, strict=True), 1):
         if compare(p1, p2) < 0:
             s += i
-            logger.info(
-                f"for pairs at indice {i}, packet {p1} is smaller than {p2}\ns is {s}\n\n"
-            )
-
+            logger.info(f"for pairs at indice {i}, packet 1 is smaller\ns is {s}\n")
     return s
 
 
 def solve2(data):
     """Solves part2."""
-    all_packets = [[[2]], [[6]]]
-
-    for pairs in data.split("\n\n"):
-        p1, p2 = map(eval, pairs.splitlines())
-        all_packets.append(p1)
-        all_packets.append(p2)
-
-    sorted_packets = sorted(all_packets, key=cmp_to_key(compare))
-    return (sorted_packets.index([[2]]) + 1) * (sorted_packets.index([[6]]) + 1)
+    first, second = ranks(packets(data), DIVIDERS)
+    return first * second
 
 
 """
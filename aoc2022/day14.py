@@ -4,7 +4,8 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input
+from aoc_utilities import Grid, Input, test_input
+from itertools import pairwise
 
 """
 Logger config
@@ -25,142 +26,79 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def mprint(m):
-    """
-    Helper function to print a map
-    when the map is a dictionary, with keys as tuples of coordinates (1,2)
-    no need to have all the coordinates in the keys
-    """
-    xmin = min([int(i) for (i, j) in m.keys()])
-    xmax = max([int(i) for (i, j) in m.keys()])
-    ymin = min([int(j) for (i, j) in m.keys()])
-    ymax = max([int(j) for (i, j) in m.keys()])
-    for y in range(ymin, ymax + 1, 1):
-        print("".join([str(m.get((x, y), ".")) for x in range(xmin, xmax + 1)]))
-    return
+SOURCE = (500, 0)
+AIR, ROCK, SAND = b".#o"
 
 
 def parser(data):
-    """returns the map"""
-    m = {}  # coordinates map
-
-    for l in data.splitlines():
-        l = l.split(" -> ")
-        for i in range(1, len(l)):
-            fromx, fromy = map(int, l[i - 1].split(","))
-            tox, toy = map(int, l[i].split(","))
-            if fromx == tox:
-                # vertical line
-                (fromy, toy) = (fromy, toy) if fromy < toy else (toy, fromy)
-                for y in range(fromy, toy + 1):
-                    m[(fromx, y)] = "#"
-            elif fromy == toy:
-                # horizontal line
-                (fromx, tox) = (fromx, tox) if fromx < tox else (tox, fromx)
-                for x in range(fromx, tox + 1):
-                    m[(x, fromy)] = "#"
-    return m
-
-
-def simulate(source, m):
+    """returns the cave as a Grid, x shifted by grid.origin
+
+    The grid is 2 rows deeper than the lowest rock, so that the row below
+    it (its OUTSIDE border) is the floor of part 2. It is wide enough for a
+    pile of sand reaching the source to fit in: sand never gets further
+    than 1 column per row from the source, rocks out of that are dropped.
     """
-    source is a tupple of coordinates, where sand originates
-    m is a dict mapping the cave
-    returns where the sand will stop if it falls from source, or an error if no place to rest
+    paths = [
+        [tuple(map(int, point.split(","))) for point in line.split(" -> ")]
+        for line in data.splitlines()
+    ]
+    height = max(y for path in paths for _, y in path) + 2
+    sx, _ = SOURCE
+    grid = Grid(2 * height + 1, height)
+    grid.origin = (sx - height, 0)
+    ox, _ = grid.origin
+    for path in paths:
+        for (fromx, fromy), (tox, toy) in pairwise(path):
+            for x in range(min(fromx, tox), max(fromx, tox) + 1):
+                for y in range(min(fromy, toy), max(fromy, toy) + 1):
+                    if (x - ox, y) in grid:
+                        grid[x - ox, y] = ROCK
+    return grid
+
+
+def pour(grid, floor):
+    """Drops grains of sand from the source until one falls off the bottom
+    of the grid (no floor), or until the source is covered, and returns the
+    number of grains at rest.
+
+    The cells a grain went through are kept on a stack: the next grain
+    falls the same way until the last of them, so it starts from there.
     """
-    sx, sy = source
-    maxy = max([y for (x, y) in m.keys()])
-
-    while sy < maxy + 1:
-
-        if (sx, sy + 1) not in m.keys():
-            logger.info("moving down")
-            sy += 1
-        elif (sx - 1, sy + 1) not in m.keys():
-            logger.info("moving diag left")
-            sx -= 1
-            sy += 1
-        elif (sx + 1, sy + 1) not in m.keys():
-            logger.info("moving diag right")
-            sx += 1
-            sy += 1
+    data = grid.data
+    below = (grid.stride, grid.stride - 1, grid.stride + 1)
+    ox, oy = grid.origin
+    path = [grid.index(SOURCE[0] - ox, SOURCE[1] - oy)]
+    units = 0
+    while path:
+        i = path[-1]
+        for offset in below:
+            c = data[i + offset]
+            if c == AIR:
+                path.append(i + offset)
+                break
+            if c == Grid.OUTSIDE and not floor:
+                # only reached from the lowest row: into the abyss
+                return units
         else:
-            # can't fall further
-            logger.info(f"found a place to rest : {sx},{sy}")
-            return (sx, sy)
-    logger.info("Sand can't final a place to rest")
-    raise AttributeError("Sand can't final a place to rest")
+            data[i] = SAND
+            path.pop()
+            units += 1
+    return units
 
 
 def solve1(data):
     """Solves part 1."""
-    m = parser(data)
-    source = (500, 0)
-    m[source] = "+"
-
-    units = 0
-
-    while True:
-        logger.info(f"\nunit of sand {units + 1}")
-        try:
-            (sx, sy) = simulate(source, m)
-            m[(sx, sy)] = "o"
-            units += 1
-            # mprint(m)
-        except AttributeError:
-            logger.info("raised exception")
-            break
-
+    grid = parser(data)
+    units = pour(grid, floor=False)
+    logger.info(grid)
     return units
 
 
-def simulate2(source, m, floory):
-    """
-    source is a tupple of coordinates, where sand originates
-    m is a dict mapping the cave
-    returns where the sand will stop if it falls from source, or an error if no place to rest
-    """
-    sx, sy = source
-    maxy = max([y for (x, y) in m.keys()])
-
-    while sy < maxy + 1:
-
-        if (sx, sy + 1) not in m.keys():
-            logger.info("moving down")
-            sy += 1
-        elif (sx - 1, sy + 1) not in m.keys():
-            logger.info("moving diag left")
-            sx -= 1
-            sy += 1
-        elif (sx + 1, sy + 1) not in m.keys():
-            logger.info("moving diag right")
-            sx += 1
-            sy += 1
-        else:
-            # can't fall further
-            logger.info(f"found a place to rest : {sx},{sy}")
-            return (sx, sy)
-    logger.info("fall on the floor")
-    return (sx, floory - 1)
-
-
 def solve2(data):
     """Solves part2."""
-    m = parser(data)
-    source = (500, 0)
-    m[source] = "+"
-    floory = max([y for (x, y) in m.keys()]) + 2
-    units = 0
-
-    while True:
-        logger.info(f"\nunit of sand {units + 1}")
-        (sx, sy) = simulate2(source, m, floory)
-        m[(sx, sy)] = "o"
-        units += 1
-        # mprint(m)
-        if (sx, sy) == source:
-            return units
-
+    grid = parser(data)
+    units = pour(grid, floor=True)
+    logger.info(grid)
     return units
 
 
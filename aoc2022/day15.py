@@ -4,9 +4,8 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input
+from aoc_utilities import Input, test_input, cached_parser
 import re
-from collections import defaultdict
 
 """
 Logger config
@@ -37,6 +36,14 @@ def parser(data):
     return m
 
 
+@cached_parser
+def sensors(data):
+    """returns a list of (sx, sy, bx, by) : each sensor with its closest beacon"""
+    return [
+        tuple(map(int, re.findall(r"=?(-?[0-9]+)", line))) for line in data.splitlines()
+    ]
+
+
 def manhattan(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
@@ -79,132 +86,84 @@ def solve1_tooslow(data):
     return len([p for (p, q), v in m.items() if (q == 2000000 and v == "#")])
 
 
-def count_points(intervals):
-    intervals = sorted(intervals)
-    logger.info(f"sorted intervals: {intervals}")
-    count = intervals[0][1] - intervals[0][0] + 1
-    right_bound = intervals[0][1]
-    logger.info(f"initializing count at {count} with interval {intervals[0]}")
-    for i in range(1, len(intervals)):
-
-        if intervals[i - 1][1] < intervals[i][1]:
-            # i is NOT included in i-1
-            if intervals[i][0] <= right_bound:
-                # there is continuity
-                count += intervals[i][1] - right_bound
-                logger.info(f"continuity, {intervals[i]} increments count to {count}")
-                right_bound = intervals[i][1]
-            else:
-                # both intervals are disjoint
-                count += intervals[i][1] - intervals[i][0] + 1
-                right_bound = intervals[i][1]
-                logger.info(f"disjoint, {intervals[i]} increments count to {count}")
-
-    return count
-
-
-def find_possible_value(intervals):
-    intervals = sorted(intervals)
-    logger.info(f"sorted intervals: {intervals}")
-    count = intervals[0][1] - intervals[0][0] + 1
-    possible_value = None
-    right_bound = intervals[0][1]
-    logger.info(f"initializing count at {count} with interval {intervals[0]}")
-    for i in range(1, len(intervals)):
-
-        if intervals[i - 1][1] < intervals[i][1]:
-            # i is NOT included in i-1
-            if intervals[i][0] - 1 <= right_bound:
-                # there is continuity
-                count += intervals[i][1] - right_bound
-                logger.info(f"continuity, {intervals[i]} increments count to {count}")
-                right_bound = intervals[i][1]
-            else:
-                # both intervals are disjoint
-                count += intervals[i][1] - intervals[i][0] + 1
-                if intervals[i][0] - right_bound == 2:
-                    possible_value = intervals[i][0] - 1
-                    return possible_value
-                right_bound = intervals[i][1]
-                logger.info(
-                    f"disjoint, {intervals[i]} increments count to {count}, possible value {possible_value}"
-                )
+def reaches(data):
+    """returns a list of (sx, sy, d): each sensor with the distance to its
+    closest beacon, that no other beacon is within"""
+    return [(sx, sy, manhattan((sx, sy), (bx, by))) for sx, sy, bx, by in sensors(data)]
 
 
-def solve1(data, row):
-    """Solves part 1."""
-    m = {}
+def row_coverage(reach, row):
+    """Merged intervals of x covered by sensors on a row, yielded from left
+    to right. Only the intervals of the row are built: O(sensors) memory,
+    whatever the width of the row."""
     intervals = []
+    for sx, sy, d in reach:
+        half = d - abs(sy - row)
+        if half >= 0:
+            # this exclusion area overlaps our row
+            intervals.append((sx - half, sx + half))
+    intervals.sort()
 
-    for line in data.splitlines():
-        sx, sy, bx, by = map(int, re.findall(r"=?(-?[0-9]+)", line))
-        m[(sx, sy)] = "S"
-        m[(bx, by)] = "B"
+    if not intervals:
+        return
+    left, right = intervals[0]
+    for lo, hi in intervals[1:]:
+        if lo > right + 1:
+            yield left, right
+            left, right = lo, hi
+        else:
+            right = max(right, hi)
+    yield left, right
 
-        # add the # where B cannot be
-        dmax = manhattan((sx, sy), (bx, by))
 
-        if sy - dmax <= row <= sy + dmax:
-            # this exclusion area overlaps our row
-            intervals.append((sx - (dmax - abs(sy - row)), sx + (dmax - abs(sy - row))))
-    return count_points(intervals) - len(
-        [p for (p, q), v in m.items() if (q == row and v == "B")]
-    )
+def solve1(data, row):
+    """Solves part 1."""
+    covered = sum(hi - lo + 1 for lo, hi in row_coverage(reaches(data), row))
+    beacons = {bx for _, _, bx, by in sensors(data) if by == row}
+    return covered - len(beacons)
 
 
-def solve1_range(data, row):
-    """Solves part 1."""
-    m = {}
-    points = set()
+def is_covered(reach, x, y):
+    return any(abs(sx - x) + abs(sy - y) <= d for sx, sy, d in reach)
 
-    for line in data.splitlines():
-        sx, sy, bx, by = map(int, re.findall(r"=?(-?[0-9]+)", line))
-        m[(sx, sy)] = "S"
-        m[(bx, by)] = "B"
 
-        # add the # where B cannot be
-        dmax = manhattan((sx, sy), (bx, by))
+def candidates(reach, cmin, cmax):
+    """Points just outside 2 sensor areas at once, or just outside one and
+    against an edge of the search box.
 
-        if sy - dmax <= row <= sy + dmax:
-            # this exclusion area overlaps our row
-            points.update(
-                range(sx - (dmax - abs(sy - row)), sx + (dmax - abs(sy - row)) + 1)
-            )
-    return len(points) - len([p for (p, q), v in m.items() if (q == row and v == "B")])
-    # 4886370
+    Rotated by 45 degrees (u = x + y, v = x - y), the area of a sensor is a
+    square, and the cells just outside it lie on 2 u lines and 2 v lines. A
+    single uncovered cell is boxed in by such lines, or by the edges of the
+    search box: it is a crossing of a u line and a v line, of one of those
+    lines and an edge, or a corner of the box.
+    """
+    us, vs = set(), set()
+    for sx, sy, d in reach:
+        us.update((sx + sy - d - 1, sx + sy + d + 1))
+        vs.update((sx - sy - d - 1, sx - sy + d + 1))
+    for u in us:
+        for v in vs:
+            if (u + v) % 2 == 0:
+                yield (u + v) // 2, (u - v) // 2
+    for c in (cmin, cmax):
+        for u in us:
+            yield c, u - c
+            yield u - c, c
+        for v in vs:
+            yield c, c - v
+            yield v + c, c
+        for c2 in (cmin, cmax):
+            yield c, c2
 
 
 def solve2(data, cmax):
     """Solves part2."""
     cmin = 0
-    intervals = defaultdict(list)
-
-    for line in data.splitlines():
-        sx, sy, bx, by = map(int, re.findall(r"=?(-?[0-9]+)", line))
-        dmax = manhattan((sx, sy), (bx, by))
-
-        for row in range(cmin, cmax + 1):
-            if sy - dmax <= row <= sy + dmax:
-                # this exclusion area overlaps our row
-                left_bound = sx - (dmax - abs(sy - row))
-                right_bound = sx + (dmax - abs(sy - row))
-
-                new_interval = (max(left_bound, cmin), min(right_bound, cmax))
-                intervals[row].append(new_interval)
-
-    for y, inters in intervals.items():
-        logger.info(f"\nexamining row {y}")
-        x = find_possible_value(inters)
-
-        if x is not None:
-            logger.warning(
-                f"possible value found at ({x},{y}) making tuning frequency to {4000000*x + y}"
-            )
-            logger.warning(f"intervals are {sorted(inters)}")
-    return
-    # 13529158836090 too high
-    # I don't know why I get 5 possible values.... I ended up testing them all, the 2nd worked...  ¯\_(ツ)_/¯
-    # it's really lame but I spent to much time on that shit for now.
+    reach = reaches(data)
+    for x, y in candidates(reach, cmin, cmax):
+        if cmin <= x <= cmax and cmin <= y <= cmax and not is_covered(reach, x, y):
+            logger.info(f"distress beacon found at ({x},{y})")
+            return 4000000 * x + y
 
 
 """
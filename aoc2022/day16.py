@@ -4,10 +4,7 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input
-import networkx as nx
-from functools import lru_cache
-
+from aoc_utilities import Input, search, test_input
 
 """
 Logger config
@@ -32,206 +29,88 @@ TIME_LIMIT2 = 26
 
 
 def parser(data):
-    G = nx.Graph()
+    """returns {valve: (rate, adjacent valves)}"""
+    valves = {}
     for line in data.splitlines():
         # Valve AA has flow rate=0; tunnels lead to valves DD, II, BB
         line = line.replace(",", "").split(" ")
         adj_valves = line[9:]
         valve = line[1]
         rate = int(line[4].replace("rate=", "").replace(";", ""))
-        G.add_node(valve, rate=rate, closed=True)
-        for v in adj_valves:
-            G.add_edge(valve, v)
-    return G
-
-
-CURRENT_MAX_EXPECTATION = -1
-
-
-def max_path(state):
-    global CURRENT_MAX_EXPECTATION
-    G = state["G"]
-    # logger.info(f"current path length is {len(state['path'])}")
-
-    # pruning
-    remaining_time = TIME_LIMIT - len(state["path"])
-
-    closed_valves = [n for n in G.nodes() if G.nodes[n]["closed"]]
-
-    remaining_rates = sorted([G.nodes[n]["rate"] for n in closed_valves], reverse=True)
-
-    if remaining_rates[0] == 0:
-        # all valves with positive flow rates are already open, nothing to gain anymore
-        print("nothing to gain anymore, cutting branch")
-        return state
-
-    potential = 0
-    for i, time in enumerate(range(remaining_time - 1, 0, -2)):
-        potential += remaining_rates[i] * time
-        if i + 2 > len(remaining_rates):
-            break
-
-    logger.info(
-        f"potential is {potential}, expected final pressure is {state['pressure_released']} current max is {CURRENT_MAX_EXPECTATION} , remaining time {remaining_time}"
-    )
-    if state["pressure_released"] + potential < CURRENT_MAX_EXPECTATION:
-        # drop this branch
-        logger.info(
-            f"droping path {state['path']}, cause potential {potential} is too low to catch up {CURRENT_MAX_EXPECTATION} with remaining time {remaining_time} while at pressure {state['pressure_released']}"
-        )
-        return {"path": [], "current_node": "AA", "pressure_released": 0, "G": G}
-
-    else:
-        if len(state["path"]) < TIME_LIMIT:
-            actions = []
-            if (
-                G.nodes[state["current_node"]]["closed"]
-                and G.nodes[state["current_node"]]["rate"] >= 1
-            ):
-                # open the valve
-                newG = G.copy()
-                newG.nodes[state["current_node"]]["closed"] = False
-                final_pressure_expectation = (
-                    state["pressure_released"]
-                    + (TIME_LIMIT - len(state["path"]) - 1)
-                    * G.nodes[state["current_node"]]["rate"]
-                )
-                actions.append(
-                    max_path(
-                        {
-                            "path": state["path"]
-                            + [f"open valve {state['current_node']}"],
-                            "current_node": state["current_node"],
-                            "pressure_released": final_pressure_expectation,
-                            "G": newG,
-                        }
-                    )
-                )
-
-                if final_pressure_expectation > CURRENT_MAX_EXPECTATION:
-                    CURRENT_MAX_EXPECTATION = final_pressure_expectation
-            for n in G.neighbors(state["current_node"]):
-                # move to neighbor n
-                actions.append(
-                    max_path(
-                        {
-                            "path": state["path"] + [f"go to node {n}"],
-                            "current_node": n,
-                            "pressure_released": state["pressure_released"],
-                            "G": G,
-                        }
-                    )
-                )
-
-            return max(actions, key=lambda a: a["pressure_released"])
-
-        else:
-            return state
+        valves[valve] = rate, adj_valves
+    return valves
+
+
+def valve_network(valves):
+    """Collapses the tunnels to the valves worth opening.
+
+    Returns their rates (valve i being bit 1 << i of an opened-valves mask)
+    and the matrix of distances between them, AA being the extra last row
+    and column.
+    """
+    useful = [v for v, (rate, _) in valves.items() if rate > 0]
+    nodes = useful + ["AA"]
+    distances = []
+    for v in nodes:
+        reached = search.bfs([v], lambda w: valves[w][1]).distances
+        distances.append([reached[w] for w in nodes])
+    return [valves[v][0] for v in useful], distances
+
+
+def best_pressures(rates, distances, time_limit):
+    """Best pressure released by the time limit for every set of opened
+    valves (as a bitmask) reachable from AA.
+
+    Only openings matter: a path is the order in which valves are opened,
+    walking the shortest way to each one, so the search is over masks rather
+    than over minutes.
+    """
+    # (bit, valve, minutes to walk there and open it, rate) from each valve
+    moves = [
+        [(1 << j, j, row[j] + 1, rate) for j, rate in enumerate(rates)]
+        for row in distances
+    ]
+    best = {}
+    stack = [(len(rates), time_limit, 0, 0)]  # valve, time left, mask, pressure
+    while stack:
+        valve, time_left, mask, pressure = stack.pop()
+        if best.get(mask, -1) < pressure:
+            best[mask] = pressure
+        for bit, j, cost, rate in moves[valve]:
+            if cost < time_left and not mask & bit:
+                remaining = time_left - cost
+                stack.append((j, remaining, mask | bit, pressure + rate * remaining))
+    return best
 
 
 def solve1(data):
     """Solves part 1."""
-    G = parser(data)
-    initial_state = {"path": [], "current_node": "AA", "pressure_released": 0, "G": G}
-    return max_path(initial_state)
-
-
-def max_path2(state):
-    global CURRENT_MAX_EXPECTATION
-    G = state["G"]
-    # logger.info(f"current path length is {len(state['path'])}")
-
-    # pruning
-    remaining_time = TIME_LIMIT2 - len(state["path"])
-
-    closed_valves = [n for n in G.nodes() if G.nodes[n]["closed"]]
-    remaining_rates = sorted([G.nodes[n]["rate"] for n in closed_valves], reverse=True)
-
-    if remaining_rates[0] == 0:
-        # all valves with positive flow rates are already open, nothing to gain anymore
-        print("nothing to gain anymore, cutting branch")
-        return state
-
-    potential = 0
-    for i, time in enumerate(range(remaining_time - 1, 0, -1)):
-        potential += remaining_rates[i] * time
-        if i + 2 > len(remaining_rates):
-            break
-
-    logger.info(
-        f"potential is {potential}, expected final pressure is {state['pressure_released']} current max is {CURRENT_MAX_EXPECTATION} , remaining time {remaining_time}"
-    )
-    if state["pressure_released"] + potential < CURRENT_MAX_EXPECTATION:
-        # drop this branch
-        logger.info(
-            f"droping path {state['path']}, cause potential {potential} is too low to catch up {CURRENT_MAX_EXPECTATION} with remaining time {remaining_time} while at pressure {state['pressure_released']}"
-        )
-        return {"path": [], "current_node": "AA", "pressure_released": 0, "G": G}
-
-    else:
-        if len(state["path"]) < TIME_LIMIT2:
-            actions = []
-            if (
-                G.nodes[state["current_node"]]["closed"]
-                and G.nodes[state["current_node"]]["rate"] >= 1
-            ):
-                # open the valve
-                newG = G.copy()
-                newG.nodes[state["current_node"]]["closed"] = False
-                final_pressure_expectation = (
-                    state["pressure_released"]
-                    + (TIME_LIMIT2 - len(state["path"]) - 1)
-                    * G.nodes[state["current_node"]]["rate"]
-                )
-                actions.append(
-                    max_path(
-                        {
-                            "path": state["path"]
-                            + [f"open valve {state['current_node']}"],
-                            "current_node": state["current_node"],
-                            "pressure_released": final_pressure_expectation,
-                            "G": newG,
-                        }
-                    )
-                )
-
-                if final_pressure_expectation > CURRENT_MAX_EXPECTATION:
-                    CURRENT_MAX_EXPECTATION = final_pressure_expectation
-                    logger.warning(
-                        f"CURRENT_MAX_EXPECTATION updated to {CURRENT_MAX_EXPECTATION}"
-                    )
-            for n in G.neighbors(state["current_node"]):
-                # move to neighbor n
-                actions.append(
-                    max_path(
-                        {
-                            "path": state["path"] + [f"go to node {n}"],
-                            "current_node": n,
-                            "pressure_released": state["pressure_released"],
-                            "G": G,
-                        }
-                    )
-                )
-
-            return max(actions, key=lambda a: a["pressure_released"])
-
-        else:
-            return state
+    rates, distances = valve_network(parser(data))
+    best = best_pressures(rates, distances, TIME_LIMIT)
+    logger.info(f"{len(best)} sets of opened valves reachable")
+    return max(best.values())
 
 
 def solve2(data):
     """Solves part2."""
-    pass
-    G = parser(data)
-    initial_state = {
-        "path": [],
-        "path_e": [],
-        "current_node": "AA",
-        "current_node_e": "AA",
-        "pressure_released": 0,
-        "G": G,
-    }
-    return max_path2(initial_state)
+    # me and the elephant open disjoint sets of valves: the answer is the best
+    # pair of disjoint masks, each one being worked alone
+    rates, distances = valve_network(parser(data))
+    best = best_pressures(rates, distances, TIME_LIMIT2)
+    ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+    logger.info(f"{len(ranked)} sets of opened valves reachable")
+
+    total = 0
+    for i, (mine, pressure) in enumerate(ranked):
+        if 2 * pressure <= total:
+            # the elephant can't do better than me in the pairs left
+            break
+        for elephants, pressure_e in ranked[i:]:
+            if pressure + pressure_e <= total:
+                break
+            if not mine & elephants:
+                total = pressure + pressure_e
+    return total
 
 
 """
@@ -4,9 +4,9 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input
+from collections import deque
 
-from operator import itemgetter
+from aoc_utilities import Input, cycles, test_input
 
 """
 Logger config
@@ -26,203 +26,137 @@ logger.addHandler(handler)
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
-JET_PATTERN = ""
-JET_INDEX = 0
-ICYCLE = 0
-YCYCLE = 0
-YMAX = 0
-
-ROCKS = {
-    0: {
-        "base_coords": [(2, 0), (3, 0), (4, 0), (5, 0)],
-        "name": "-",
-    },
-    1: {
-        "base_coords": [(3, 0), (2, 1), (3, 1), (4, 1), (3, 2)],
-        "name": "+",
-    },
-    2: {
-        "base_coords": [(2, 0), (3, 0), (4, 0), (4, 1), (4, 2)],
-        "name": "_|",
-    },
-    3: {
-        "base_coords": [(2, 0), (2, 1), (2, 2), (2, 3)],
-        "name": "|",
-    },
-    4: {
-        "base_coords": [(2, 0), (3, 0), (2, 1), (3, 1)],
-        "name": "=",
-    },
-}
-
-chamber = set([(x, 0) for x in range(7)])
-
-
-def mdump(m):
+WIDTH = 7
+# rocks as row masks, bottom row first, bit 6 being the leftmost column:
+# each one appears with its left edge two units away from the left wall
+ROCKS = [
+    (0b0011110,),  # -
+    (0b0001000, 0b0011100, 0b0001000),  # +
+    (0b0011100, 0b0000100, 0b0000100),  # _|
+    (0b0010000, 0b0010000, 0b0010000, 0b0010000),  # |
+    (0b0011000, 0b0011000),  # =
+]
+LEFT_WALL = 1 << (WIDTH - 1)
+RIGHT_WALL = 1
+FULL_ROW = (1 << WIDTH) - 1
+# rows kept below the top of the tower: rocks never fall deeper than that
+TOWER_DEPTH = 64
+
+
+class Chamber:
+    """A tower of rocks fed by one jet pattern.
+
+    Only the top rows of the tower are kept, each as a 7-bit int: moving a
+    rock is shifting its rows, and hitting something is an & with the tower.
+    Every chamber holds its own state, so that several jet patterns can be
+    simulated in the same process.
     """
-    Helper function to print a set
-    """
-    dump = ""
-    for y in range(YMAX, - 1, -1):
-        for x in range(7):
-            if (x, y) in m:
-                dump += "#"
-            else:
-                dump += "."
-        dump += "\n"
-    return dump
-
-
-def mdump_lasty(m, size):
-    """
-    Helper function to print a set
-    """
-    dump = ""
-    for y in range(YMAX, YMAX - size - 1, -1):
-        for x in range(7):
-            if (x, y) in m:
-                dump += "#"
-            else:
-                dump += "."
-        dump += "\n"
-    return dump
-
-def jet_move(rock_coords, next_jet):
-    if next_jet == ">":
-        new_rock_coords = [(x + 1, y) for (x, y) in rock_coords]
-        for c in new_rock_coords:
-            if c in chamber:
-                return rock_coords
-
-        if 6 in [x for x, y in rock_coords]:
-            return rock_coords
-
-        logger.info("Jet of gas pushes rock right")
-        return new_rock_coords
-
-    elif next_jet == "<":
-
-        new_rock_coords = [(x - 1, y) for (x, y) in rock_coords]
-        for c in new_rock_coords:
-            if c in chamber:
-                return rock_coords
-
-        if 0 in [x for x, y in rock_coords]:
-            return rock_coords
 
-        logger.info("Jet of gas pushes rock left")
-        return new_rock_coords
-
-    return None
-
-
-def add_rock(i):
-    rock_id = i % 5  # 0 is the horizontal bar ####, 4 is the 2x2 square
-    global JET_INDEX, JET_PATTERN, chamber, YMAX
-    """
-    Each rock appears so that 
-    its left edge is two units away from the left wall 
-    and its bottom edge is three units above the highest rock in the room
-    """
-
-    basey = YMAX + 4
-    rock_coords = [(x, y + basey) for (x, y) in ROCKS[rock_id]["base_coords"]]
-    logger.info(f"rocks appears with coords {rock_coords}")
-
-    """
-    After a rock appears, it alternates between 
-    - being pushed by a jet of hot gas one unit (in the direction indicated by the next symbol in the jet pattern) 
-    - and then falling one unit down. 
-    If any movement would cause any part of the rock to move into the walls, floor, or a stopped rock, 
-      the movement instead does not occur. 
-      If a downward movement would have caused a falling rock to move into the floor or an already-fallen rock, 
-        the falling rock stops where it is (having landed on something) and a new rock immediately begins falling.
-    """
-    while True:
-        next_jet = JET_PATTERN[JET_INDEX]
-        JET_INDEX = JET_INDEX + 1 if JET_INDEX < len(JET_PATTERN) - 1 else 0
-        rock_coords = jet_move(rock_coords, next_jet)
-        touch = False
-        rock_coords_after_fall = [(x, y - 1) for (x, y) in rock_coords]
-        for praf in rock_coords_after_fall:
-            # point for rock after fall
-            if praf in chamber:
-                touch = True
-                logger.info(f"rock touches at {praf}")
+    def __init__(self, jets):
+        self.jets = jets.strip()
+        self.jet_index = 0
+        self.rocks = 0  # fallen rocks
+        self.height = 0
+        self.rows = deque(maxlen=TOWER_DEPTH)  # bottom first
+
+    def row(self, y):
+        """row at height y, anything below the kept rows being solid"""
+        base = self.height - len(self.rows)
+        if y < base:
+            return FULL_ROW
+        if y >= self.height:
+            return 0
+        return self.rows[y - base]
+
+    def hits(self, rock, y):
+        return any(r & self.row(y + i) for i, r in enumerate(rock))
+
+    def drop(self):
+        """Drops the next rock until it comes to rest."""
+        rock = ROCKS[self.rocks % len(ROCKS)]
+        y = self.height + 3
+        while True:
+            jet = self.jets[self.jet_index]
+            self.jet_index = (self.jet_index + 1) % len(self.jets)
+            if jet == "<":
+                if not any(r & LEFT_WALL for r in rock):
+                    pushed = tuple(r << 1 for r in rock)
+                    if not self.hits(pushed, y):
+                        rock = pushed
+            elif not any(r & RIGHT_WALL for r in rock):
+                pushed = tuple(r >> 1 for r in rock)
+                if not self.hits(pushed, y):
+                    rock = pushed
+
+            if self.hits(rock, y - 1):
                 break
+            y -= 1
 
-        if touch:
-            logger.debug("Rock comes to rest:")
-            break
-        else:
-            # fall down 1 unit
-            rock_coords = rock_coords_after_fall
-            logger.debug("Rock falls 1 unit")
-            if any([y < 0 for (x, y) in rock_coords]):
-                logger.critical(f"oh shit, rock coords are {rock_coords}")
-                return
-        logger.info(f"rock_coords are {rock_coords}")
-    chamber.update(set(rock_coords))
-    ymax_rock = max(map(itemgetter(1), rock_coords))
-
-    # YMAX = max(map(itemgetter(1), chamber)) makes add_rock in O(1) instead of 0(len(chamber)) !!!
-    if ymax_rock > YMAX:
-        YMAX = ymax_rock
-    return
-
-
-def solve1():
+        for i, r in enumerate(rock):
+            if y + i < self.height:
+                self.rows[y + i - self.height] |= r
+            else:
+                self.rows.append(r)
+                self.height += 1
+        self.rocks += 1
+        return self
+
+    def skyline(self):
+        """depth of the highest rock of each column below the top"""
+        profile = []
+        for column in range(WIDTH):
+            bit = 1 << column
+            depth = next(
+                (d for d, r in enumerate(reversed(self.rows)) if r & bit),
+                len(self.rows),
+            )
+            profile.append(depth)
+        return tuple(profile)
+
+    def state(self):
+        """what decides how the next rocks fall"""
+        return self.rocks % len(ROCKS), self.jet_index, self.skyline()
+
+    def height_after(self, rocks):
+        """Tower height after `rocks` rocks, simulating the rocks until the
+        chamber gets back to a previous state, then fast-forwarding."""
+        fallen = self.rocks
+        heights = [self.height]  # heights[i]: after i more rocks
+
+        def drop(chamber):
+            chamber.drop()
+            heights.append(chamber.height)
+            return chamber
+
+        cycle = cycles.find(drop, self, Chamber.state)
+        logger.warning(f"cycle of {cycle.length} rocks after {cycle.start} rocks")
+        return cycle.fast_forward(rocks - fallen, heights)
+
+    def __str__(self):
+        return "\n".join(
+            "|" + format(r, f"0{WIDTH}b").replace("0", ".").replace("1", "#") + "|"
+            for r in reversed(self.rows)
+        )
+
+
+def solve1(data):
     """Solves part 1."""
-    global chamber
-    for i in range(2022):
-        if i % 1000 == 0:
-            logger.warning(f"reached i = {i}")
-        add_rock(i)
-
-    return YMAX
+    chamber = Chamber(data)
+    for _ in range(2022):
+        chamber.drop()
+    return chamber.height
 
 
 def solve2(data):
     """Solves part2."""
-    global YMAX
-    cycle = False
-    previous = {}
-    i = 0
-    i_target = 1_000_000_000_000
-    sample_size = 100
-
-    while i < i_target:
-        if i % 100_000 == 0:
-            logger.warning(f"reached i = {i}")
-        add_rock(i)
-        i += 1
-
-        # CYCLE DETECTOR
-        if not cycle:
-            if i > sample_size and i % (len(JET_PATTERN) * len(ROCKS)) == 0:
-                # cycle length is necessarily a multiple of the size of each problem inputs
-                dump = mdump_lasty(chamber, sample_size)
-                #logger.warning(dump)
-                if dump in previous:
-                    print("CYCLE DETECTED")
-                    cycle = True
-                    i_cycle_start = previous[dump][0]
-                    y_cycle_start = previous[dump][1]
-                    cycle_length = i - i_cycle_start
-                    cycle_y_size = YMAX - y_cycle_start
-
-                    n = (i_target - i) // cycle_length
-                    print(f"fast forward {n} cycles of length {cycle_length} and height {cycle_y_size}, adding {n * cycle_length} to i and {n * cycle_y_size} to YMAX")
-                    i += n * cycle_length
-                    y_cycles = n * cycle_y_size
-                else:
-                    previous[dump] = i, YMAX
-    return YMAX + y_cycles
+    return Chamber(data).height_after(1_000_000_000_000)
 
     # 1514286628
     # 1514285716108
     # 1514285714288
     # 1572093023267
+
+
 """
 Use script args to execute the right function solve1 / solve2, with the right logging level (only activated on test inputs)
   - python dayXX.py 1
@@ -234,21 +168,17 @@ if __name__ == "__main__":
     """some logger levels : DEBUG, INFO, WARNING, CRITICAL"""
     if len(sys.argv) > 1 and sys.argv[1] == "1":
         logger.setLevel(logging.CRITICAL)
-        JET_PATTERN = Input(DAY).read()
-        res = solve1()
+        res = solve1((Input(DAY).read()))
         print(res)
     if len(sys.argv) > 1 and sys.argv[1] == "1t":
         logger.setLevel(logging.WARNING)
-        JET_PATTERN = test_input(DAY).read()
-        res = solve1()
+        res = solve1((test_input(DAY).read()))
         print(res)
     if len(sys.argv) > 1 and sys.argv[1] == "2":
         logger.setLevel(logging.WARNING)
-        JET_PATTERN = Input(DAY).read()
         res = solve2((Input(DAY).read()))
         print(res)
     if len(sys.argv) > 1 and sys.argv[1] == "2t":
         logger.setLevel(logging.WARNING)
-        JET_PATTERN = test_input(DAY).read()
         res = solve2((test_input(DAY).read()))
         print(res)
@@ -6,6 +6,8 @@ import sys
 import logging
 from aoc_utilities import Input, test_input
 
+import numpy as np
+
 """
 Logger config
   use logger.ingo("") instead of print statement
@@ -25,86 +27,55 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def get_all_faces(point):
-    (x,y,z) = point
-    all_faces = set()
-    faces = [
-        [(x, y, z), (x, y, z+1), (x, y+1, z), (x, y+1, z+1)],
-        [(x+1, y, z), (x+1, y, z+1), (x+1, y+1, z), (x+1, y+1, z+1)],
-        [(x, y, z),(x+1, y, z),(x, y, z+1),(x+1, y, z+1)],
-        [(x, y+1, z),(x+1, y+1, z),(x, y+1, z+1),(x+1, y+1, z+1)],
-        [(x, y, z), (x + 1, y, z), (x, y + 1, z), (x + 1, y + 1, z)],
-        [(x, y, z+1), (x + 1, y, z+1), (x, y + 1, z+1), (x + 1, y + 1, z+1)],
-    ]
-    for f in faces:
-        all_faces.add(tuple(sorted(f)))
+def droplet(data):
+    """Cubes of lava as a 3D boolean array, with at least one layer of air
+    all around so that the border of the array is outside the droplet."""
+    cubes = np.array([line.split(",") for line in data.splitlines()], dtype=np.int64)
+    cubes -= cubes.min(axis=0) - 1
+    lava = np.zeros(cubes.max(axis=0) + 2, dtype=bool)
+    lava[tuple(cubes.T)] = True
+    return lava
 
-    return all_faces
 
+def surface(solid):
+    """Number of faces between a cell of solid and a cell out of it: cells
+    that differ from their neighbour along an axis."""
+    return sum(np.count_nonzero(np.diff(solid, axis=a)) for a in range(solid.ndim))
 
 
-def solve1(data):
-    """Solves part 1."""
-    free_sides = set()
-    k=0
-
-    for line in data.splitlines():
-        x,y,z = map(int, line.split(","))
-        for side in get_all_faces((x,y,z)):
-            if side not in free_sides:
-                free_sides.add(side)
-            else:
-                free_sides.remove(side)
-    return len(free_sides)
+def exterior(lava):
+    """Air reachable from the border, flood filled one BFS layer at a time
+    on flat indexes (every cell is reached once)."""
+    blocked = lava.ravel()
+    outside = np.zeros(lava.size, dtype=bool)
+    _, height, depth = lava.shape
+    offsets = np.array([1, -1, depth, -depth, height * depth, -height * depth])
 
+    # flat neighbours of a border cell may wrap around to the opposite border:
+    # also outside, that does not matter
+    frontier = np.array([0])
+    outside[0] = True
+    while frontier.size:
+        cells = (frontier[:, None] + offsets).ravel()
+        cells = cells[(cells >= 0) & (cells < lava.size)]
+        cells = np.unique(cells[~outside[cells] & ~blocked[cells]])
+        outside[cells] = True
+        frontier = cells
+    return outside.reshape(lava.shape)
 
 
+def solve1(data):
+    """Solves part 1."""
+    return surface(droplet(data))
 
 
 def solve2(data):
     """Solves part2."""
-    free_sides = set()
-    k=0
-
-    for line in data.splitlines():
-        x,y,z = map(int, line.split(","))
-        for side in get_all_faces((x,y,z)):
-            if side not in free_sides:
-                free_sides.add(side)
-            else:
-                free_sides.remove(side)
-
-
-    # in those free sides, some are external, some are internal
-    # we want to count the external
-    # one is external if one of its edges belong to the largest set of connecting edges
-
-    # start from one edge
-    result = {}
-    while free_sides:
-        surface = set()
-        side = free_sides.pop()
-        surface.add(side)
-        edges = set([edge for edge in side])
-        intersect = True
-        while intersect:
-            print(f"free_sides size is {len(free_sides)}")
-            fs = free_sides.copy()
-            intersect = False
-            for s in fs:
-                if any([(e in edges) for e in s]):
-                    free_sides.remove(s)
-                    edges.update([edge for edge in s])
-                    surface.add(s)
-                    intersect = True
-        result[side] = len(surface)
-
-    return result
-    # 4114 too high
-
-
-
-
+    lava = droplet(data)
+    outside = exterior(lava)
+    logger.info(f"{np.count_nonzero(~lava & ~outside)} cells of air trapped inside")
+    # air pockets are closed by lava, so outside only touches lava
+    return surface(outside)
 
 
 """
@@ -4,10 +4,8 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input
+from aoc_utilities import Input, parallel, test_input
 import re
-from functools import lru_cache
-import math
 
 """
 Logger config
@@ -26,170 +24,147 @@ logger.addHandler(handler)
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
-BLUEPRINTS = {}
 
 
 def load_bp(data):
-    global BLUEPRINTS
-    BLUEPRINTS = {}
+    """returns the blueprints as tuples: (id, ore robot ore cost, clay robot ore
+    cost, obsidian robot ore and clay costs, geode robot ore and obsidian costs)"""
+    blueprints = []
     for line in data.splitlines():
         # Blueprint 2: Each ore robot costs 2 ore. Each clay robot costs 3 ore. Each obsidian robot costs 3 ore and 8 clay. Each geode robot costs 3 ore and 12 obsidian.
-        digits = list(map(int, re.findall(r"(\d+)", line)))
-        BLUEPRINTS[digits[0]] = {
-            "cost_ore_rbt": digits[1],
-            "cost_clay_rbt": digits[2],
-            "cost_obsidian_rbt__ore": digits[3],
-            "cost_obsidian_rbt__clay": digits[4],
-            "cost_geode_rbt__ore": digits[5],
-            "cost_geode_rbt__obsidian": digits[6],
-            "max_ore_cost": max(digits[1], digits[2], digits[3], digits[5]),
-        }
-    return
-
-
-def quality_level(blueprint_id, t):
-    maxg = max_geodes(t, blueprint_id, 0, 0, 0, 0, 1, 0, 0, 0)
-    ql = blueprint_id * maxg
-    print(
-        f"blueprint {blueprint_id} can open {maxg} geodes in {t}min, reaching a quality level of {ql} "
-    )
-    return ql
-
-
-@lru_cache(maxsize=None)
-def max_geodes(
-    T,
-    blueprint,
-    ore,
-    clay,
-    obsidian,
-    geode,
-    ore_robot,
-    clay_robot,
-    obsidian_robot,
-    geode_robot,
-):
-    if T == 0:
-        return geode
-        # TODO : Make a cache for a state consisting of a tuple with the time, the materials, and the robots we have. If we reach a node that has fewer geodes broken than we cached for a similar node, we can stop at this node
-        # TODO 2 : if the path reaches a point at which a geode machine can be produced every turn the search stops and trivially computes how many more geodes could be produced in the remaining time
-        # TODO 3 : break if a very optimistic estimate of geode production (one new geode breaking robot per remaining turn) from the current point doesn't go over the maximum found so far.
-        # Saving the state as (robots per resource & stack per resource) with an associated time, if the state is encountered again with more time left, the associated time is updated, if the state is encountered with less or the same time left you can prune.
-    bp = BLUEPRINTS[blueprint]
-    options = []
-
-    # build a geode robot
-    # Each geode robot costs 3 ore and 12 obsidian.
-    # if I can build a geode robot, it's definitely the only option I should consider
-    if ore >= bp["cost_geode_rbt__ore"] and obsidian >= bp["cost_geode_rbt__obsidian"]:
-        options.append(
-            (
-                T - 1,
-                blueprint,
-                ore + ore_robot - bp["cost_geode_rbt__ore"],
-                clay + clay_robot,
-                obsidian + obsidian_robot - bp["cost_geode_rbt__obsidian"],
-                geode + geode_robot,
-                ore_robot,
-                clay_robot,
-                obsidian_robot,
-                geode_robot + 1,
-            )
-        )
-
-    else:
-        # build an obsidian robot
-        if obsidian_robot <= bp["cost_geode_rbt__obsidian"] and (
-            ore >= bp["cost_obsidian_rbt__ore"]
-            and clay >= bp["cost_obsidian_rbt__clay"]
-        ):
-            options.append(
-                (
-                    T - 1,
-                    blueprint,
-                    ore + ore_robot - bp["cost_obsidian_rbt__ore"],
-                    clay + clay_robot - bp["cost_obsidian_rbt__clay"],
-                    obsidian + obsidian_robot,
-                    geode + geode_robot,
-                    ore_robot,
-                    clay_robot,
-                    obsidian_robot + 1,
-                    geode_robot,
+        blueprints.append(tuple(map(int, re.findall(r"(\d+)", line))))
+    return blueprints
+
+
+def wait(cost, stock, robots):
+    """minutes to wait before affording cost"""
+    if stock >= cost:
+        return 0
+    return -(-(cost - stock) // robots)
+
+
+def upper_bound(blueprint, t, r_obs, obs, geodes):
+    """Geodes opened if ore and clay were free: an obsidian robot is built
+    every minute, and a geode robot too whenever the obsidian allows it."""
+    geo_obs = blueprint[6]
+    while t > 1:
+        t -= 1
+        if obs >= geo_obs:
+            obs -= geo_obs
+            geodes += t
+        obs += r_obs
+        r_obs += 1
+    return geodes
+
+
+def max_geodes(blueprint, time_limit):
+    """Depth first search over the order robots are built in.
+
+    Instead of advancing one minute at a time, each branch jumps to the
+    minute the next robot is built, and a geode robot is credited right away
+    with every geode it will open. Branches are cut when:
+      - there are already as many robots of a kind as can be spent per minute,
+      - even free ore and clay can't beat the best count found so far.
+    """
+    _, ore_ore, clay_ore, obs_ore, obs_clay, geo_ore, geo_obs = blueprint
+    max_ore = max(clay_ore, obs_ore, geo_ore)
+    best = 0
+    # time left, robots (ore, clay, obsidian), stock (ore, clay, obsidian), geodes
+    stack = [(time_limit, 1, 0, 0, 0, 0, 0, 0)]
+    while stack:
+        t, r_ore, r_clay, r_obs, ore, clay, obs, geodes = stack.pop()
+        if geodes > best:
+            best = geodes
+        if upper_bound(blueprint, t, r_obs, obs, geodes) <= best:
+            continue
+
+        # pushed last, explored first: finding good counts early prunes more
+        if r_ore < max_ore:
+            w = wait(ore_ore, ore, r_ore) + 1
+            if w < t:
+                stack.append(
+                    (
+                        t - w,
+                        r_ore + 1,
+                        r_clay,
+                        r_obs,
+                        ore + w * r_ore - ore_ore,
+                        clay + w * r_clay,
+                        obs + w * r_obs,
+                        geodes,
+                    )
                 )
-            )
-
-        # do nothing
-        # TODO : skip clock cycles until each new machine can be produced, interpolating the accumulated resources during the missing ticks (your final comment)
-        # * there is no benefit to waiting a turn to buy a robot if you could buy it immediately. Therefore, if you choose not to buy anything, the next robot you buy must be one of the robots you *couldn't* already afford that turn.
-        options.append(
-            (
-                T - 1,
-                blueprint,
-                ore + ore_robot,
-                clay + clay_robot,
-                obsidian + obsidian_robot,
-                geode + geode_robot,
-                ore_robot,
-                clay_robot,
-                obsidian_robot,
-                geode_robot,
-            )
-        )
-
-        # build a clay robot
-        # Each clay robot costs 3 ore.
-        # it's useless to produce in 1 step more than the max that you can consume in one step
-        if ore >= bp["cost_clay_rbt"] and clay_robot <= bp["cost_obsidian_rbt__clay"]:
-            options.append(
-                (
-                    T - 1,
-                    blueprint,
-                    ore + ore_robot - bp["cost_clay_rbt"],
-                    clay + clay_robot,
-                    obsidian + obsidian_robot,
-                    geode + geode_robot,
-                    ore_robot,
-                    clay_robot + 1,
-                    obsidian_robot,
-                    geode_robot,
+        if r_clay < obs_clay:
+            w = wait(clay_ore, ore, r_ore) + 1
+            if w < t:
+                stack.append(
+                    (
+                        t - w,
+                        r_ore,
+                        r_clay + 1,
+                        r_obs,
+                        ore + w * r_ore - clay_ore,
+                        clay + w * r_clay,
+                        obs + w * r_obs,
+                        geodes,
+                    )
                 )
-            )
-        # build a ore robot
-        # it's useless to produce in 1 step more than the max that you can consume in one step
-        if (ore >= bp["cost_ore_rbt"]) and ore_robot <= bp["max_ore_cost"]:
-            options.append(
-                (
-                    T - 1,
-                    blueprint,
-                    ore + ore_robot - bp["cost_ore_rbt"],
-                    clay + clay_robot,
-                    obsidian + obsidian_robot,
-                    geode + geode_robot,
-                    ore_robot + 1,
-                    clay_robot,
-                    obsidian_robot,
-                    geode_robot,
+        if r_clay and r_obs < geo_obs:
+            w = max(wait(obs_ore, ore, r_ore), wait(obs_clay, clay, r_clay)) + 1
+            if w < t:
+                stack.append(
+                    (
+                        t - w,
+                        r_ore,
+                        r_clay,
+                        r_obs + 1,
+                        ore + w * r_ore - obs_ore,
+                        clay + w * r_clay - obs_clay,
+                        obs + w * r_obs,
+                        geodes,
+                    )
                 )
-            )
+        if r_obs:
+            w = max(wait(geo_ore, ore, r_ore), wait(geo_obs, obs, r_obs)) + 1
+            if w < t:
+                stack.append(
+                    (
+                        t - w,
+                        r_ore,
+                        r_clay,
+                        r_obs,
+                        ore + w * r_ore - geo_ore,
+                        clay + w * r_clay,
+                        obs + w * r_obs - geo_obs,
+                        geodes + t - w,
+                    )
+                )
+    return best
+
 
-    # print(options)
-    return max([max_geodes(*o) for o in options])
+def max_geodes_all(blueprints, time_limit):
+    """max_geodes of every blueprint, in parallel"""
+    return parallel.pmap(max_geodes, blueprints, [time_limit] * len(blueprints))
 
 
 def solve1(data):
     """Solves part 1."""
-    load_bp(data)
-    return sum([quality_level(k, 24) for k in BLUEPRINTS.keys()])
+    blueprints = load_bp(data)
+    geodes = max_geodes_all(blueprints, 24)
+    for bp, g in zip(blueprints, geodes, strict=True):
+        logger.info(
+            f"blueprint {bp[0]} can open {g} geodes in 24min, reaching a quality level of {bp[0] * g}"
+        )
+    return sum(bp[0] * g for bp, g in zip(blueprints, geodes, strict=True))
 
 
 def solve2(data):
     """Solves part2."""
-    load_bp(data)
+    blueprints = load_bp(data)[:3]
     res = 1
-    for k in [1, 2, 3]:
-        m = max_geodes(32, k, 0, 0, 0, 0, 1, 0, 0, 0)
-        print(f"blueprint {k} can open {m} geodes")
-        res *= m
+    for bp, g in zip(blueprints, max_geodes_all(blueprints, 32), strict=True):
+        logger.info(f"blueprint {bp[0]} can open {g} geodes")
+        res *= g
     return res
 
     # 20979 too low
@@ -5,7 +5,7 @@ import os
 import sys
 import logging
 from aoc_utilities import Input, test_input
-from collections import deque
+from math import isqrt
 
 
 """
@@ -27,53 +27,104 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def solve1(data):
-    """Solves part 1."""
-    l = []
-    for line in data.splitlines():
-        l.append(int(line))
-    print(f"input has {len(l)} values, and {len(set(l))} unique values.")
-    size = len(l)
-
-    # there a re duplicate values in input, we need to introduce an id for each value
-    list_with_ids = [*enumerate(l)]  # l = [1, 2, -3, 3, -2, 0, 4] would yield
-    # [(0, 1), (1, 2), (2, -3), (3, 3), (4, -2), (5, 0), (6, 4)]
+class Mixer:
+    """The mixed sequence, as a list of blocks of about sqrt(n) number ids.
+
+    Moving a number looks up its block in `block_of` and its place in that
+    block, then walks the blocks to the new position: O(sqrt(n)) per move
+    instead of the O(n) list.index / pop / insert on the whole sequence.
+    Blocks are cut again to the same size every sqrt(n) moves, so that
+    their number and size stay O(sqrt(n)) whatever the number of rounds.
+    """
+
+    def __init__(self, values):
+        self.values = values
+        self.size = len(values)
+        self.block_size = max(16, isqrt(self.size))
+        self.rebuild(list(range(self.size)))
+
+    def rebuild(self, ids):
+        self.blocks = [
+            ids[i : i + self.block_size] for i in range(0, self.size, self.block_size)
+        ]
+        self.block_of = [None] * self.size
+        for block in self.blocks:
+            for i in block:
+                self.block_of[i] = block
+        self.moves_left = self.block_size
+
+    def locate(self, block):
+        """Index of block in the block list, and position of its first id in
+        the sequence."""
+        p = 0
+        for k, b in enumerate(self.blocks):
+            if b is block:
+                return k, p
+            p += len(b)
+
+    def insert(self, p, id):
+        k = 0
+        while p > len(self.blocks[k]):
+            p -= len(self.blocks[k])
+            k += 1
+        block = self.blocks[k]
+        block.insert(p, id)
+        self.block_of[id] = block
+        if len(block) > 2 * self.block_size:
+            # split big blocks so that every insert stays O(sqrt(n))
+            half = block[self.block_size :]
+            del block[self.block_size :]
+            self.blocks.insert(k + 1, half)
+            for i in half:
+                self.block_of[i] = half
+
+    def move(self, id):
+        block = self.block_of[id]
+        j = block.index(id)
+        k, p = self.locate(block)
+        del block[j]
+        if not block:
+            del self.blocks[k]
+        # the sequence is circular and has size - 1 numbers while id is out
+        self.insert((p + j + self.values[id]) % (self.size - 1), id)
+
+        self.moves_left -= 1
+        if not self.moves_left:
+            self.rebuild([i for block in self.blocks for i in block])
+
+    def mix(self, rounds=1):
+        for _ in range(rounds):
+            for id in range(self.size):
+                self.move(id)
+
+    def __iter__(self):
+        for block in self.blocks:
+            for id in block:
+                yield self.values[id]
+
+
+def grove_coordinates(data, key=1, rounds=1):
+    # values are not unique in the input, numbers are tracked by their id:
+    # their index in the original sequence
+    values = [int(line) * key for line in data.splitlines()]
+    logger.info(
+        f"input has {len(values)} values, and {len(set(values))} unique values."
+    )
+    mixer = Mixer(values)
+    mixer.mix(rounds)
+    res = list(mixer)
+    zero = res.index(0)
+    return sum(res[(zero + 1000 * p) % len(res)] for p in [1, 2, 3])
 
-    original_list_with_ids = (
-        list_with_ids.copy()
-    )  # storing an independant copy so we can iterate on it while modifying list_with_ids
 
-    for id, i in original_list_with_ids:
-        idx = list_with_ids.index((id, i))
-        list_with_ids.pop(idx)
-        list_with_ids.insert((idx + i) % (size - 1), (id, i))
-    res = [x for _, x in list_with_ids]
-    return sum([res[(res.index(0) + 1000 * p) % size] for p in [1, 2, 3]])
+def solve1(data):
+    """Solves part 1."""
+    return grove_coordinates(data)
 
 
 def solve2(data):
     """Solves part2."""
-    l = []
-    for line in data.splitlines():
-        l.append(int(line) * 811589153)
-    print(f"input has {len(l)} values, and {len(set(l))} unique values.")
-    size = len(l)
-
-    # there a re duplicate values in input, we need to introduce an id for each value
-    # l = [1, 2, -3, 3, -2, 0, 4] would yield
-    # [(0, 1), (1, 2), (2, -3), (3, 3), (4, -2), (5, 0), (6, 4)]
-    list_with_ids = [*enumerate(l)]
-
-    # create an independant copy so we can iterate on it while modifying list_with_ids
-    original_list_with_ids = list_with_ids.copy()
-
-    for _ in range(10):
-        for id, i in original_list_with_ids:
-            idx = list_with_ids.index((id, i))
-            list_with_ids.pop(idx)
-            list_with_ids.insert((idx + i) % (size - 1), (id, i))  # list has size (n-1) at this time !
-    res = [x for _, x in list_with_ids]
-    return sum([res[(res.index(0) + 1000 * p) % size] for p in [1, 2, 3]])
+    return grove_coordinates(data, 811589153, 10)
 
 
 """
@@ -4,7 +4,7 @@
 import os
 import sys
 import logging
-from copy import deepcopy
+from fractions import Fraction
 from aoc_utilities import Input, test_input, OPS
 
 """
@@ -24,76 +24,103 @@ logger.addHandler(handler)
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
-MONKEYS = {}
 
-
-def load(data):
-    global MONKEYS
+# solve x op k = target for x (left) or k op x = target (right)
+SOLVE_LEFT = {
+    "+": lambda k, t: t - k,
+    "-": lambda k, t: t + k,
+    "*": lambda k, t: t / k,
+    "/": lambda k, t: t * k,
+}
+SOLVE_RIGHT = {
+    "+": lambda k, t: t - k,
+    "-": lambda k, t: k - t,
+    "*": lambda k, t: t / k,
+    "/": lambda k, t: k / t,
+}
+
+
+def compile_monkeys(data):
+    """Monkey jobs in topological order: every monkey comes after the 2
+    monkeys it waits for.
+
+    Returns the names, and the jobs as (number, op, a, b) tuples: number for
+    the monkeys yelling a number, op and the indexes of its operands for
+    the others. root is the last one.
+    """
+    jobs = {}
     for line in data.splitlines():
-        line = line.split()
-        if len(line) < 3:
-            MONKEYS[line[0][0:4]] = {"result": int(line[1])}
+        name, *job = line.replace(":", "").split()
+        jobs[name] = job
+
+    # depth first post order, without recursion (the dependency chains are
+    # thousands of monkeys long)
+    names, index = [], {}
+    stack = [("root", False)]
+    while stack:
+        name, ready = stack.pop()
+        if name in index:
+            continue
+        job = jobs[name]
+        if ready or len(job) == 1:
+            index[name] = len(names)
+            names.append(name)
+        else:
+            stack.append((name, True))
+            stack.append((job[2], False))
+            stack.append((job[0], False))
+
+    compiled = []
+    for name in names:
+        job = jobs[name]
+        if len(job) == 1:
+            compiled.append((Fraction(int(job[0])), None, None, None))
         else:
-            MONKEYS[line[0][0:4]] = {
-                "a": line[1],
-                "op": OPS[line[2]],
-                "b": line[3],
-            }
-    return
-
-
-def monkey_number(monkey_name):
-    global MONKEYS
-    if "result" in MONKEYS[monkey_name].keys():
-        return MONKEYS[monkey_name]["result"]
-    else:
-        res = int(
-            MONKEYS[monkey_name]["op"](
-                monkey_number(MONKEYS[monkey_name]["a"]),
-                monkey_number(MONKEYS[monkey_name]["b"]),
-            )
-        )
-        MONKEYS[monkey_name]["result"] = res
-        return res
+            compiled.append((None, job[1], index[job[0]], index[job[2]]))
+    return names, compiled
+
+
+def evaluate(jobs):
+    """Numbers of every monkey, in a single pass over the compiled jobs."""
+    values = []
+    for number, op, a, b in jobs:
+        values.append(number if op is None else OPS[op](values[a], values[b]))
+    return values
+
+
+def as_int(value):
+    return value.numerator if value.denominator == 1 else value
 
 
 def solve1(data):
     """Solves part 1."""
-    load(data)
-    return monkey_number("root")
+    _, jobs = compile_monkeys(data)
+    return as_int(evaluate(jobs)[-1])
 
 
 def solve2(data):
     """Solves part2."""
-    global MONKEYS
-    load(data)
-
-    FRESH_MONKEYS = deepcopy(MONKEYS)
-    """
-    MONKEYS["humn"]["result"] = "aze"
-    print(
-        f"MONKEYS['root']['a'] is {MONKEYS['root']['a']}, with value {monkey_number(MONKEYS['root']['a'])}"
-    )
-    print(
-        f"MONKEYS['root']['b'] is {MONKEYS['root']['b']}, with value {monkey_number(MONKEYS['root']['b'])}"
-    )
-    """
-    # monkey_number(MONKEYS['root']['a']) gives an error while monkey_number(MONKEYS['root']['b']) gives 150
-
-    # reset monkeys
-    new_humn = 6400000000000
-    MONKEYS["humn"]["result"] = new_humn
-    print(int(monkey_number(MONKEYS["root"]["a"])))
-
-    while int(monkey_number(MONKEYS["root"]["a"])) < 42130890593816:
-        new_humn /= 2
-        if new_humn % 1_000 == 0:
-            print(new_humn)
-        MONKEYS = deepcopy(FRESH_MONKEYS)
-        MONKEYS["humn"]["result"] = new_humn
-
-    print("found humn value to get equality: ")
-    return new_humn
+    names, jobs = compile_monkeys(data)
+    values = evaluate(jobs)
+    humn = names.index("humn")
+
+    # monkeys whose number depends on what humn yells
+    unknown = []
+    for i, (_, op, a, b) in enumerate(jobs):
+        unknown.append(i == humn or (op is not None and (unknown[a] or unknown[b])))
+    logger.info(f"{sum(unknown)} monkeys depend on humn, out of {len(jobs)}")
+
+    # root needs both operands equal: walk down from root to humn, undoing
+    # one operation at a time
+    _, _, a, b = jobs[-1]
+    i, target = (a, values[b]) if unknown[a] else (b, values[a])
+    while i != humn:
+        _, op, a, b = jobs[i]
+        if unknown[a]:
+            i, target = a, SOLVE_LEFT[op](values[b], target)
+        else:
+            i, target = b, SOLVE_RIGHT[op](values[a], target)
+    return as_int(target)
 
 
 """
@@ -5,6 +5,8 @@ import os
 import sys
 import logging
 from aoc_utilities import Input, test_input
+import re
+from math import isqrt
 
 """
 Logger config
@@ -23,245 +25,184 @@ logger.addHandler(handler)
 
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
-DIR_FACING = {0: ">", 1: "v", 2: "<", 3: "^"}
+# (dx, dy) for each facing: right, down, left, up
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
 
 
-def parser(data):
-    b, p = data.split("\n\n")
-    board = {}
-    for y, line in enumerate(b.splitlines(), 1):
-        for x, c in enumerate(line, 1):
-            if c != " ":
-                board[(x, y)] = c
-
-    path = []
-    nb = ""
-    while len(p) > 0:
-        l, p = p[0], p[1:]
-        if l.isdigit():
-            nb += l
-        else:
-            path.append(int(nb))
-            path.append(l)
-            nb = ""
-    if len(nb) > 0:
-        path.append(int(nb))
-    return board, path
-
-
-def turn(facing, d):
-    new_facing = facing + 1 if d == "R" else facing - 1
-    new_facing = 0 if new_facing == 4 else new_facing
-    new_facing = 3 if new_facing == -1 else new_facing
-    return new_facing
-
-
-def move(board, pos, facing, n):
-    x, y = pos
-    board[(x, y)] = DIR_FACING[facing]
-
-    if facing == 0:
-        dx, dy = 1, 0
-    elif facing == 1:
-        dx, dy = 0, 1
-    elif facing == 2:
-        dx, dy = -1, 0
-    elif facing == 3:
-        dx, dy = 0, -1
-
-    for i in range(n):
-
-        # compute potential new coordinates
-        if (x + dx, y + dy) in board.keys():
-            new_x, new_y = x + dx, y + dy
-        else:
-            # wrap around to the other side of the board
-            if facing == 0:
-                new_x, new_y = min([i for (i, j) in board.keys() if j == y]), y
-            elif facing == 1:
-                new_x, new_y = x, min([j for (i, j) in board.keys() if i == x])
-            elif facing == 2:
-                new_x, new_y = max([i for (i, j) in board.keys() if j == y]), y
-            elif facing == 3:
-                new_x, new_y = x, max([j for (i, j) in board.keys() if i == x])
-
-        if board[(new_x, new_y)] == "#":
-            # if we are in a wall, stop moving
-            break
-        else:
-            # keep moving!
-            x, y = new_x, new_y
-            board[(x, y)] = DIR_FACING[facing]
+def neg(v):
+    return tuple(-c for c in v)
 
-    return board, (x, y)
 
+class Board:
+    """The map, and how to get to the next tile from any tile and facing.
 
-def dump(m):
+    Positions are (x, y, facing) triples, 0-based. A state packs one in an
+    int: (y * width + x) * 4 + facing.
     """
-    Helper function to print a map
-    when the map is a dictionary, with keys as tuples of coordinates (1,2)
-    no need to have all the coordinates in the keys
+
+    def __init__(self, text):
+        lines = text.splitlines()
+        self.width = max(len(line) for line in lines)
+        self.height = len(lines)
+        self.tiles = [line.ljust(self.width) for line in lines]
+        self.size = isqrt(sum(c != " " for line in lines for c in line) // 6)
+        self.frames = self.fold()
+        self.by_normal = {n: face for face, (n, _, _) in self.frames.items()}
+
+    def __contains__(self, point):
+        x, y = point
+        return 0 <= x < self.width and 0 <= y < self.height and self.tiles[y][x] != " "
+
+    def state(self, x, y, facing):
+        return (y * self.width + x) * 4 + facing
+
+    def position(self, state):
+        i, facing = divmod(state, 4)
+        y, x = divmod(i, self.width)
+        return x, y, facing
+
+    def flat_wrap(self, x, y, facing):
+        """Part 1: back to the other end of the row or column."""
+        dx, dy = DIRECTIONS[facing]
+        while (x - dx, y - dy) in self:
+            x, y = x - dx, y - dy
+        return x, y, facing
+
+    def fold(self):
+        """Folds the net into a cube, from any layout.
+
+        Faces are identified by (x, y) // size, and each gets a frame of 3D
+        unit vectors: its outward normal, and the directions of x and y on
+        it. Walking the net from a face to the next one rolls the frame over
+        the edge between them.
+        """
+        s = self.size
+        faces = {
+            (x // s, y // s)
+            for y in range(0, self.height, s)
+            for x in range(0, self.width, s)
+            if (x, y) in self
+        }
+        first = min(faces, key=lambda f: (f[1], f[0]))
+        frames = {first: ((0, 0, 1), (1, 0, 0), (0, 1, 0))}
+        todo = [first]
+        while todo:
+            fx, fy = face = todo.pop()
+            n, r, d = frames[face]
+            rolled = (
+                (r, neg(n), d),  # right
+                (d, r, neg(n)),  # down
+                (neg(r), n, d),  # left
+                (neg(d), r, n),  # up
+            )
+            for (dx, dy), frame in zip(DIRECTIONS, rolled, strict=True):
+                neighbour = (fx + dx, fy + dy)
+                if neighbour in faces and neighbour not in frames:
+                    frames[neighbour] = frame
+                    todo.append(neighbour)
+        return frames
+
+    def cube_wrap(self, x, y, facing):
+        """Part 2: over the edge of the cube, onto the face glued to it."""
+        s = self.size
+        n, r, d = self.frames[(x // s, y // s)]
+        face = self.by_normal[(r, d, neg(r), neg(d))[facing]]
+        gn, gr, gd = self.frames[face]
+        # the edge of the new face touching the one we leave
+        edge = (gr, gd, neg(gr), neg(gd)).index(n)
+
+        # offset along the edges, and whether they run the same way
+        along, i = (d, y % s) if facing in (0, 2) else (r, x % s)
+        if along != (gd if edge in (0, 2) else gr):
+            i = s - 1 - i
+        gx, gy = ((s - 1, i), (i, s - 1), (0, i), (i, 0))[edge]
+        return face[0] * s + gx, face[1] * s + gy, (edge + 2) % 4
+
+    def moves(self, wrap):
+        """Runs of moves, stepping to the next tile with `wrap` when it is
+        off the map."""
+        following = {}
+        for y, line in enumerate(self.tiles):
+            for x, tile in enumerate(line):
+                if tile != ".":
+                    continue
+                for facing, (dx, dy) in enumerate(DIRECTIONS):
+                    nx, ny, nf = (
+                        (x + dx, y + dy, facing)
+                        if (x + dx, y + dy) in self
+                        else wrap(x, y, facing)
+                    )
+                    state = self.state(x, y, facing)
+                    # facing a wall, moving keeps us in place
+                    blocked = self.tiles[ny][nx] == "#"
+                    following[state] = state if blocked else self.state(nx, ny, nf)
+        return Runs(following)
+
+
+class Runs:
+    """Splits the states into runs, for moves of n tiles in O(1).
+
+    Moves can be undone (step back), so a state is the next one of at most
+    one other state: states form lines ending in front of a wall, and loops
+    without any wall.
     """
-    xmin = 1
-    xmax = max([int(i) for (i, j) in m.keys()])
-    ymin = 1
-    ymax = max([int(j) for (i, j) in m.keys()])
-    dump = ""
-    for y in range(ymin, ymax + 1, 1):
-        for x in range(xmin, xmax + 1):
-            dump += str(m.get((x, y), " "))
-        dump += "\n"
-    return dump
 
+    def __init__(self, following):
+        previous = {b: a for a, b in following.items() if a != b}
+        self.runs = []
+        self.run_of = {}
+        starts = [s for s in following if s not in previous]
+        # lines first, from their start; what is left is loops
+        for start in starts + list(following):
+            if start in self.run_of:
+                continue
+            run = [start]
+            state = following[start]
+            while state != run[-1] and state != start:
+                run.append(state)
+                state = following[state]
+            looping = state == start and len(run) > 1
+            for i, state in enumerate(run):
+                self.run_of[state] = (len(self.runs), i)
+            self.runs.append((run, looping))
+
+    def forward(self, state, n):
+        k, i = self.run_of[state]
+        run, looping = self.runs[k]
+        return run[(i + n) % len(run)] if looping else run[min(i + n, len(run) - 1)]
 
-def solve1(data):
-    """Solves part 1."""
+
+def parser(data):
+    b, p = data.split("\n\n")
+    return Board(b), re.findall(r"\d+|[LR]", p)
+
+
+def password(data, cube):
     board, path = parser(data)
-    pos = (min([x for (x, y) in board.keys() if y == 1]), 1)
-    facing = 0
+    moves = board.moves(board.cube_wrap if cube else board.flat_wrap)
+    state = board.state(board.tiles[0].index("."), 0, 0)
     for ins in path:
-        if isinstance(ins, int):
-            board, pos = move(board, pos, facing, ins)
+        if ins == "R":
+            state = state - state % 4 + (state + 1) % 4
+        elif ins == "L":
+            state = state - state % 4 + (state - 1) % 4
         else:
-            facing = turn(facing, ins)
-        print(f"after move {ins}, position is {pos} with facing {facing}")
-    print(dump(board))
-    return 1000 * pos[1] + 4 * pos[0] + facing
-    # 152 022 too low
-    # 34 430 too low
-
+            state = moves.forward(state, int(ins))
+        logger.info(f"after {ins}, (x, y, facing) is {board.position(state)}")
+    x, y, facing = board.position(state)
+    return 1000 * (y + 1) + 4 * (x + 1) + facing
 
-def move2(board, pos, facing, n):
-    x, y = pos
-    board[(x, y)] = DIR_FACING[facing]
-    square_size = len([x for x, y in board.keys() if y == 1])
-
-    for i in range(n):
-        if facing == 0:
-            dx, dy = 1, 0
-        elif facing == 1:
-            dx, dy = 0, 1
-        elif facing == 2:
-            dx, dy = -1, 0
-        elif facing == 3:
-            dx, dy = 0, -1
-
-        # compute potential new coordinates
-        if (x + dx, y + dy) in board.keys():
-            new_x, new_y = x + dx, y + dy
-            new_facing = facing
-        else:
-            # wrap around to the other side of the board
-
-            # moving RIGHT
-            if facing == 0 and y // square_size == 0 and x == 3 * square_size:
-                # from 1 to 6
-                new_x = 4 * square_size - (x - 2 * square_size)
-                new_y = 3 * square_size - y + 1
-                new_facing = 2
-            if facing == 0 and y // square_size == 1 and x == 3 * square_size:
-                # from 4 to 6
-                print("going from 4 to 6")
-                new_x = 5 * square_size - y + 1
-                new_y = 2 * square_size + 1
-                new_facing = 1
-            if facing == 0 and y // square_size == 2 and x == 4 * square_size:
-                # from 6 to 1
-                new_x = 3 * square_size
-                new_y = square_size - (y - 2 * square_size) + 1
-                new_facing = 2
-
-            # moving DOWN
-            elif facing == 1 and x // square_size == 0 and y == 2 * square_size:
-                # from 2 to 5
-                new_x = 2 * square_size + x
-                new_y = 3 * square_size
-                new_facing = 3
-            elif facing == 1 and x // square_size == 1 and y == 2 * square_size:
-                # from 3 to 5
-                new_x = 2 * square_size + 1
-                new_y = 3 * square_size - (x - square_size)
-                new_facing = 0
-            elif facing == 1 and x // square_size == 2 and y == 3 * square_size:
-                # from 5 to 2
-                new_x = 3 * square_size - x + 1
-                new_y = 2 * square_size
-                new_facing = 3
-            elif facing == 1 and x // square_size == 3 and y == 3 * square_size:
-                # from 6 to 2
-                new_x = 1
-                new_y = 5 * square_size - x
-                new_facing = 0
-
-            # moving LEFT
-            elif facing == 2 and y // square_size == 0 and x == 2 * square_size + 1:
-                # from 1 to 3
-                new_x = y + square_size
-                new_y = square_size + 1
-                new_facing = 1
-            elif facing == 2 and y // square_size == 1 and x == 1:
-                # from 2 to 6
-                new_x = 5 * square_size - y
-                new_y = 3 * square_size
-                new_facing = 0
-            elif facing == 2 and y // square_size == 2 and x == 2 * square_size + 1:
-                # from 5 to 3
-                new_x = 4 * square_size - y
-                new_y = 2 * square_size
-                new_facing = 3
-
-            # moving UP
-            elif facing == 3 and x // square_size == 0 and y == square_size + 1:
-                # from 2 to 1
-                new_x = 2 * square_size + 1
-                new_y = 3 * square_size - x
-                new_facing = 1
-            elif facing == 3 and x // square_size == 1 and y == square_size + 1:
-                # from 3 to 1
-                new_x = 2 * square_size + 1
-                new_y = x - square_size
-                new_facing = 0
-            elif facing == 3 and x // square_size == 2 and y == 1:
-                # from 1 to 2
-                new_x = 3 * square_size - y
-                new_y = square_size + 1
-                new_facing = 1
-            elif facing == 3 and x // square_size == 3 and y == 2 * square_size + 1:
-                # from 6 to 4
-                new_x = 3 * square_size
-                new_y = 5 * square_size - x
-                new_facing = 2
-
-        if board[(new_x, new_y)] == "#":
-            # if we are in a wall, stop moving
-            break
-        else:
-            # keep moving!
-            x, y = new_x, new_y
-            facing = new_facing
-            board[(x, y)] = DIR_FACING[facing]
 
-    return board, (x, y), facing
+def solve1(data):
+    """Solves part 1."""
+    return password(data, cube=False)
+    # 152 022 too low
+    # 34 430 too low
 
 
 def solve2(data):
     """Solves part2."""
-    board, path = parser(data)
-    pos = (min([x for (x, y) in board.keys() if y == 1]), 1)
-    facing = 0
-    for ins in path:
-        if isinstance(ins, int):
-            board, pos, facing = move2(board, pos, facing, ins)
-        else:
-            facing = turn(facing, ins)
-        print(f"after move {ins}, position is {pos} with facing {facing}")
-        print(dump(board))
-    return 1000 * pos[1] + 4 * pos[0] + facing
-    # I did like any noob and wrote up all the edge connections for the test case,
-    # it works....
-    # and only then I found the input was in a different shape (WTF!)
-
-    # elegant generic strategy here : https://www.reddit.com/r/adventofcode/comments/zsct8w/comment/j18dzaa/?utm_source=share&utm_medium=web2x&context=3
+    return password(data, cube=True)
 
 
 """
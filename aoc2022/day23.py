@@ -4,7 +4,7 @@
 import os
 import sys
 import logging
-from aoc_utilities import Input, test_input, neighbors_all
+from aoc_utilities import Input, test_input
 
 """
 Logger config
@@ -25,162 +25,133 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def parser(data):
-    ground = set()
-    y = 0
-    for line in data.splitlines():
-        for x, c in enumerate([i for i in line]):
-            if c == "#":
-                ground.add((x, y))
-        y -= 1
-    return ground
-
-
-def delta_dir(d):
-    """returns dx,dy according to direction"""
-    if d == "N":
-        return 0, +1
-    if d == "S":
-        return 0, -1
-    if d == "E":
-        return 1, 0
-    if d == "W":
-        return -1, 0
-
-
-def move_check(x, y, d):
-    if d == "N":
-        return (x - 1, y + 1), (x, y + 1), (x + 1, y + 1)
-    if d == "S":
-        return (x - 1, y - 1), (x, y - 1), (x + 1, y - 1)
-    if d == "E":
-        return (x + 1, y + 1), (x + 1, y), (x + 1, y - 1)
-    if d == "W":
-        return (x - 1, y + 1), (x - 1, y), (x - 1, y - 1)
-
-
-def mdump(ground):
-    """
-    Helper function to print a map
-    when the map is a set,
+# bits kept free on the west side of the rows (bit x is column x, bits only
+# grow to the east), and added again when an elf gets to column 0
+MARGIN = 64
+
+
+class Elves:
+    """The ground, as one int per row: bit x of rows[y] is set when an elf
+    stands at (x, y), y growing southwards.
+
+    A round works on whole rows with shifts and ANDs: the free sides of
+    every elf of a row come from the row and its 2 neighbours, and 2 elves
+    can only propose the same tile from opposite sides (an elf moving north
+    needs the tile to the east of its target free, and so on), so conflicts
+    are the overlaps of north and south proposals, or west and east ones.
+    The first and last rows are always kept empty.
     """
-    xmin = min([int(i) for (i, j) in ground])
-    xmax = max([int(i) for (i, j) in ground])
-    ymin = min([int(j) for (i, j) in ground])
-    ymax = max([int(j) for (i, j) in ground])
-    dump = ""
-    for y in range(ymax, ymin - 1, -1):
-        for x in range(xmin, xmax + 1):
-            if (x, y) in ground:
-                dump += "#"
-            else:
-                dump += "."
-        dump += "\n"
-    return dump
+
+    def __init__(self, data):
+        self.rows = [0]
+        for line in data.splitlines():
+            row = 0
+            for x, c in enumerate(line):
+                if c == "#":
+                    row |= 1 << (x + MARGIN)
+            self.rows.append(row)
+        self.rows.append(0)
+        self.rounds = 0
+
+    def proposals(self):
+        """Masks of the elves proposing to go north, south, west and east,
+        row by row."""
+        rows = self.rows
+        height = len(rows)
+        moves = {d: [0] * height for d in "NSWE"}
+        order = "NSWE"[self.rounds % 4 :] + "NSWE"[: self.rounds % 4]
+        for y in range(1, height - 1):
+            elves = rows[y]
+            if not elves:
+                continue
+            north, south = rows[y - 1], rows[y + 1]
+            column = north | elves | south
+            free = {
+                "N": ~(north | north << 1 | north >> 1),
+                "S": ~(south | south << 1 | south >> 1),
+                "W": ~(column << 1),
+                "E": ~(column >> 1),
+            }
+            # elves without any neighbour stay
+            left = elves & ~(free["N"] & free["S"] & free["W"] & free["E"])
+            for d in order:
+                moves[d][y] = left & free[d]
+                left &= ~free[d]
+        return moves
+
+    def spread(self):
+        """Plays a round, returns whether any elf moved."""
+        moves = self.proposals()
+        north, south, west, east = (moves[d] for d in "NSWE")
+        rows = self.rows
+        height = len(rows)
+        new_rows = [0] * height
+        for y in range(height):
+            # rows 0 and height - 1 are empty: elves only move into them
+            into_north = north[y + 1] if y < height - 1 else 0  # from below
+            into_south = south[y - 1] if y > 0 else 0
+            into_west = west[y] >> 1
+            into_east = east[y] << 1
+            stuck = (
+                north[y] & (south[y - 2] if y > 1 else 0)
+                | south[y] & (north[y + 2] if y < height - 2 else 0)
+                | west[y] & east[y] << 2
+                | east[y] & west[y] >> 2
+            )
+            new_rows[y] = (
+                rows[y] & ~(north[y] | south[y] | west[y] | east[y])
+                | stuck
+                | into_north ^ into_south
+                | into_west ^ into_east
+            )
+        moved = new_rows != rows
+        self.rows = rows = new_rows
+        self.rounds += 1
+
+        if rows[0]:
+            rows.insert(0, 0)
+        if rows[-1]:
+            rows.append(0)
+        if any(row & 1 for row in rows):
+            self.rows = [row << MARGIN for row in rows]
+        return moved
+
+    def bounds(self):
+        filled = [y for y, row in enumerate(self.rows) if row]
+        xmin = min((row & -row).bit_length() - 1 for row in self.rows if row)
+        xmax = max(row.bit_length() - 1 for row in self.rows)
+        return xmin, xmax, filled[0], filled[-1]
+
+    def empty_ground(self):
+        xmin, xmax, ymin, ymax = self.bounds()
+        elves = sum(row.bit_count() for row in self.rows)
+        return (xmax - xmin + 1) * (ymax - ymin + 1) - elves
+
+    def __str__(self):
+        xmin, xmax, ymin, ymax = self.bounds()
+        return "\n".join(
+            "".join(".#"[row >> x & 1] for x in range(xmin, xmax + 1))
+            for row in self.rows[ymin : ymax + 1]
+        )
 
 
 def solve1(data):
     """Solves part 1."""
-    ground = parser(data)
-    directions = ["N", "S", "W", "E"]
-    d = 0
-
-    print("initial state: ")
-    print(mdump(ground))
-    print()
-
-    # first half
-    # each Elf considers the eight positions adjacent to themself.
-    #   - If no other Elves are in one of those eight positions, the Elf does not do anything during this round
-    #   - Otherwise, the Elf looks in each of four directions in the following order and proposes moving one step in the first valid direction:
-
-    for r in range(1, 11):
-        moves = {}
-        for e in ground:
-            neighbors = neighbors_all(e)
-            if any(n in ground for n in neighbors):
-                # there is at least one elf around, add a suggested move
-                for i in range(4):
-                    dx, dy = delta_dir(directions[(d + i) % 4])
-                    if not any(
-                        [
-                            x in ground
-                            for x in move_check(e[0], e[1], directions[(d + i) % 4])
-                        ]
-                    ):
-                        moves[e] = e[0] + dx, e[1] + dy
-                        break
-
-        # second half
-        # Simultaneously, each Elf moves to their proposed destination tile if they were the only Elf to propose moving to that position.
-        # If two or more Elves propose moving to the same position, none of those Elves move.
-        for source, target in moves.items():
-            if len(set([k for k, v in moves.items() if v == target])) == 1:
-                ground.remove(source)
-                ground.add(target)
-
-        # the first direction the Elves considered is moved to the end of the list of directions.
-        d = (d + 1) % 4
-
-        print(f"after round {r}:")
-        print(mdump(ground))
-        print()
-
-    return mdump(ground).count(".")
+    elves = Elves(data)
+    logger.info(f"initial state:\n{elves}\n")
+    for _ in range(10):
+        elves.spread()
+        logger.info(f"after round {elves.rounds}:\n{elves}\n")
+    return elves.empty_ground()
 
 
 def solve2(data):
     """Solves part2."""
-
-    ground = parser(data)
-    directions = ["N", "S", "W", "E"]
-    d = 0
-
-    print("initial state: ")
-    print(mdump(ground))
-    print()
-
-    # first half
-    # each Elf considers the eight positions adjacent to themself.
-    #   - If no other Elves are in one of those eight positions, the Elf does not do anything during this round
-    #   - Otherwise, the Elf looks in each of four directions in the following order and proposes moving one step in the first valid direction:
-
-    for r in range(100_000_000_000):
-        moving = False
-        moves = {}
-        for e in ground:
-            neighbors = neighbors_all(e)
-            if any(n in ground for n in neighbors):
-                # there is at least one elf around, add a suggested move
-                for i in range(4):
-                    dx, dy = delta_dir(directions[(d + i) % 4])
-                    if not any(
-                        [
-                            x in ground
-                            for x in move_check(e[0], e[1], directions[(d + i) % 4])
-                        ]
-                    ):
-                        moves[e] = e[0] + dx, e[1] + dy
-                        break
-
-        # second half
-        # Simultaneously, each Elf moves to their proposed destination tile if they were the only Elf to propose moving to that position.
-        # If two or more Elves propose moving to the same position, none of those Elves move.
-        for source, target in moves.items():
-            if len(set([k for k, v in moves.items() if v == target])) == 1:
-                ground.remove(source)
-                ground.add(target)
-                moving = True
-
-        # the first direction the Elves considered is moved to the end of the list of directions.
-        d = (d + 1) % 4
-
-        # print(mdump(ground))
-        # print()
-
-        if not moving:
-            print(f"the first round where no Elf moved was round {r + 1}:")
-            return f"no more moves after {r}"
+    elves = Elves(data)
+    while elves.spread():
+        pass
+    logger.info(f"the first round where no Elf moved was round {elves.rounds}")
+    return elves.rounds
 
 
 """
@@ -4,10 +4,9 @@
 import os
 import sys
 import logging
-from functools import lru_cache
+from math import lcm
 
-
-from aoc_utilities import Input, test_input, neighbors_4
+from aoc_utilities import Input, test_input
 
 """
 Logger config
@@ -27,221 +26,97 @@ logger.addHandler(handler)
 # 2 digit day fetched from filename
 DAY = os.path.basename(__file__)[3:5]
 
-file_handler = logging.FileHandler("day" + DAY + ".log")
-file_handler.setFormatter(formatter)
-logger.addHandler(file_handler)
-
-
-CURRENT_MIN = 10000
-CACHE = set()
-
-
 def parser(data):
-    up, down, left, right = set(), set(), set(), set()
+    """returns the valley size, the columns of the entrance and exit, and for
+    each kind of blizzard (^, v, <, >) one bitmask per row of the valley:
+    bit x is set when there is such a blizzard at column x (walls excluded)"""
     lines = data.splitlines()
-    max_y = len(lines) - 2
-    max_x = len(lines[0]) - 2
-    for y, line in enumerate(lines):
-        # careful : y increases as you move down the map
-        for x, c in enumerate([i for i in line]):
-            if c == "^":
-                up.add((x, y))
-            elif c == ">":
-                right.add((x, y))
-            elif c == "v":
-                down.add((x, y))
-            elif c == "<":
-                left.add((x, y))
-            elif y == 0 and c == ".":
-                start = (x, y)
-            elif y == len(lines) - 1 and c == ".":
-                end = (x, y)
-
-    return start, end, max_x, max_y, up, down, left, right
-
-
-def dump(max_x, max_y, up, down, left, right, pos):
-    xmin = 1
-    xmax = max_x
-    ymin = 1
-    ymax = max_y
-    dump = ""
-    for y in range(ymin, ymax + 1, 1):
-        dump += "  "
-        for x in range(xmin, xmax + 1):
-            count = sum([(x, y) in s for s in [up, down, left, right]])
-            if (x, y) == pos:
-                dump += "E"
-            elif count > 1:
-                dump += str(count)
-            elif count == 0:
-                dump += "."
-            elif (x, y) in up:
-                dump += "^"
-            elif (x, y) in down:
-                dump += "v"
-            elif (x, y) in left:
-                dump += "<"
-            elif (x, y) in right:
-                dump += ">"
-        dump += "\n"
-    return dump
-
-
-@lru_cache(maxsize=None)
-def next_blizzards(max_x, max_y, up, down, left, right):
-    new_up, new_down, new_left, new_right = set(), set(), set(), set()
-    for (i, j) in up:
-        new_up.add((i, j - 1)) if j - 1 >= 1 else new_up.add((i, max_y))
-    for (i, j) in down:
-        new_down.add((i, j + 1)) if j + 1 <= max_y else new_down.add((i, 1))
-    for (i, j) in left:
-        new_left.add((i - 1, j)) if i - 1 >= 1 else new_left.add((max_x, j))
-    for (i, j) in right:
-        new_right.add((i + 1, j)) if i + 1 <= max_x else new_right.add((1, j))
-    return new_up, new_down, new_left, new_right
-
-
-def manhattan(a, b):
-    return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-
-def iterate(minutes, pos, up, down, left, right, end, max_x, max_y):
-    global CURRENT_MIN
-    global CACHE
-    logger.info(f"after minute {minutes}, E is at pos {pos}")
-
-    if minutes + manhattan(pos, end) >= CURRENT_MIN:
-        logger.info(
-            "  This path will take longer than our current solution, let's kill it"
-        )
-        return float("inf"), up, down, left, right
-
-    key = (
-        pos,
-        tuple(sorted(list(up))),
-        tuple(sorted(list(down))),
-        tuple(sorted(list(right))),
-        tuple(sorted(list(left))),
-    )
-    if key in CACHE:
-        # we are in a circle
-        logger.info(f"  we found a circle!")
-        return float("inf"), up, down, left, right
-    else:
-        logger.debug(f"  add new key to cache at minute {minutes}: {key}")
-        CACHE.add(key)
-
-    minutes += 1
-
-    # logger.debug(dump(max_x, max_y, up, down, left, right, pos))
-
-    up, down, left, right = next_blizzards(max_x, max_y, up, down, left, right)
-    all_blizzards = up.union(down, left, right)
-
-    options = []
-
-    for n in neighbors_4(pos):
-        if n == end:
-            logger.warning(f"  we found a path in {minutes + 1}min!")
-            up, down, left, right = next_blizzards(max_x, max_y, up, down, left, right)
-            if minutes < CURRENT_MIN:
-                CURRENT_MIN = minutes + 1
-            return minutes + 1, up, down, left, right
-
-        if 1 <= n[0] <= max_x and 1 <= n[1] <= max_y:
-            if n not in all_blizzards:
-                logger.info(f"  E can move from {pos} to {n}")
-                options.append((minutes, n, up, down, left, right, end, max_x, max_y))
-
-    # add wait option
-    if pos not in all_blizzards:
-        logger.info(f"  E can stay at {pos}")
-        options.append((minutes, pos, up, down, left, right, end, max_x, max_y))
-
-    # add simple heuristic to investigate first the path that minimize the distance to the end
-    options = sorted(options, key=lambda x: manhattan(x[1], x[6]))
-
-    if len(options) > 0:
-        return min([iterate(*option) for option in options], key=lambda x: x[0])
-    else:
-        # this is a dead end
-        logger.info(
-            f"  dead end: there is no options for position {pos} at minute {minutes}"
-        )
-        return float("inf"), up, down, left, right
+    rows = [line[1:-1] for line in lines[1:-1]]
+    width, height = len(rows[0]), len(rows)
+    start_x = lines[0].index(".") - 1
+    end_x = lines[-1].index(".") - 1
+    masks = {
+        c: [sum(1 << x for x, b in enumerate(row) if b == c) for row in rows]
+        for c in "^v<>"
+    }
+    return width, height, start_x, end_x, masks
+
+
+def free_cells(width, height, masks):
+    """Cells free of blizzards at every minute of the blizzards period, each
+    minute being one int: cell (x, y) is bit y * (width + 1) + x.
+
+    Horizontal blizzards rotate within their row. Vertical ones stay in their
+    column: the ^ blizzards in row y at minute t are the ones that were in
+    row y + t at minute 0, so they are a row mask too.
+    The extra bit at the end of each row is never free: moves spilling over
+    a row end are wiped out by the & with free cells.
+    """
+    stride = width + 1
+    row = (1 << width) - 1
+    free = []
+    for t in range(lcm(width, height)):
+        shift = t % width
+        cells = 0
+        for y in range(height):
+            blocked = (
+                masks[">"][y] << shift
+                | masks[">"][y] >> (width - shift)
+                | masks["<"][y] >> shift
+                | masks["<"][y] << (width - shift)
+                | masks["^"][(y + t) % height]
+                | masks["v"][(y - t) % height]
+            )
+            cells |= (row & ~blocked) << (y * stride)
+        free.append(cells)
+    return free
+
+
+def cross(free, stride, minute, entry, exit):
+    """Minute at which the other side of the valley is reached, leaving at
+    minute from the cell next to entry (a bit), exiting from the cell exit.
+
+    Every position reachable at a minute is a bit of one int, so a minute
+    is a handful of shifts and ands over the whole valley.
+    """
+    reached = 0
+    while True:
+        minute += 1
+        reached = (
+            reached
+            | reached << 1
+            | reached >> 1
+            | reached << stride
+            | reached >> stride
+            | entry  # waiting outside the valley is always possible
+        ) & free[minute % len(free)]
+        if reached & exit:
+            # 1 more minute to step out of the valley
+            return minute + 1
 
 
 def solve1(data):
     """Solves part 1."""
-    start, end, max_x, max_y, up, down, left, right = parser(data)
-    up, down, left, right = next_blizzards(max_x, max_y, up, down, left, right)
-    return iterate(
-        0,
-        start,
-        up,
-        down,
-        left,
-        right,
-        end,
-        max_x,
-        max_y,
-    )[0]
+    width, height, start_x, end_x, masks = parser(data)
+    free = free_cells(width, height, masks)
+    top = 1 << start_x
+    bottom = 1 << ((height - 1) * (width + 1) + end_x)
+    return cross(free, width + 1, 0, top, bottom)
 
 
 def solve2(data):
     """Solves part2."""
-    start, end, max_x, max_y, up, down, left, right = parser(data)
-    global CACHE, CURRENT_MIN
-
-    up, down, left, right = next_blizzards(max_x, max_y, up, down, left, right)
-
-    min1, up, down, left, right = iterate(
-        0,
-        start,
-        up,
-        down,
-        left,
-        right,
-        end,
-        max_x,
-        max_y,
-    )
-    logger.warning(f"part 1 took {min1}")
-    # print(dump(max_x, max_y, up, down, left, right, end))
-
-    CACHE = set()
-    CURRENT_MIN = float("inf")
-    min2, up, down, left, right = iterate(
-        0,
-        end,
-        up,
-        down,
-        left,
-        right,
-        start,
-        max_x,
-        max_y,
-    )
-    logger.warning(f"part 2 took {min2}")
-    # print(dump(max_x, max_y, up, down, left, right, end))
-
-    CACHE = set()
-    CURRENT_MIN = float("inf")
-    min3, up, down, left, right = iterate(
-        0,
-        start,
-        up,
-        down,
-        left,
-        right,
-        end,
-        max_x,
-        max_y,
-    )
-    logger.warning(f"part 3 took {min3}")
-
-    return min1 + min2 + min3
+    width, height, start_x, end_x, masks = parser(data)
+    free = free_cells(width, height, masks)
+    top = 1 << start_x
+    bottom = 1 << ((height - 1) * (width + 1) + end_x)
+
+    # the same free cells serve the 3 trips, only the starting minute changes
+    minute = cross(free, width + 1, 0, top, bottom)
+    logger.info(f"end reached after {minute}min")
+    minute = cross(free, width + 1, minute, bottom, top)
+    logger.info(f"back to start after {minute}min")
+    return cross(free, width + 1, minute, top, bottom)
 
 
 """
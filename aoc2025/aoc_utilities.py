@@ -1,7 +1,18 @@
+import functools
+import io
 import operator
-import time
+import os
+import sys
 from itertools import product
 
+# the repo-level `aoc` package (python -m aoc) holds the tooling shared by every year
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aoc import search  # noqa: E402, F401
+from aoc.cache import cached_parser  # noqa: E402, F401
+from aoc.grid import Grid  # noqa: E402, F401
+from aoc.timing import timed  # noqa: E402
+
 OPS = {
     "+": operator.add,
     "-": operator.sub,
@@ -20,13 +31,15 @@ def parse_words(text: str) -> list[str]:
 def Input(day):
     "Open this day's input file."
     filename = f"./input_files/input{day}.txt"
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def test_input(day):
     "Open this day's test input file"
     filename = f"./input_files/input{day}.test.txt"
-    return open(filename)
+    with open(filename) as f:
+        return io.StringIO(f.read())
 
 
 def neighbors_all(point: tuple[int, ...]) -> set[tuple[int, ...]]:
@@ -38,10 +51,10 @@ def neighbors_all(point: tuple[int, ...]) -> set[tuple[int, ...]]:
 
     Examples :
     >>> import aoc_utilities
-    >>> aoc_utilities.neighbors_all((0,0))
-    {(0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, 0), (1, -1), (1, 1)}
-    >>> aoc_utilities.neighbors_all((0,0,0))
-    {(0, 1, 1), (1, -1, -1), (1, 0, 0), (-1, 0, -1), (0, 0, 1), (0, -1, 1), (1, 0, 1), (-1, -1, -1), (-1, 1, -1), (0, -1, 0), (1, 1, 1), (-1, 1, 0), (1, 1, 0), (1, 1, -1), (-1, 1, 1), (-1, -1, 1), (1, -1, 0), (0, -1, -1), (-1, -1, 0), (0, 0, -1), (-1, 0, 1), (1, 0, -1), (1, -1, 1), (-1, 0, 0), (0, 1, 0), (0, 1, -1)}
+    >>> sorted(aoc_utilities.neighbors_all((0,0)))
+    [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+    >>> sorted(aoc_utilities.neighbors_all((0,0,0)))
+    [(-1, -1, -1), (-1, -1, 0), (-1, -1, 1), (-1, 0, -1), (-1, 0, 0), (-1, 0, 1), (-1, 1, -1), (-1, 1, 0), (-1, 1, 1), (0, -1, -1), (0, -1, 0), (0, -1, 1), (0, 0, -1), (0, 0, 1), (0, 1, -1), (0, 1, 0), (0, 1, 1), (1, -1, -1), (1, -1, 0), (1, -1, 1), (1, 0, -1), (1, 0, 0), (1, 0, 1), (1, 1, -1), (1, 1, 0), (1, 1, 1)]
     >>> len(aoc_utilities.neighbors_all((0,0)))
     8
     >>> len(aoc_utilities.neighbors_all((0,0,0)))
@@ -49,8 +62,18 @@ def neighbors_all(point: tuple[int, ...]) -> set[tuple[int, ...]]:
     >>> len(aoc_utilities.neighbors_all((0,0,0,0)))
     80"""
 
-    ranges = ((c - 1, c, c + 1) for c in point)
-    return set(product(*ranges)) - {point}
+    return {
+        tuple(c + d for c, d in zip(point, offset, strict=True))
+        for offset in neighbor_offsets(len(point))
+    }
+
+
+@functools.cache
+def neighbor_offsets(dimensions: int) -> tuple[tuple[int, ...], ...]:
+    """the 3**dimensions - 1 offsets to the neighbors of a point, computed once
+    per number of dimensions"""
+    zero = (0,) * dimensions
+    return tuple(o for o in product((-1, 0, 1), repeat=dimensions) if o != zero)
 
 
 def neighbors_4(pos: tuple[int, int]) -> list[tuple[int, int]]:
@@ -93,11 +116,12 @@ def timer_func(func):
     # This function shows the execution time of
     # the function object passed
     # (to be used as a wraper)
+    # the measure is also recorded in the aoc.timing registry (cpu time, memory, ...)
+    @functools.wraps(func)
     def wrap_func(*args: object, **kwargs: object) -> object:
-        t1 = time.time()
-        result = func(*args, **kwargs)
-        t2 = time.time()
-        print(f"\n⏱️ Function {func.__name__!r} executed in {(t2 - t1):.4f}s")
+        with timed(func.__name__) as t:
+            result = func(*args, **kwargs)
+        print(f"\n⏱️ Function {func.__name__!r} executed in {t.wall:.4f}s")
         return result
 
     return wrap_func
@@ -5,7 +5,7 @@ import logging
 import os
 import sys
 
-from aoc_utilities import Input, neighbors_all, test_input, timer_func
+from aoc_utilities import Grid, Input, test_input, timer_func
 
 """
 Logger config
@@ -24,56 +24,50 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
-def parser(data: str) -> set[tuple[int, int]]:
-    grid = set()
-    for y, line in enumerate(data.splitlines()):
-        for x, c in enumerate(line.strip()):
-            if c == "@":
-                grid.add((x, y))
-    return grid
+ROLL = ord("@")
+EMPTY = ord(".")
+
+
+def parser(data: str) -> Grid:
+    return Grid.from_text(data)
+
+
+def is_accessible(grid: Grid, roll: int) -> bool:
+    """less than 4 rolls among the 8 neighbors (the grid border never holds a roll)"""
+    data = grid.data
+    return sum(data[roll + o] == ROLL for o in grid.offsets8) < 4
 
 
 @timer_func
 def solve1(data: str) -> int:
     """Solves part 1."""
     grid = parser(data)
-    accessible_rolls = 0
-    for roll in grid:
-        neighbors = neighbors_all(roll)
-        neighboring_rolls = neighbors & grid
-        if len(neighboring_rolls) < 4:
-            accessible_rolls += 1
+    return sum(is_accessible(grid, roll) for roll in grid.find(ROLL))
 
-    return accessible_rolls
 
+def remove_rolls(grid: Grid) -> int:
+    """Removes accessible rolls until none is left, returns the number of removed rolls.
 
-def remove_rolls(grid: set[tuple[int, int]]) -> set[tuple[int, int]]:
-    # As it is not allowed to modify a set while iterating on it
-    # we iterate on a "list" copy of the set created by list()
-    for roll in list(grid):
-        neighbors = neighbors_all(roll)
-        neighboring_rolls = neighbors & grid
-        if len(neighboring_rolls) < 4:
-            grid.remove(roll)
-    return grid
+    Removing a roll can only make its neighbors accessible: those are the only
+    ones to check again, instead of scanning the whole grid for each iteration.
+    """
+    data = grid.data
+    removed = 0
+    to_check = list(grid.find(ROLL))
+    while to_check:
+        roll = to_check.pop()
+        if data[roll] == ROLL and is_accessible(grid, roll):
+            data[roll] = EMPTY
+            removed += 1
+            to_check.extend(roll + o for o in grid.offsets8 if data[roll + o] == ROLL)
+    return removed
 
 
 @timer_func
 def solve2(data: str) -> int:
     """Solves part2."""
     grid = parser(data)
-    initial_count = len(grid)
-
-    prev_count = initial_count
-    while True:
-        grid = remove_rolls(grid)
-        new_count = len(grid)
-        if new_count == prev_count:
-            break
-        logger.info(f"new iteration removed {prev_count - new_count} rolls")
-        prev_count = new_count
-
-    return initial_count - new_count
+    return remove_rolls(grid)
 
 
 """
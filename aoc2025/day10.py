@@ -1,16 +1,14 @@
 #!/usr/bin/env python3
 """This script solves puzzles of https://adventofcode.com/"""
 
-import heapq
 import logging
 import os
 import random
 import sys
-from collections import deque
 
 import z3
 
-from aoc_utilities import Input, test_input, timer_func
+from aoc_utilities import Input, search, test_input, timer_func
 
 """
 Logger config
@@ -111,33 +109,17 @@ def min_button_presses(
 def min_button_presses_bfs(
     target_light_diagram: list[bool], buttons: tuple[tuple[int, ...], ...]
 ):
-    target = tuple(target_light_diagram)
-    start = tuple([False] * len(target_light_diagram))
+    # lights and buttons as bitmasks: pushing a button is a xor
+    target = sum(1 << i for i, light in enumerate(target_light_diagram) if light)
+    masks = [sum(1 << i for i in button) for button in buttons]
 
-    if start == target:
-        return 0
-
-    queue = deque([(start, 0)])
-    visited = {start}
-
-    while queue:
-        state, presses = queue.popleft()
-
-        for button in buttons:
-            # Create new state by applying button
-            new_state = list(state)
-            for i in button:
-                new_state[i] = not new_state[i]
-            new_state = tuple(new_state)
-
-            if new_state == target:
-                return presses + 1
-
-            if new_state not in visited:
-                visited.add(new_state)
-                queue.append((new_state, presses + 1))
-
-    return "No solution found"
+    found = search.bfs(
+        [0], lambda state: (state ^ mask for mask in masks), lambda s: s == target
+    )
+    logger.info(f"  search stats: {found.stats}")
+    if found.goal is None:
+        return "No solution found"
+    return found.cost
 
 
 @timer_func
@@ -167,62 +149,24 @@ def min_button_presses_joltage_mode(
     target = tuple(joltage_requirements)
     start = tuple([0] * len(joltage_requirements))
 
-    if start == target:
-        return 0
-
-    # Heuristic: sum of remaining increments needed
-    def heuristic(state):
-        return sum(max(0, target[i] - state[i]) for i in range(len(target)))
-
-    # Priority queue: (heuristic + presses, presses, state)
-    # We use heuristic + presses as the priority to guide A* search
-    queue = [(heuristic(start), 0, start)]
-    processed = set()  # Track states we've already popped (processed)
-
-    iterations = 0
-    while queue:
-        iterations += 1
-        if iterations % 1000 == 0:
-            logger.info(
-                f"  Iteration {iterations}: Queue size: {len(queue)}, processed: {len(processed)}"
-            )
-        _, presses, state = heapq.heappop(queue)
-
-        # Skip if we've already processed this state (can happen if added multiple times)
-        if state in processed:
-            continue
-        processed.add(state)
-
+    def presses(state):
         for button in buttons:
             # Pruning: skip if this button would increase any counter that's already at target
-            if any(state[i] >= joltage_requirements[i] for i in button):
+            if any(state[i] >= target[i] for i in button):
                 continue
-
-            # Create new state by applying button
             new_state = list(state)
             for i in button:
                 new_state[i] += 1
-            new_state = tuple(new_state)
-
-            if new_state == target:
-                return presses + 1
+            yield tuple(new_state), 1
 
-            # Pruning: skip if any counter exceeds its requirement
-            if any(
-                new_state[i] > joltage_requirements[i]
-                for i in range(len(joltage_requirements))
-            ):
-                continue
-
-            # Don't add if already processed (won't help since counters only increase)
-            if new_state not in processed:
-                h = heuristic(new_state)
-                heapq.heappush(queue, (h + presses + 1, presses + 1, new_state))
-                logger.debug(
-                    f"Added new state: {new_state} to queue with heuristic {h} and priority {h + presses + 1}"
-                )
+    # Heuristic: a push increases each counter by at most 1, so at least the
+    # largest remaining increment is still needed (never overestimates)
+    def heuristic(state):
+        return max(t - s for t, s in zip(target, state, strict=True))
 
-    return -1
+    found = search.dijkstra([start], presses, lambda s: s == target, heuristic)
+    logger.info(f"  search stats: {found.stats}")
+    return -1 if found.goal is None else found.cost
 
 
 def push_button_joltage_mode(joltage: list[int], button_wiring: tuple[int, ...]):
@@ -5,7 +5,7 @@ import logging
 import os
 import sys
 
-from aoc_utilities import Input, test_input, timer_func
+from aoc_utilities import Input, cached_parser, test_input, timer_func
 
 """
 Logger config
@@ -24,6 +24,7 @@ logger.addHandler(handler)
 DAY = os.path.basename(__file__)[3:5]
 
 
+@cached_parser
 def parser(data: str) -> tuple[list[set[tuple[int, int]]], dict]:
     """Parses the input data."""
     shapes = []